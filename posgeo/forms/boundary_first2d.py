@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import sympy as sp
+
+from posgeo.forms.residues2d import FacetChart, chart_affine_coefficients, interval_1form_value
+from posgeo.geometry.lines import as_fraction
+from posgeo.geometry.region2d import Region2D
+from posgeo.typing import Canonical2Form
+
+Monomial = Tuple[int, int]
+Point = Tuple[Fraction, Fraction]
+
+
+@dataclass
+class SparseRationalSystem:
+    """
+    Incremental exact elimination over Q with rows stored as {column: Fraction}.
+
+    Pivot rows are kept in reduced row-echelon form, so a new row is reduced in a
+    single pass over the pivot columns it touches. Rows reducing to 0 = 0 are
+    dropped; a row reducing to 0 = c (c != 0) marks the system inconsistent.
+    """
+
+    n_unknowns: int
+    pivots: Dict[int, Tuple[Dict[int, Fraction], Fraction]] = field(default_factory=dict)
+    redundant_rows: int = 0
+
+    @property
+    def is_determined(self) -> bool:
+        return len(self.pivots) == self.n_unknowns
+
+    def add_row(self, row: Dict[int, Fraction], rhs: Fraction) -> None:
+        row = {c: v for c, v in row.items() if v != 0}
+        for col in [c for c in row if c in self.pivots]:
+            factor = row.get(col)
+            if not factor:
+                continue
+            prow, prhs = self.pivots[col]
+            for c, v in prow.items():
+                nv = row.get(c, 0) - factor * v
+                if nv:
+                    row[c] = nv
+                else:
+                    row.pop(c, None)
+            rhs -= factor * prhs
+
+        if not row:
+            if rhs != 0:
+                raise ValueError(f"Boundary constraints are inconsistent: row reduced to 0 = {rhs}")
+            self.redundant_rows += 1
+            return
+
+        # Sparsest choice available locally: the pivot column with the smallest index.
+        col = min(row)
+        inv = 1 / row[col]
+        row = {c: v * inv for c, v in row.items()}
+        rhs *= inv
+        for other_col, (orow, orhs) in list(self.pivots.items()):
+            factor = orow.get(col)
+            if not factor:
+                continue
+            for c, v in row.items():
+                nv = orow.get(c, 0) - factor * v
+                if nv:
+                    orow[c] = nv
+                else:
+                    orow.pop(c, None)
+            self.pivots[other_col] = (orow, orhs - factor * rhs)
+        self.pivots[col] = (row, rhs)
+
+    def solution(self) -> List[Fraction]:
+        if not self.is_determined:
+            raise ValueError(
+                f"Boundary constraints are underdetermined: rank {len(self.pivots)} < {self.n_unknowns} unknowns"
+            )
+        return [self.pivots[c][1] for c in range(self.n_unknowns)]
+
+
+def _numerator_monomials(n_facets: int) -> List[Monomial]:
+    d = max(n_facets - 3, 0)
+    return [(i, total - i) for total in range(d + 1) for i in range(total, -1, -1)]
+
+
+def _chart_t_at(chart: FacetChart, point: Point) -> Fraction:
+    (x0, _, xt), (y0, _, yt) = chart_affine_coefficients(chart)
+    if xt != 0:
+        return (point[0] - x0) / xt
+    if yt != 0:
+        return (point[1] - y0) / yt
+    raise ValueError(f"Chart {chart.name} has a degenerate boundary parameter")
+
+
+def _facet_rows(
+    region: Region2D,
+    facet_name: str,
+    chart: FacetChart,
+    vertices: Sequence[Point],
+    monomials: Sequence[Monomial],
+    line_values,
+):
+    """
+    Residue constraints for one facet.
+
+    With f = N / prod_m L_m and an affine chart where L_k(P(u, t)) = kappa * u,
+      Res_{L_k} f = s * N(P(0, t)) / (kappa * prod_{m != k} L_m(P(0, t))).
+    Equating it with the expected interval form sigma * (1/(t-a) + 1/(b-t))
+    (sigma = -1 iff u points inside) gives one linear row in the coefficients of
+    N for each sample t. N restricted to the facet has degree <= F-3, so F-2
+    samples strictly inside the edge determine it.
+    """
+    (x0, xu, xt), (y0, yu, yt) = chart_affine_coefficients(chart)
+    line = region.facets[facet_name]
+    kappa = as_fraction(line.scale) * (line.form.a * xu + line.form.b * yu)
+    if kappa == 0:
+        raise ValueError(f"Chart {chart.name}: u is tangent to facet {facet_name}")
+    sigma = -1 if kappa > 0 else 1
+    s = int(chart.s)
+    if abs(xu * yt - xt * yu) != 1:
+        raise ValueError(f"Chart {chart.name} is not unimodular (Jacobian {xu * yt - xt * yu})")
+
+    v_start, v_end = region.incidence(vertices).edge(facet_name)
+    a, b = _chart_t_at(chart, v_start), _chart_t_at(chart, v_end)
+    n_samples = max(len(region.facets) - 2, 1)
+    degree = max(i + j for i, j in monomials)
+
+    for k in range(1, n_samples + 1):
+        t = a + (b - a) * Fraction(k, n_samples + 1)
+        px, py = x0 + xt * t, y0 + yt * t
+        others = Fraction(1)
+        for name, value in line_values(px, py):
+            if name != facet_name:
+                others *= value
+        rhs = interval_1form_value(t, (a, b), sigma) * kappa * others / s
+
+        xpow, ypow = [Fraction(1)], [Fraction(1)]
+        for _ in range(degree):
+            xpow.append(xpow[-1] * px)
+            ypow.append(ypow[-1] * py)
+        row = {col: xpow[i] * ypow[j] for col, (i, j) in enumerate(monomials)}
+        yield row, rhs
+
+
+def solve_boundary_numerator(
+    region: Region2D,
+    vertices: Sequence[Tuple[object, object]],
+    charts: Mapping[str, Sequence[FacetChart]],
+) -> Dict[Monomial, Fraction]:
+    """
+    Numerator N (as {(i, j): c_ij}) with f = N / prod_k L_k, L_k the region's facet
+    expressions, determined purely by the facet residue constraints.
+
+    Uses the first chart of each facet; charts must be affine and unimodular in
+    (u, t), as assumed by `residue_2form_on_facet`. Vertices
+    are in the cyclic order that fixes the orientation, as for the triangulation
+    engine. Raises ValueError if the constraints are inconsistent or rank-deficient.
+    """
+    verts: List[Point] = [(as_fraction(vx), as_fraction(vy)) for vx, vy in vertices]
+    names = list(region.facets)
+    monomials = _numerator_monomials(len(names))
+    forms = [(name, region.facets[name].form, as_fraction(region.facets[name].scale)) for name in names]
+
+    def line_values(px: Fraction, py: Fraction):
+        return ((name, scale * form(px, py)) for name, form, scale in forms)
+
+    system = SparseRationalSystem(len(monomials))
+    for name in names:
+        if name not in charts or not charts[name]:
+            raise KeyError(f"No chart for facet: {name}")
+        for row, rhs in _facet_rows(region, name, charts[name][0], verts, monomials, line_values):
+            system.add_row(row, rhs)
+
+    coeffs = system.solution()
+    return {m: c for m, c in zip(monomials, coeffs) if c != 0}
+
+
+def canonical_form_boundary_first(
+    region: Region2D,
+    vertices: Sequence[Tuple[object, object]],
+    charts: Mapping[str, Sequence[FacetChart]],
+) -> Canonical2Form:
+    """
+    Triangulation-free canonical form: numerator from `solve_boundary_numerator`
+    over the product of the region's facet expressions. No `sp.simplify` is used.
+    """
+    x, y = region.x, region.y
+    coeffs = solve_boundary_numerator(region, vertices, charts)
+    numerator = sp.Add(*(sp.Rational(c.numerator, c.denominator) * x ** i * y ** j for (i, j), c in coeffs.items()))
+    denominator = sp.Mul(*(line.expr for line in region.facets.values()))
+    return Canonical2Form(x=x, y=y, prefactor=numerator / denominator)
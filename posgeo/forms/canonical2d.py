@@ -6,7 +6,9 @@ from typing import List, Optional, Tuple
 import sympy as sp
 
 from posgeo.forms.simplex2d import Triangle2D
+from posgeo.geometry.lines import LinearForm
 from posgeo.geometry.fixtures2d import H1_HEXAGON_FIXTURE, M1_PENTAGON_FIXTURE, Q1_QUADRILATERAL_FIXTURE
+from posgeo.metrics import record_expression, stage
 from posgeo.typing import Canonical2Form
 from posgeo.validation.triangulation import validate_triangulation
 
@@ -18,6 +20,10 @@ class Triangulation2D:
     """
     triangles: Tuple[Triangle2D, ...]
 
+    def edge_forms(self) -> Tuple[LinearForm, ...]:
+        """Distinct sign-normalized lines of all triangle edges: facets and diagonals."""
+        return tuple(dict.fromkeys(e.form.canonical() for t in self.triangles for e in t.edges))
+
 
 def canonical_form_from_triangulation(
     tri: Triangulation2D,
@@ -28,8 +34,13 @@ def canonical_form_from_triangulation(
     validate_triangulation(tri, region=region, vertices=vertices)
     x = tri.triangles[0].x
     y = tri.triangles[0].y
-    f = sum((t.canonical_form().prefactor for t in tri.triangles), sp.Integer(0))
-    return Canonical2Form(x, y, sp.simplify(f))
+    with stage("triangulation-sum"):
+        f = sum((t.canonical_form().prefactor for t in tri.triangles), sp.Integer(0))
+        record_expression("triangulation-sum", f, variables=(x, y))
+    with stage("triangulation-simplify"):
+        f = sp.simplify(f)
+        record_expression("triangulation-simplify", f, variables=(x, y))
+    return Canonical2Form(x, y, f)
 
 
 def m1_pentagon_vertices() -> Tuple[Tuple[sp.Rational, sp.Rational], ...]:
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import sympy as sp
+from sympy.polys.polyfuncs import horner
+from sympy.printing.pycode import pycode
+
+from posgeo.memory import LRUCache, register_cache
+from posgeo.typing import Canonical1Form, Canonical2Form
+
+# Bump when the emitted module layout changes, so stale cache entries are not reused.
+CODEGEN_VERSION = 1
+
+# Imported evaluator modules by resolved path; the oldest are dropped past the bound.
+_LOADED: LRUCache[Path, ModuleType] = LRUCache(64)
+register_cache("codegen2d.loaded_evaluators", size=_LOADED.__len__, clear=_LOADED.clear, maxsize=_LOADED.maxsize)
+
+
+def _integer_parts(expr: sp.Expr, variables: Sequence[sp.Symbol]) -> Tuple[sp.Expr, int, List[Tuple[sp.Expr, int]]]:
+    """
+    (N, a, [(p_k, m_k)]) with expr = N / (a * prod p_k**m_k), N and the p_k having
+    integer coefficients and a a nonzero integer.
+    """
+    if not expr.is_rational_function(*variables):
+        raise ValueError(f"Expression is not a rational function of {tuple(variables)}: {expr}")
+    extra = expr.free_symbols - set(variables)
+    if extra:
+        raise ValueError(f"Expression has free symbols {sorted(map(str, extra))} besides {tuple(variables)}")
+    numerator, denominator = sp.fraction(sp.cancel(sp.together(expr)))
+    content, factors = sp.factor_list(denominator, *variables)
+    # factor_list returns primitive integer factors; move every rational constant to the numerator.
+    numer_poly = sp.Poly(numerator / content, *variables, domain=sp.QQ)
+    scale, numer_poly = numer_poly.clear_denoms()
+    scale = sp.Rational(scale)
+    return numer_poly.as_expr(), int(scale), [(p, int(m)) for p, m in factors]
+
+
+def _emit_parts(
+    function_name: str,
+    expr: sp.Expr,
+    variables: Sequence[sp.Symbol],
+    arg_names: Sequence[str],
+) -> str:
+    """Source of `function_name(*args) -> (numerator, denominator)` with CSE over both."""
+    numerator, scale, factors = _integer_parts(expr, variables)
+    generic = [sp.Symbol(name) for name in arg_names]
+    rename = dict(zip(variables, generic))
+    numerator = numerator.xreplace(rename)
+    factor_exprs = [p.xreplace(rename) for p, _ in factors]
+    if numerator.free_symbols:
+        numerator = horner(sp.Poly(numerator, *generic))
+    replacements, reduced = sp.cse([numerator, *factor_exprs], symbols=sp.numbered_symbols("_c"), order="none")
+
+    lines = [f"def {function_name}({', '.join(arg_names)}):"]
+    for symbol, value in replacements:
+        lines.append(f"    {symbol} = {pycode(value)}")
+    lines.append(f"    numerator = {pycode(reduced[0])}")
+    for k, factor in enumerate(reduced[1:]):
+        lines.append(f"    l{k} = {pycode(factor)}")
+    denominator = [str(scale)] if scale != 1 or not factors else []
+    denominator += [f"l{k}" if m == 1 else f"l{k}**{m}" for k, (_, m) in enumerate(factors)]
+    lines.append(f"    return numerator, {' * '.join(denominator)}")
+    return "\n".join(lines)
+
+
+def form_fingerprint(form: Canonical2Form, residues: Optional[Mapping[str, Canonical1Form]] = None) -> str:
+    """
+    SHA-256 of the prefactor and residue prefactors with their variables renamed
+    to fixed symbols (so the fingerprint does not depend on symbol names or
+    assumptions), plus `CODEGEN_VERSION`.
+    """
+    x, y, t = sp.symbols("x y t")
+    parts = [f"posgeo-codegen-{CODEGEN_VERSION}", sp.srepr(form.prefactor.xreplace({form.x: x, form.y: y}))]
+    for name in sorted(residues or {}):
+        residue = residues[name]
+        parts.append(f"{name}={sp.srepr(residue.prefactor.xreplace({residue.t: t}))}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+_MODULE_TAIL = '''
+
+def _check_pole(denominator, what):
+    if denominator == 0:
+        raise ValueError(f"{what} lies on a pole of the form")
+
+
+def _as_array(value, shape):
+    import numpy as np
+
+    return np.broadcast_to(np.asarray(value, dtype=float), shape).copy()
+
+
+def prefactor(x, y):
+    """Exact prefactor value at a rational point (int, Fraction or anything `Fraction()` accepts)."""
+    x, y = Fraction(x), Fraction(y)
+    numerator, denominator = _prefactor_parts(x, y)
+    _check_pole(denominator, f"Point {(x, y)}")
+    return Fraction(numerator) / denominator
+
+
+def prefactor_array(xs, ys):
+    """Vectorized float prefactor at NumPy arrays (broadcasting); poles give +-inf/nan."""
+    import numpy as np
+
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        numerator, denominator = _prefactor_parts(xs, ys)
+        return _as_array(numerator / denominator, np.broadcast(xs, ys).shape)
+
+
+def _residue_parts(name):
+    try:
+        return _RESIDUE_PARTS[name]
+    except KeyError:
+        raise KeyError(f"Unknown facet: {name}") from None
+
+
+def residue(name, t):
+    """Exact value of the residue prefactor `name` at rational `t`."""
+    t = Fraction(t)
+    numerator, denominator = _residue_parts(name)(t)
+    _check_pole(denominator, f"Parameter t={t}")
+    return Fraction(numerator) / denominator
+
+
+def residue_array(name, ts):
+    """Vectorized float residue prefactor `name` at a NumPy array of parameters."""
+    import numpy as np
+
+    parts = _residue_parts(name)
+    ts = np.asarray(ts, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        numerator, denominator = parts(ts)
+        return _as_array(numerator / denominator, ts.shape)
+'''
+
+
+def generate_evaluator_source(
+    form: Canonical2Form,
+    residues: Optional[Mapping[str, Canonical1Form]] = None,
+) -> str:
+    """
+    Source of a standalone evaluator module for `form` and its facet residues.
+
+    Each expression is emitted as integer-coefficient numerator / denominator,
+    where the denominator is an integer times the product of its irreducible
+    factors (for a canonical form, the facet lines) computed once per call; the
+    numerator is in Horner form and common subexpressions of numerator and
+    factors are shared. With integer constants only, the same code runs on
+    `Fraction`s (exact) and on NumPy float arrays (vectorized). The module
+    imports only `fractions` (and NumPy lazily in the array entry points) and
+    exposes `prefactor`, `prefactor_array`, `residue`, `residue_array`,
+    `FINGERPRINT` and `RESIDUE_NAMES`.
+    """
+    residues = dict(residues or {})
+    fingerprint = form_fingerprint(form, residues)
+    names = tuple(sorted(residues))
+    blocks = [
+        f'"""Generated by posgeo.forms.codegen2d (version {CODEGEN_VERSION}); do not edit."""\n\n'
+        "from fractions import Fraction\n\n"
+        f"FINGERPRINT = {fingerprint!r}\nRESIDUE_NAMES = {names!r}",
+        _emit_parts("_prefactor_parts", form.prefactor, (form.x, form.y), ("x", "y")),
+    ]
+    for k, name in enumerate(names):
+        blocks.append(_emit_parts(f"_residue_parts_{k}", residues[name].prefactor, (residues[name].t,), ("t",)))
+    table = "".join(f"\n    {name!r}: _residue_parts_{k}," for k, name in enumerate(names))
+    blocks.append(f"_RESIDUE_PARTS = {{{table}\n}}" if names else "_RESIDUE_PARTS = {}")
+    return "\n\n\n".join(blocks) + "\n" + _MODULE_TAIL
+
+
+def load_evaluator_module(path: os.PathLike) -> ModuleType:
+    """Import a generated evaluator module from its file (memoized per resolved path, LRU-bounded)."""
+    path = Path(path).resolve()
+
+    def load() -> ModuleType:
+        spec = importlib.util.spec_from_file_location(f"posgeo_generated_{path.stem}", path)
+        if spec is None or spec.loader is None:
+            raise ValueError(f"Cannot import evaluator module from {path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return _LOADED.get_or_build(path, load)
+
+
+def compile_evaluator(
+    form: Canonical2Form,
+    residues: Optional[Mapping[str, Canonical1Form]] = None,
+    *,
+    cache_dir: os.PathLike,
+) -> ModuleType:
+    """
+    Generated evaluator module for `form`, cached as `cache_dir/form_<fingerprint>.py`.
+
+    The module is written (atomically) only if no file for the fingerprint
+    exists yet; services that only evaluate can import that file directly
+    (e.g. with `load_evaluator_module` or plain `importlib`) without SymPy.
+    """
+    residues = dict(residues or {})
+    directory = Path(cache_dir)
+    path = directory / f"form_{form_fingerprint(form, residues)}.py"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        source = generate_evaluator_source(form, residues)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".form_", suffix=".py.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(source)
+        os.replace(tmp, path)
+    return load_evaluator_module(path)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Sequence, Tuple
+
+from posgeo.geometry.lines import LinearForm, as_fraction
+
+
+class DualPolygonEvaluator:
+    """
+    Canonical prefactor of a convex polygon evaluated from its vertex list alone.
+
+    With integer edge lines l_i through (v_i, v_{i+1}) in the given cyclic order,
+      f(p) = sum_i det(∇l_i, ∇l_{i+1}) / (l_i(p) l_{i+1}(p)),
+    which is twice the signed area of the dual polygon with vertices ∇l_i / l_i(p).
+    Each term is invariant under rescaling either line (by any nonzero factor), so
+    the overall sign follows the vertex order exactly as in
+    `canonical_form_from_triangulation`. No triangulation and no SymPy is involved:
+    evaluation costs O(n) per point.
+    """
+
+    def __init__(self, vertices: Sequence[Tuple[object, object]]) -> None:
+        if len(vertices) < 3:
+            raise ValueError(f"Need >=3 vertices, got {len(vertices)}")
+        n = len(vertices)
+        self.vertices: Tuple[Tuple[Fraction, Fraction], ...] = tuple(
+            (as_fraction(vx), as_fraction(vy)) for vx, vy in vertices
+        )
+        self.edges: Tuple[LinearForm, ...] = tuple(
+            LinearForm.through_points(self.vertices[i], self.vertices[(i + 1) % n])
+            for i in range(n)
+        )
+        self.corner_dets: Tuple[int, ...] = tuple(
+            self.edges[i].det(self.edges[(i + 1) % n]) for i in range(n)
+        )
+
+    def __call__(self, xv, yv) -> Fraction:
+        """Exact prefactor value at a rational point (int, Fraction or SymPy Rational)."""
+        px, py = as_fraction(xv), as_fraction(yv)
+        values = [edge(px, py) for edge in self.edges]
+        if any(v == 0 for v in values):
+            raise ValueError(f"Point {(xv, yv)} lies on an edge line; the prefactor has a pole there.")
+        n = len(values)
+        return sum(
+            (Fraction(d) / (values[i] * values[(i + 1) % n]) for i, d in enumerate(self.corner_dets)),
+            Fraction(0),
+        )
+
+    def evaluate_array(self, xs, ys):
+        """
+        Vectorized float evaluation at NumPy arrays of points (broadcasting `xs`, `ys`).
+
+        Points on an edge line produce ±inf/nan following IEEE semantics.
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        values = [edge.a * xs + edge.b * ys + edge.c for edge in self.edges]
+        n = len(values)
+        out = np.zeros(np.broadcast(xs, ys).shape, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i, d in enumerate(self.corner_dets):
+                out += d / (values[i] * values[(i + 1) % n])
+        return out
+
+
+def dual_canonical_prefactor(vertices: Sequence[Tuple[object, object]], xv, yv) -> Fraction:
+    """One-shot exact evaluation of the polygon canonical prefactor at `(xv, yv)`."""
+    return DualPolygonEvaluator(vertices)(xv, yv)
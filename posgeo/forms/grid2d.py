@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, List, Optional, Tuple
+
+from posgeo.forms.codegen2d import compile_evaluator, form_fingerprint, load_evaluator_module
+from posgeo.geometry.region2d import Region2D, facet_matrix_contains
+from posgeo.typing import Canonical2Form
+
+GRID_VERSION = 1
+_META = "grid.json"
+_LAYERS = (("prefactor", "float64"), ("inside", "bool"), ("nearest_facet", "int16"))
+
+
+@dataclass(frozen=True)
+class GridSpec:
+    """
+    Layout of an evaluation grid: `shape = (ny, nx)` points spanning the closed box
+    [xmin, xmax] x [ymin, ymax], rows indexed by y, in square tiles of `tile` points.
+    Everything needed to fill tiles is stored here, so a grid can be resumed from
+    its directory alone.
+    """
+
+    bbox: Tuple[float, float, float, float]
+    shape: Tuple[int, int]
+    tile: int
+    facet_names: Tuple[str, ...]
+    facet_matrix: Tuple[Tuple[float, float, float, float], ...]
+    fingerprint: str
+    evaluator: str
+    eps: float
+
+    @property
+    def tile_counts(self) -> Tuple[int, int]:
+        ny, nx = self.shape
+        return (-(-ny // self.tile), -(-nx // self.tile))
+
+    def tile_slices(self, tile_row: int, tile_col: int) -> Tuple[slice, slice]:
+        ny, nx = self.shape
+        t = self.tile
+        return slice(tile_row * t, min((tile_row + 1) * t, ny)), slice(tile_col * t, min((tile_col + 1) * t, nx))
+
+    def coordinates(self, rows: slice, cols: slice):
+        """(ys[:, None], xs[None, :]) for a block; the same floats regardless of tiling."""
+        import numpy as np
+
+        xmin, xmax, ymin, ymax = self.bbox
+        ny, nx = self.shape
+        xs = xmin + np.arange(cols.start, cols.stop, dtype=float) * ((xmax - xmin) / max(nx - 1, 1))
+        ys = ymin + np.arange(rows.start, rows.stop, dtype=float) * ((ymax - ymin) / max(ny - 1, 1))
+        return ys[:, None], xs[None, :]
+
+
+def _nearest_facet(facet_matrix, xs, ys):
+    """Index of the facet line at least Euclidean distance (first one on ties)."""
+    import numpy as np
+
+    distances = np.stack(
+        [np.abs(a * xs + b * ys + c) / math.hypot(a, b) for a, b, c, _ in facet_matrix]
+    )
+    return np.argmin(distances, axis=0)
+
+
+class EvaluationGrid:
+    """
+    Prefactor, strict-interior mask and nearest-facet id on a dense grid over a
+    region's bounding box, stored as `.npy` files that are memory-mapped rather
+    than loaded.
+
+    Tiles are computed with the `codegen2d` evaluator (kept in the grid
+    directory) and the region's `facet_matrix`, flushed, and only then marked in
+    `tiles_done.npy`, so an interrupted `fill` resumes at the first missing
+    tile. Reading a block touches only the pages it covers.
+    """
+
+    def __init__(self, directory: Path, spec: GridSpec, *, writable: bool) -> None:
+        import numpy as np
+
+        self.directory = directory
+        self.spec = spec
+        self.writable = writable
+        mode = "r+" if writable else "r"
+        self.prefactor = np.load(directory / "prefactor.npy", mmap_mode=mode)
+        self.inside = np.load(directory / "inside.npy", mmap_mode=mode)
+        self.nearest_facet = np.load(directory / "nearest_facet.npy", mmap_mode=mode)
+        self.tiles_done = np.load(directory / "tiles_done.npy", mmap_mode=mode)
+        self._module: Optional[ModuleType] = None
+
+    @classmethod
+    def create(
+        cls,
+        directory: os.PathLike,
+        form: Canonical2Form,
+        region: Region2D,
+        shape: Tuple[int, int],
+        *,
+        tile: int = 256,
+        eps: float = 1e-12,
+    ) -> "EvaluationGrid":
+        """Allocate an empty grid for `form` over the bounding box of `region`'s polygon."""
+        import numpy as np
+
+        ny, nx = shape
+        if ny < 1 or nx < 1 or tile < 1:
+            raise ValueError(f"Grid shape and tile must be positive, got shape={shape}, tile={tile}")
+        locator = region.point_locator
+        if locator is None:
+            raise ValueError("Evaluation grids need a bounded region with irredundant linear facets")
+        directory = Path(directory)
+        if (directory / _META).exists():
+            raise ValueError(f"Grid already exists in {directory}")
+        directory.mkdir(parents=True, exist_ok=True)
+
+        module = compile_evaluator(form, cache_dir=directory)
+        xs = [vx for vx, _ in locator.vertices]
+        ys = [vy for _, vy in locator.vertices]
+        spec = GridSpec(
+            bbox=(float(min(xs)), float(max(xs)), float(min(ys)), float(max(ys))),
+            shape=(ny, nx),
+            tile=tile,
+            facet_names=tuple(region.facets),
+            facet_matrix=region.facet_matrix,
+            fingerprint=form_fingerprint(form),
+            evaluator=Path(module.__file__).name,
+            eps=eps,
+        )
+        for name, dtype in _LAYERS:
+            np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", dtype=dtype, shape=spec.shape).flush()
+        np.lib.format.open_memmap(directory / "tiles_done.npy", mode="w+", dtype=bool, shape=spec.tile_counts).flush()
+        (directory / _META).write_text(json.dumps({"version": GRID_VERSION, **asdict(spec)}, indent=2))
+        return cls(directory, spec, writable=True)
+
+    @classmethod
+    def open(cls, directory: os.PathLike, *, writable: bool = False) -> "EvaluationGrid":
+        directory = Path(directory)
+        meta = json.loads((directory / _META).read_text())
+        if meta.pop("version") != GRID_VERSION:
+            raise ValueError(f"Unsupported grid version in {directory}")
+        spec = GridSpec(
+            bbox=tuple(meta["bbox"]),
+            shape=tuple(meta["shape"]),
+            tile=meta["tile"],
+            facet_names=tuple(meta["facet_names"]),
+            facet_matrix=tuple(tuple(row) for row in meta["facet_matrix"]),
+            fingerprint=meta["fingerprint"],
+            evaluator=meta["evaluator"],
+            eps=meta["eps"],
+        )
+        return cls(directory, spec, writable=writable)
+
+    def missing_tiles(self) -> List[Tuple[int, int]]:
+        """Tiles not computed yet, in row-major order."""
+        rows, cols = self.spec.tile_counts
+        return [(r, c) for r in range(rows) for c in range(cols) if not self.tiles_done[r, c]]
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing_tiles()
+
+    def fill(self, tiles: Optional[Iterable[Tuple[int, int]]] = None, *, max_tiles: Optional[int] = None) -> int:
+        """Compute the given (default: all missing) tiles, at most `max_tiles`; returns the count."""
+        if not self.writable:
+            raise ValueError("Grid was opened read-only")
+        if self._module is None:
+            self._module = load_evaluator_module(self.directory / self.spec.evaluator)
+        todo = list(self.missing_tiles() if tiles is None else tiles)
+        if max_tiles is not None:
+            todo = todo[:max_tiles]
+        for tile_row, tile_col in todo:
+            rows, cols = self.spec.tile_slices(tile_row, tile_col)
+            ys, xs = self.spec.coordinates(rows, cols)
+            self.prefactor[rows, cols] = self._module.prefactor_array(xs, ys)
+            self.inside[rows, cols] = facet_matrix_contains(self.spec.facet_matrix, xs, ys, self.spec.eps)
+            self.nearest_facet[rows, cols] = _nearest_facet(self.spec.facet_matrix, xs, ys)
+            for layer in (self.prefactor, self.inside, self.nearest_facet):
+                layer.flush()
+            self.tiles_done[tile_row, tile_col] = True
+            self.tiles_done.flush()
+        return len(todo)
+
+    def coordinates(self, rows: slice = slice(None), cols: slice = slice(None)):
+        """Grid coordinates (ys[:, None], xs[None, :]) of a block, computed on demand."""
+        ny, nx = self.spec.shape
+        return self.spec.coordinates(slice(*rows.indices(ny)[:2]), slice(*cols.indices(nx)[:2]))
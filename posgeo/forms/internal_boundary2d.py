@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+import sympy as sp
+
+from posgeo.forms.residues2d import FacetChart
+from posgeo.geometry.internal_boundary_fixture import RegionWithInternalBoundaryFixture
+from posgeo.geometry.lines import LinearForm, OrientedLine2D, as_fraction
+from posgeo.geometry.region2d import Region2D
+from posgeo.typing import Canonical2Form
+
+if TYPE_CHECKING:
+    from posgeo.validation.singularity_gate import SingularityReport
+
+Point = Tuple[Fraction, Fraction]
+Triangle = Tuple[Point, Point, Point]
+LineKey = Tuple[LinearForm, ...]
+
+
+def _signed_area2(loop: Sequence[Point]) -> Fraction:
+    n = len(loop)
+    return sum((loop[i][0] * loop[(i + 1) % n][1] - loop[(i + 1) % n][0] * loop[i][1] for i in range(n)), Fraction(0))
+
+
+def _y_at(edge: Tuple[Point, Point], xv: Fraction) -> Fraction:
+    (px, py), (qx, qy) = edge
+    return py + (qy - py) * (xv - px) / (qx - px)
+
+
+def triangulate_with_holes(
+    outer_ccw: Sequence[Tuple[object, object]],
+    holes_cw: Sequence[Sequence[Tuple[object, object]]],
+) -> List[Triangle]:
+    """
+    Exact triangulation of a polygon with polygonal holes, all triangles CCW.
+
+    Vertical lines through every vertex cut the region into slabs; inside a slab
+    the boundary edges do not cross, so consecutive pairs (bottom to top) bound
+    trapezoids of the region, each split into two triangles. The extra vertices
+    lie on boundary edges, and the vertical cuts and diagonals are spurious lines
+    that cancel in the summed form.
+    """
+    loops: List[List[Point]] = [[(as_fraction(vx), as_fraction(vy)) for vx, vy in outer_ccw]]
+    loops += [[(as_fraction(vx), as_fraction(vy)) for vx, vy in hole] for hole in holes_cw]
+    if _signed_area2(loops[0]) <= 0:
+        raise ValueError("Outer boundary must be counter-clockwise")
+    for k, hole in enumerate(loops[1:]):
+        if _signed_area2(hole) >= 0:
+            raise ValueError(f"Hole {k} boundary must be clockwise")
+
+    edges = [(loop[i], loop[(i + 1) % len(loop)]) for loop in loops for i in range(len(loop))]
+    xs = sorted({p[0] for loop in loops for p in loop})
+    triangles: List[Triangle] = []
+    for xa, xb in zip(xs, xs[1:]):
+        xm = (xa + xb) / 2
+        crossing = sorted(
+            (e for e in edges if min(e[0][0], e[1][0]) <= xa and max(e[0][0], e[1][0]) >= xb),
+            key=lambda e: _y_at(e, xm),
+        )
+        if len(crossing) % 2:
+            raise ValueError(f"Boundary loops do not close up over the slab x in [{xa}, {xb}]")
+        for bottom, top in zip(crossing[::2], crossing[1::2]):
+            b_a, b_b = (xa, _y_at(bottom, xa)), (xb, _y_at(bottom, xb))
+            t_a, t_b = (xa, _y_at(top, xa)), (xb, _y_at(top, xb))
+            for tri in ((b_a, b_b, t_b), (b_a, t_b, t_a)):
+                if _signed_area2(tri) > 0:
+                    triangles.append(tri)
+    return triangles
+
+
+def _triangle_term(tri: Triangle) -> Tuple[Fraction, Tuple[LinearForm, LinearForm, LinearForm]]:
+    """
+    (K, lines) with f_T = K / (l_1 l_2 l_3) for a CCW triangle, l_i inward primitive
+    edge forms. The vertex residue fixes K = |det(grad l_1, grad l_2)| * l_3(v_12).
+    """
+    p, q, r = tri
+    l1, l2, l3 = LinearForm.through_points(p, q), LinearForm.through_points(q, r), LinearForm.through_points(r, p)
+    # l1 and l2 meet at q.
+    return abs(l1.det(l2)) * l3(*q), (l1, l2, l3)
+
+
+@dataclass
+class CancellingFormAccumulator:
+    """
+    Exact sum of terms N(x, y) / prod_k l_k with squarefree products of primitive lines.
+
+    Terms are keyed by their (sign-normalized) line set, so equal denominators
+    merge on insertion and cancelled terms disappear; `refcount` tracks how many
+    terms each line appears in. A line that is not a pole of the sum is removed by
+    bringing the terms containing it to a common denominator and dividing the
+    numerator by it exactly (a nonzero remainder means it was a pole after all).
+    Lines are eliminated in order of increasing reference count, which keeps the
+    merged denominators small.
+    """
+
+    x: sp.Symbol
+    y: sp.Symbol
+    terms: Dict[LineKey, sp.Poly] = field(default_factory=dict)
+    refcount: Dict[LinearForm, int] = field(default_factory=dict)
+    _line_polys: Dict[LinearForm, sp.Poly] = field(default_factory=dict, repr=False)
+
+    def _poly(self, value) -> sp.Poly:
+        return sp.Poly(value, self.x, self.y, domain=sp.QQ)
+
+    def line_poly(self, line: LinearForm) -> sp.Poly:
+        if line not in self._line_polys:
+            self._line_polys[line] = self._poly(line.as_expr(self.x, self.y))
+        return self._line_polys[line]
+
+    def add(self, numerator, lines: Iterable[LinearForm]) -> None:
+        sign = 1
+        canonical: List[LinearForm] = []
+        for line in lines:
+            c = line.canonical()
+            if c is not line:
+                sign = -sign
+            canonical.append(c)
+        key = tuple(sorted(canonical, key=lambda f: f.coefficients))
+        if len(set(key)) != len(key):
+            raise ValueError(f"Repeated line in term denominator: {key}")
+        if not isinstance(numerator, sp.Poly):
+            value = as_fraction(numerator)
+            numerator = self._poly(sp.Rational(value.numerator, value.denominator))
+        numerator = numerator * sign
+        if key in self.terms:
+            merged = self.terms[key] + numerator
+            if merged.is_zero:
+                self._drop(key)
+            else:
+                self.terms[key] = merged
+            return
+        if numerator.is_zero:
+            return
+        self.terms[key] = numerator
+        for line in key:
+            self.refcount[line] = self.refcount.get(line, 0) + 1
+
+    def _drop(self, key: LineKey) -> None:
+        del self.terms[key]
+        for line in key:
+            self.refcount[line] -= 1
+            if self.refcount[line] == 0:
+                del self.refcount[line]
+
+    def eliminate(self, line: LinearForm) -> None:
+        line = line.canonical()
+        keys = [key for key in self.terms if line in key]
+        if not keys:
+            return
+        union = sorted({other for key in keys for other in key}, key=lambda f: f.coefficients)
+        numerator = self._poly(0)
+        for key in keys:
+            term = self.terms[key]
+            for other in union:
+                if other not in key:
+                    term = term * self.line_poly(other)
+            numerator = numerator + term
+        quotient, remainder = numerator.div(self.line_poly(line))
+        if not remainder.is_zero:
+            raise ValueError(f"Line {line} is a pole of the accumulated form")
+        for key in keys:
+            self._drop(key)
+        self.add(quotient, [other for other in union if other != line])
+
+    def eliminate_all_except(self, keep: Set[LinearForm]) -> None:
+        keep = {line.canonical() for line in keep}
+        while True:
+            spurious = [line for line in self.refcount if line not in keep]
+            if not spurious:
+                return
+            self.eliminate(min(spurious, key=lambda line: (self.refcount[line], line.coefficients)))
+
+    def as_form(self) -> Canonical2Form:
+        """The sum as one fraction over the product of the remaining lines (no simplification)."""
+        lines = sorted(self.refcount, key=lambda f: f.coefficients)
+        numerator = self._poly(0)
+        for key, term in self.terms.items():
+            for line in lines:
+                if line not in key:
+                    term = term * self.line_poly(line)
+            numerator = numerator + term
+        denominator = sp.Mul(*(line.as_expr(self.x, self.y) for line in lines))
+        return Canonical2Form(x=self.x, y=self.y, prefactor=numerator.as_expr() / denominator)
+
+
+def canonical_form_with_holes(
+    outer_ccw: Sequence[Tuple[object, object]],
+    holes_cw: Sequence[Sequence[Tuple[object, object]]],
+    x: sp.Symbol,
+    y: sp.Symbol,
+) -> Canonical2Form:
+    """
+    Canonical 2-form of a polygon with polygonal holes: the sum of the triangle
+    forms of `triangulate_with_holes`, with every spurious line cancelled exactly.
+
+    The denominator is the product of the (sign-normalized) boundary lines of the
+    outer and hole loops; no `sp.simplify` is used.
+    """
+    boundary: Set[LinearForm] = set()
+    for loop in [list(outer_ccw), *map(list, holes_cw)]:
+        for i in range(len(loop)):
+            boundary.add(LinearForm.through_points(loop[i], loop[(i + 1) % len(loop)]).canonical())
+
+    acc = CancellingFormAccumulator(x, y)
+    for tri in triangulate_with_holes(outer_ccw, holes_cw):
+        numerator, lines = _triangle_term(tri)
+        acc.add(numerator, lines)
+    acc.eliminate_all_except(boundary)
+    return acc.as_form()
+
+
+def unimodular_facet_chart(name: str, line: OrientedLine2D) -> FacetChart:
+    """
+    Affine chart (x, y) = P(u, t) with form(P(u, t)) = u for the facet's primitive
+    form (a, b, c): P = -c (alpha, beta) + t (-b, a) + u (alpha, beta), where
+    alpha * a + beta * b = 1 (Bezout coefficients divided by g = gcd(a, b)). The
+    Jacobian is alpha * a + beta * b = 1 also when g > 1 (the t-direction is then
+    g times the primitive direction (-b, a) / g), and u increases into the region.
+    """
+    form = line.form
+    alpha, beta, g = sp.gcdex(form.a, form.b)
+    alpha, beta = alpha / g, beta / g
+    u, t = sp.symbols(f"u__{name} t__{name}", real=True)
+    return FacetChart(
+        name=f"{name}__auto",
+        u=u,
+        t=t,
+        x_of=-form.c * alpha - form.b * t + alpha * u,
+        y_of=-form.c * beta + form.a * t + beta * u,
+        s=sp.Integer(1),
+    )
+
+
+@dataclass(frozen=True)
+class InternalBoundaryFormResult:
+    """Canonical form of a region with an internal boundary, and its gate report over both boundary sets."""
+
+    form: Canonical2Form
+    region: Region2D
+    charts: Mapping[str, Tuple[FacetChart, ...]]
+    report: "SingularityReport"
+
+
+def canonical_form_for_internal_boundary(fixture: RegionWithInternalBoundaryFixture) -> InternalBoundaryFormResult:
+    """
+    Canonical form of the fixture's annular region, gated against the union of its
+    outer and inner facets with one `unimodular_facet_chart` per facet.
+    """
+    from posgeo.validation.singularity_gate import GateContext
+
+    x, y = fixture.x, fixture.y
+    form = canonical_form_with_holes(fixture.outer_vertices_ccw, [fixture.inner_vertices_cw], x, y)
+    facets = {**fixture.outer_facets, **fixture.inner_facets}
+    region = Region2D(x=x, y=y, facets=MappingProxyType(facets))
+    charts = MappingProxyType({name: (unimodular_facet_chart(name, line),) for name, line in facets.items()})
+    report = GateContext(region, charts).check(form)
+    return InternalBoundaryFormResult(form=form, region=region, charts=charts, report=report)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import sympy as sp
+
+from posgeo.forms.dual2d import DualPolygonEvaluator
+from posgeo.typing import Canonical2Form
+
+Monomial = Tuple[int, int]
+
+# Primes just below 2**31; further primes are generated on demand with `sp.prevprime`.
+_FIRST_PRIME = 2147483647
+
+
+def _primes() -> Iterator[int]:
+    p = _FIRST_PRIME
+    while True:
+        yield p
+        p = int(sp.prevprime(p))
+
+
+def numerator_degree_bound(n_edges: int) -> int:
+    """Total-degree bound n-3 for the numerator over the product of the n edge lines."""
+    return max(n_edges - 3, 0)
+
+
+def _numerator_mod(evaluator: DualPolygonEvaluator, xv: int, yv: int, p: int) -> int:
+    """
+    (f * D)(xv, yv) mod p with D = prod_i l_i, computed division-free:
+      f * D = sum_i det_i * prod_{m not in {i, i+1}} l_m.
+    Prefix/suffix products of the (cyclic) line values keep this O(n).
+    """
+    values = [(e.a * xv + e.b * yv + e.c) % p for e in evaluator.edges]
+    n = len(values)
+    prefix = [1] * (n + 1)
+    for i, v in enumerate(values):
+        prefix[i + 1] = prefix[i] * v % p
+    suffix = [1] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] * values[i] % p
+    total = 0
+    for i, d in enumerate(evaluator.corner_dets[: n - 1]):
+        total = (total + d * prefix[i] % p * suffix[i + 2]) % p
+    # The wrap-around pair (l_{n-1}, l_0) leaves l_1 .. l_{n-2}.
+    wrap = 1
+    for v in values[1 : n - 1]:
+        wrap = wrap * v % p
+    return (total + evaluator.corner_dets[n - 1] * wrap) % p
+
+
+def _stirling_first_signed(d: int, p: int) -> List[List[int]]:
+    """s[i][k] mod p with x(x-1)...(x-i+1) = sum_k s[i][k] x^k."""
+    s = [[0] * (d + 1) for _ in range(d + 1)]
+    s[0][0] = 1
+    for i in range(1, d + 1):
+        for k in range(1, i + 1):
+            s[i][k] = (s[i - 1][k - 1] - (i - 1) * s[i - 1][k]) % p
+    return s
+
+
+def _interpolate_mod(values: Dict[Monomial, int], d: int, p: int) -> Dict[Monomial, int]:
+    """
+    Monomial coefficients (mod p) of the polynomial of total degree <= d taking `values`
+    on the principal lattice {(i, j) : i + j <= d}.
+
+    Newton form on the lattice: c_ij = (Δ_x^i Δ_y^j N)(0, 0) / (i! j!); falling
+    factorials are then expanded with Stirling numbers of the first kind.
+    """
+    # Δ_y^j N(a, 0) for a + j <= d.
+    dy: Dict[Monomial, int] = {}
+    for a in range(d + 1):
+        row = [values[(a, b)] for b in range(d - a + 1)]
+        for j in range(d - a + 1):
+            dy[(a, j)] = row[0]
+            row = [(row[k + 1] - row[k]) % p for k in range(len(row) - 1)]
+
+    fact_inv = [1] * (d + 1)
+    f = 1
+    for k in range(1, d + 1):
+        f = f * k % p
+        fact_inv[k] = pow(f, -1, p)
+
+    newton: Dict[Monomial, int] = {}
+    for j in range(d + 1):
+        col = [dy[(a, j)] for a in range(d - j + 1)]
+        for i in range(d - j + 1):
+            newton[(i, j)] = col[0] * fact_inv[i] * fact_inv[j] % p
+            col = [(col[k + 1] - col[k]) % p for k in range(len(col) - 1)]
+
+    s = _stirling_first_signed(d, p)
+    # Separable change of basis: first in x, then in y.
+    partial: Dict[Monomial, int] = {}
+    for j in range(d + 1):
+        for k in range(d - j + 1):
+            partial[(k, j)] = sum(newton[(i, j)] * s[i][k] for i in range(k, d - j + 1)) % p
+    coeffs: Dict[Monomial, int] = {}
+    for k in range(d + 1):
+        for l in range(d - k + 1):
+            coeffs[(k, l)] = sum(partial[(k, j)] * s[j][l] for j in range(l, d - k + 1)) % p
+    return coeffs
+
+
+def rational_reconstruction(residue: int, modulus: int) -> Optional[Fraction]:
+    """
+    Wang's rational reconstruction: the unique n/d == residue (mod modulus) with
+    |n|, d <= sqrt(modulus / 2), or None if no such fraction exists.
+    """
+    bound = math.isqrt(modulus // 2)
+    r0, r1 = modulus, residue % modulus
+    t0, t1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 == 0 or abs(t1) > bound:
+        return None
+    value = Fraction(r1, t1)
+    if (value.numerator - residue * value.denominator) % modulus != 0:
+        return None
+    return value
+
+
+def _crt_pair(r1: int, m1: int, r2: int, m2: int) -> int:
+    return (r1 + m1 * ((r2 - r1) * pow(m1, -1, m2) % m2)) % (m1 * m2)
+
+
+def _coefficient_bound(evaluator: DualPolygonEvaluator) -> int:
+    """
+    Bound on |c_ij| of the integer numerator sum_i det_i prod_{m not in {i,i+1}} l_m:
+    the 1-norm of a product is at most the product of the 1-norms.
+    """
+    norms = [abs(e.a) + abs(e.b) + abs(e.c) for e in evaluator.edges]
+    total = 1
+    for v in norms:
+        total *= v
+    return sum(abs(d) for d in evaluator.corner_dets) * total
+
+
+def _primes_needed(bound: int) -> int:
+    """Primes (> 2**30 each) needed for rational reconstruction of integers up to `bound`, plus one to confirm."""
+    bits = 2 * bound.bit_length() + 2
+    return -(-bits // 30) + 2
+
+
+def reconstruct_numerator_coefficients(
+    vertices: Sequence[Tuple[object, object]],
+    *,
+    max_primes: Optional[int] = None,
+) -> Tuple[DualPolygonEvaluator, Dict[Monomial, Fraction]]:
+    """
+    Exact numerator coefficients {(i, j): c_ij} of f * prod_i l_i for the polygon.
+
+    Samples are taken modulo successive word-size primes, combined by CRT and
+    lifted with rational reconstruction. The loop stops once the lifted
+    coefficients are unchanged by an additional prime and agree with the exact
+    dual-polygon evaluation at check points off the sampling lattice.
+
+    By default the number of primes is capped by the coefficient height bound of
+    `_coefficient_bound`, so reconstruction is guaranteed to succeed.
+    """
+    evaluator = DualPolygonEvaluator(vertices)
+    if max_primes is None:
+        max_primes = _primes_needed(_coefficient_bound(evaluator))
+    d = numerator_degree_bound(len(evaluator.edges))
+    lattice = [(i, j) for i in range(d + 1) for j in range(d + 1 - i)]
+
+    modulus = 1
+    combined: Dict[Monomial, int] = {m: 0 for m in lattice}
+    previous: Optional[Dict[Monomial, Fraction]] = None
+    for count, p in enumerate(_primes(), start=1):
+        if count > max_primes:
+            break
+        values = {(i, j): _numerator_mod(evaluator, i, j, p) for i, j in lattice}
+        coeffs_p = _interpolate_mod(values, d, p)
+        combined = {m: _crt_pair(combined[m], modulus, coeffs_p[m], p) for m in lattice}
+        modulus *= p
+
+        lifted: Dict[Monomial, Fraction] = {}
+        for m in lattice:
+            value = rational_reconstruction(combined[m], modulus)
+            if value is None:
+                break
+            lifted[m] = value
+        else:
+            if lifted == previous and _verify_numerator(evaluator, lifted):
+                return evaluator, {m: c for m, c in lifted.items() if c != 0}
+            previous = lifted
+            continue
+        previous = None
+
+    raise RuntimeError(
+        f"Modular reconstruction did not stabilize within {max_primes} primes "
+        f"for a polygon with {len(evaluator.edges)} edges."
+    )
+
+
+def _check_points(evaluator: DualPolygonEvaluator, count: int) -> List[Tuple[Fraction, Fraction]]:
+    """Rational points off every edge line and off the integer sampling lattice."""
+    points: List[Tuple[Fraction, Fraction]] = []
+    k = 1
+    while len(points) < count:
+        pt = (Fraction(2 * k + 1, 3), Fraction(k * k + 1, 7))
+        if all(edge(*pt) != 0 for edge in evaluator.edges):
+            points.append(pt)
+        k += 1
+    return points
+
+
+def _verify_numerator(evaluator: DualPolygonEvaluator, coeffs: Dict[Monomial, Fraction]) -> bool:
+    for px, py in _check_points(evaluator, 3):
+        denom = Fraction(1)
+        for edge in evaluator.edges:
+            denom *= edge(px, py)
+        numer = sum((c * px ** i * py ** j for (i, j), c in coeffs.items()), Fraction(0))
+        if numer != evaluator(px, py) * denom:
+            return False
+    return True
+
+
+def canonical_form_from_modular_samples(
+    vertices: Sequence[Tuple[object, object]],
+    x: sp.Symbol,
+    y: sp.Symbol,
+    *,
+    max_primes: Optional[int] = None,
+) -> Canonical2Form:
+    """
+    Canonical 2-form of a convex polygon as N(x, y) / prod_i l_i(x, y), without
+    triangulating or simplifying.
+
+    The denominator is the product of the primitive integer edge lines in vertex
+    order (so the sign convention matches `canonical_form_from_triangulation`);
+    the numerator, of total degree <= n-3, is recovered from modular samples by
+    `reconstruct_numerator_coefficients`.
+    """
+    evaluator, coeffs = reconstruct_numerator_coefficients(vertices, max_primes=max_primes)
+    numerator = sp.Add(
+        *(sp.Rational(c.numerator, c.denominator) * x ** i * y ** j for (i, j), c in sorted(coeffs.items()))
+    )
+    denominator = sp.Mul(*(edge.as_expr(x, y) for edge in evaluator.edges))
+    return Canonical2Form(x=x, y=y, prefactor=numerator / denominator)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from multiprocessing import get_context, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from posgeo.forms.codegen2d import compile_evaluator, load_evaluator_module
+from posgeo.geometry.region2d import Region2D, facet_matrix_contains
+from posgeo.typing import Canonical2Form
+
+FacetMatrix = Tuple[Tuple[float, float, float, float], ...]
+
+
+class SharedArray:
+    """
+    One-dimensional NumPy array backed by a `SharedMemory` block, so worker
+    processes can attach to it by name without copying.
+
+    The creating process owns the block: leaving the `with` block (or calling
+    `release`) closes and unlinks it. Attached views only close their handle.
+    """
+
+    def __init__(self, shm: SharedMemory, dtype: str, length: int, *, owner: bool) -> None:
+        import numpy as np
+
+        self._shm = shm
+        self.dtype = dtype
+        self.length = length
+        self.owner = owner
+        self.array = np.ndarray((length,), dtype=dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, length: int, dtype: str = "float64") -> "SharedArray":
+        import numpy as np
+
+        nbytes = max(length * np.dtype(dtype).itemsize, 1)
+        return cls(SharedMemory(create=True, size=nbytes), dtype, length, owner=True)
+
+    @classmethod
+    def from_array(cls, values, dtype: str = "float64") -> "SharedArray":
+        import numpy as np
+
+        values = np.ravel(np.asarray(values, dtype=dtype))
+        shared = cls.create(values.size, dtype)
+        shared.array[:] = values
+        return shared
+
+    @classmethod
+    def attach(cls, name: str, dtype: str, length: int) -> "SharedArray":
+        return cls(SharedMemory(name=name), dtype, length, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def spec(self) -> Tuple[str, str, int]:
+        """(name, dtype, length): everything another process needs to `attach`."""
+        return (self.name, self.dtype, self.length)
+
+    def release(self) -> None:
+        # The ndarray view holds an export of the buffer; drop it before closing.
+        self.array = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+@dataclass(frozen=True)
+class PointEvaluation:
+    """Prefactor values and strict-interior mask at a set of points, in input order and shape."""
+
+    values: Any
+    inside: Any
+
+
+def _evaluate_into(module: ModuleType, facet_matrix: FacetMatrix, eps: float, xs, ys, values, inside) -> None:
+    """The per-slice kernel shared by the serial path and the workers."""
+    values[:] = module.prefactor_array(xs, ys)
+    inside[:] = facet_matrix_contains(facet_matrix, xs, ys, eps)
+
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(module_path: str, facet_matrix: FacetMatrix, eps: float) -> None:
+    _WORKER.update(module=load_evaluator_module(module_path), facet_matrix=facet_matrix, eps=eps)
+
+
+def _evaluate_slice(task: Tuple[Sequence[Tuple[str, str, int]], int, int]) -> int:
+    specs, start, stop = task
+    arrays = [SharedArray.attach(*spec) for spec in specs]
+    try:
+        xs, ys, values, inside = (a.array[start:stop] for a in arrays)
+        _evaluate_into(_WORKER["module"], _WORKER["facet_matrix"], _WORKER["eps"], xs, ys, values, inside)
+        del xs, ys, values, inside
+    finally:
+        for a in arrays:
+            a.release()
+    return start
+
+
+def _as_points(xs, ys):
+    import numpy as np
+
+    xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    return xs.shape, np.ravel(xs), np.ravel(ys)
+
+
+def evaluate_points(
+    form: Canonical2Form,
+    region: Region2D,
+    xs,
+    ys,
+    *,
+    cache_dir: os.PathLike,
+    eps: float = 1e-12,
+) -> PointEvaluation:
+    """
+    Serial reference path: prefactor (via the `codegen2d` evaluator) and
+    `Region2D.contains_array` mask at broadcast `xs`, `ys`.
+    """
+    import numpy as np
+
+    module = compile_evaluator(form, cache_dir=cache_dir)
+    shape, flat_x, flat_y = _as_points(xs, ys)
+    values = np.empty(flat_x.size, dtype=float)
+    inside = np.empty(flat_x.size, dtype=bool)
+    _evaluate_into(module, region.facet_matrix, eps, flat_x, flat_y, values, inside)
+    return PointEvaluation(values=values.reshape(shape), inside=inside.reshape(shape))
+
+
+class ParallelFormEvaluator:
+    """
+    Process-pool evaluation of a form and its region's membership over large point sets.
+
+    Points and outputs live in `SharedArray` blocks; each task names the blocks
+    and a fixed [start, stop) slice, and the worker writes its results in place
+    with the same kernel as `evaluate_points`. Workers are initialized once with
+    the path of the generated evaluator module (`codegen2d.compile_evaluator`)
+    and the region's `facet_matrix`, so neither the form nor the points are
+    pickled per task. Results are elementwise identical to the serial path and
+    independent of the worker count, chunk size and completion order.
+
+    Use as a context manager (or call `close`) to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        form: Canonical2Form,
+        region: Region2D,
+        *,
+        cache_dir: os.PathLike,
+        processes: Optional[int] = None,
+        chunk_size: int = 1 << 20,
+        eps: float = 1e-12,
+        mp_context: Optional[str] = None,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.module = compile_evaluator(form, cache_dir=cache_dir)
+        self.facet_matrix: FacetMatrix = region.facet_matrix
+        self.chunk_size = chunk_size
+        self.eps = eps
+        if os.name == "posix":
+            # Workers inherit the parent's tracker, so their attachments do not
+            # outlive (or double-unlink) the blocks the parent owns.
+            resource_tracker.ensure_running()
+        self._pool = get_context(mp_context).Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(self.module.__file__, self.facet_matrix, eps),
+        )
+
+    def evaluate_shared(self, xs: SharedArray, ys: SharedArray, values: SharedArray, inside: SharedArray) -> None:
+        """Fill the `values` (float64) and `inside` (bool) blocks for the points in `xs`, `ys`."""
+        n = xs.length
+        if not (ys.length == values.length == inside.length == n):
+            raise ValueError(f"Shared arrays differ in length: {[a.length for a in (xs, ys, values, inside)]}")
+        specs = (xs.spec, ys.spec, values.spec, inside.spec)
+        tasks = [(specs, start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+        self._pool.map(_evaluate_slice, tasks, chunksize=1)
+
+    def evaluate(self, xs, ys) -> PointEvaluation:
+        """`evaluate_points` for broadcast array-likes, computed by the pool."""
+        shape, flat_x, flat_y = _as_points(xs, ys)
+        n = flat_x.size
+        blocks: List[SharedArray] = []
+        try:
+            blocks.append(SharedArray.from_array(flat_x))
+            blocks.append(SharedArray.from_array(flat_y))
+            blocks.append(SharedArray.create(n, "float64"))
+            blocks.append(SharedArray.create(n, "bool"))
+            self.evaluate_shared(*blocks)
+            values, inside = blocks[2].array.copy(), blocks[3].array.copy()
+        finally:
+            for block in blocks:
+                block.release()
+        return PointEvaluation(values=values.reshape(shape), inside=inside.reshape(shape))
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> "ParallelFormEvaluator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
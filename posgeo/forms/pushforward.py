@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, List, Sequence, Tuple
+
+import sympy as sp
+from sympy.polys.matrices import DomainMatrix
+
+from posgeo.typing import Canonical2Form
+
+# Shears x = w - c*y tried when looking for a coordinate that separates the fibers.
+_MAX_SHEAR = 8
+
+
+@dataclass(frozen=True)
+class _Elimination:
+    """
+    Fiber description of a map after the shear x = w - c*y: the preimages of a
+    target point (X, Y) are the simple roots w of `eliminant`, with
+    y = -s0(w) / s1(w) and x = w - c*y.
+    """
+
+    shear: int
+    w: sp.Symbol
+    eliminant: sp.Expr
+    s1: sp.Expr
+    s0: sp.Expr
+
+
+@dataclass(frozen=True)
+class RationalMap2D:
+    """
+    Rational map (x, y) -> (X, Y) = (phi_x(x, y), phi_y(x, y)) with finite generic fibers.
+
+    The pushforward of Omega = f dx ∧ dy is
+      (phi_* Omega)(X, Y) = sum over preimages p of f(p) / det J_phi(p) dX ∧ dY,
+    the sum running over all complex preimages (as for canonical forms of
+    images of positive geometries).
+    """
+
+    x: sp.Symbol
+    y: sp.Symbol
+    X: sp.Symbol
+    Y: sp.Symbol
+    phi_x: sp.Expr
+    phi_y: sp.Expr
+
+    @cached_property
+    def jacobian(self) -> sp.Expr:
+        return sp.cancel(
+            sp.diff(self.phi_x, self.x) * sp.diff(self.phi_y, self.y)
+            - sp.diff(self.phi_x, self.y) * sp.diff(self.phi_y, self.x)
+        )
+
+    @cached_property
+    def elimination(self) -> _Elimination:
+        """
+        Eliminate y by resultants after the first shear x = w - c*y (c = 0, 1, ...)
+        for which the target-dependent part of the resultant is squarefree and the
+        degree-1 subresultant in y is invertible on it; that linear subresultant
+        then expresses y rationally in w. Factors of the resultant free of (X, Y)
+        are base loci, not preimages, and are dropped.
+        """
+        x, y, X, Y = self.x, self.y, self.X, self.Y
+        if self.jacobian == 0:
+            raise ValueError("Map has identically vanishing Jacobian")
+        (p1, q1), (p2, q2) = (sp.fraction(sp.together(phi)) for phi in (self.phi_x, self.phi_y))
+        w = sp.Dummy("w")
+        for shear in range(_MAX_SHEAR):
+            sub = {x: w - shear * y}
+            e1 = sp.expand((p1 - X * q1).subs(sub))
+            e2 = sp.expand((p2 - Y * q2).subs(sub))
+            resultant = sp.resultant(e1, e2, y)
+            if resultant == 0:
+                continue
+            _, factors = sp.factor_list(resultant, w, X, Y)
+            kept = [(p, m) for p, m in factors if p.has(X) or p.has(Y)]
+            if not kept or any(m != 1 or not p.has(w) for p, m in kept):
+                continue
+            eliminant = sp.Mul(*(p for p, _ in kept))
+            linear = [s for s in sp.subresultants(e1, e2, y) if sp.degree(s, y) == 1]
+            if not linear:
+                continue
+            s1, s0 = sp.Poly(linear[-1], y).all_coeffs()
+            if sp.resultant(s1, eliminant, w) == 0:
+                continue
+            return _Elimination(shear=shear, w=w, eliminant=eliminant, s1=s1, s0=s0)
+        raise ValueError(
+            f"No separating shear x = w - c*y for c < {_MAX_SHEAR}; the map may have positive-dimensional fibers"
+        )
+
+    def _on_fiber(self, expr: sp.Expr) -> sp.Expr:
+        """`expr(x, y)` as a rational function of the fiber coordinate w."""
+        elim = self.elimination
+        y_of_w = -elim.s0 / elim.s1
+        return expr.subs({self.x: elim.w - elim.shear * y_of_w, self.y: y_of_w}, simultaneous=True)
+
+
+def _homogenized(coeffs: List, lc, ring) -> List:
+    """Coefficients (highest first) of lc**deg * p(v / lc) for p with coefficients `coeffs`."""
+    deg = len(coeffs) - 1
+    return [c * lc ** k for k, c in enumerate(coeffs)] if deg >= 0 else [ring.zero]
+
+
+def _multiplication_matrix(coeffs: List, monic: List, ring) -> DomainMatrix:
+    """Matrix of multiplication by p on ring[v] / (monic), basis 1, v, ..., v^(d-1)."""
+    d = len(monic) - 1
+    # Reduce p modulo the monic eliminant, then collect p * v^k mod r column by column.
+    rem = list(coeffs)
+    while len(rem) > d:
+        lead = rem.pop(0)
+        for i in range(d):
+            rem[i] -= lead * monic[i + 1]
+    rem = [ring.zero] * (d - len(rem)) + rem
+    columns = []
+    for _ in range(d):
+        columns.append(list(reversed(rem)))
+        lead = rem[0]
+        rem = rem[1:] + [ring.zero]
+        rem = [value - lead * monic[i + 1] for i, value in enumerate(rem)]
+    return DomainMatrix([[columns[j][i] for j in range(d)] for i in range(d)], (d, d), ring)
+
+
+def sum_over_preimages(phi: RationalMap2D, expr: sp.Expr) -> sp.Expr:
+    """
+    Exact sum of `expr(x, y)` over the preimages of the generic point (X, Y), as a
+    rational function of (X, Y).
+
+    On the fiber expr = A(w) / B(w), and the preimages are the roots of the
+    eliminant r with leading coefficient c. With v = c*w the eliminant becomes
+    monic over Q[X, Y], and the sum is trace(M_A adj(M_B)) / det(M_B) for the
+    multiplication matrices M_A, M_B on Q[X, Y][v] / (r); everything stays
+    polynomial until the final `cancel`. Raises ValueError if B vanishes on the
+    generic fiber.
+    """
+    elim = phi.elimination
+    ring = sp.QQ[phi.X, phi.Y]
+    numerator, denominator = sp.fraction(sp.together(phi._on_fiber(expr)))
+    r = sp.Poly(elim.eliminant, elim.w, domain=ring).rep.to_list()
+    lc, d = r[0], len(r) - 1
+    monic = [ring.one] + [c * lc ** (k - 1) for k, c in enumerate(r) if k > 0]
+    a = sp.Poly(numerator, elim.w, domain=ring).rep.to_list()
+    b = sp.Poly(denominator, elim.w, domain=ring).rep.to_list()
+    m_a = _multiplication_matrix(_homogenized(a, lc, ring), monic, ring)
+    m_b = _multiplication_matrix(_homogenized(b, lc, ring), monic, ring)
+    det = m_b.det()
+    if det == ring.zero:
+        raise ValueError(f"{expr} has a pole along the generic fiber of the map")
+    product = m_a * m_b.adjugate()
+    trace = sum((product[i, i].element for i in range(d)), ring.zero)
+    # A(w) / B(w) = lc**(deg B - deg A) * A~(v) / B~(v).
+    scale = ring.to_sympy(lc) ** (len(b) - len(a))
+    return sp.cancel(scale * ring.to_sympy(trace) / ring.to_sympy(det))
+
+
+def pushforward(form: Canonical2Form, phi: RationalMap2D) -> Canonical2Form:
+    """Exact pushforward of `form` (in phi's source variables) through `phi`, in (X, Y)."""
+    if (form.x, form.y) != (phi.x, phi.y):
+        raise ValueError(f"Form variables {(form.x, form.y)} do not match map variables {(phi.x, phi.y)}")
+    prefactor = sum_over_preimages(phi, form.prefactor / phi.jacobian)
+    return Canonical2Form(phi.X, phi.Y, sp.factor(sp.cancel(prefactor)))
+
+
+def _vectorized(expr: sp.Expr, args: Sequence[sp.Symbol]) -> Callable:
+    """NumPy function of `args` that broadcasts even when `expr` is free of some of them."""
+    import numpy as np
+
+    fn = sp.lambdify(args, expr, "numpy")
+
+    def evaluate(*values):
+        return np.broadcast_to(fn(*values), np.broadcast(*values).shape)
+
+    return evaluate
+
+
+class PushforwardEvaluator:
+    """
+    Batched numeric pushforward at many target points.
+
+    The eliminant coefficients, the fiber parametrization and f / det J are
+    compiled once with `lambdify`. Per batch, the preimages of all points are the
+    eigenvalues of a stack of companion matrices (one `numpy.linalg.eigvals`
+    call), and the values are summed over them. Points where the eliminant drops
+    degree (leading coefficient 0) or a preimage hits a pole give nan/inf.
+    """
+
+    def __init__(self, form: Canonical2Form, phi: RationalMap2D) -> None:
+        if (form.x, form.y) != (phi.x, phi.y):
+            raise ValueError(f"Form variables {(form.x, form.y)} do not match map variables {(phi.x, phi.y)}")
+        elim = phi.elimination
+        target = (phi.X, phi.Y)
+        self.phi = phi
+        self.degree = int(sp.degree(elim.eliminant, elim.w))
+        self._coeffs = [
+            _vectorized(c, target) for c in sp.Poly(elim.eliminant, elim.w).all_coeffs()
+        ]
+        fiber = (elim.w, *target)
+        self._y_of_w = _vectorized(-elim.s0 / elim.s1, fiber)
+        self._integrand = _vectorized(form.prefactor / phi.jacobian, (phi.x, phi.y))
+        self._shear = elim.shear
+
+    def preimages(self, Xs, Ys) -> Tuple:
+        """Complex preimage coordinates (xs, ys), shape `broadcast(Xs, Ys).shape + (degree,)`."""
+        import numpy as np
+
+        Xs, Ys = np.broadcast_arrays(np.asarray(Xs, dtype=float), np.asarray(Ys, dtype=float))
+        shape = Xs.shape
+        Xf, Yf = Xs.ravel(), Ys.ravel()
+        coeffs = np.stack([c(Xf, Yf) for c in self._coeffs], axis=-1).astype(complex)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            monic = coeffs[:, 1:] / coeffs[:, :1]
+            companion = np.zeros((Xf.size, self.degree, self.degree), dtype=complex)
+            companion[:, 0, :] = -monic
+            companion[:, np.arange(1, self.degree), np.arange(self.degree - 1)] = 1.0
+            bad = ~np.isfinite(monic).all(axis=1)
+            companion[bad] = 0.0
+            ws = np.linalg.eigvals(companion)
+            ws[bad] = np.nan
+            ys = self._y_of_w(ws, Xf[:, None], Yf[:, None])
+        xs = ws - self._shear * ys
+        return xs.reshape(shape + (self.degree,)), ys.reshape(shape + (self.degree,))
+
+    def __call__(self, Xs, Ys):
+        """Real part of the pushforward prefactor at the target points (broadcasting `Xs`, `Ys`)."""
+        import numpy as np
+
+        xs, ys = self.preimages(Xs, Ys)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._integrand(xs, ys).sum(axis=-1).real
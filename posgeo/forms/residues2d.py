@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import sympy as sp
 
-from posgeo.geometry.fixtures2d import H1_HEXAGON_FIXTURE, M1_PENTAGON_FIXTURE, Q1_QUADRILATERAL_FIXTURE
+from posgeo.geometry.fixtures2d import (
+    H1_HEXAGON_FIXTURE,
+    M1_PENTAGON_FIXTURE,
+    Q1_QUADRILATERAL_FIXTURE,
+    NamedFixture2D,
+)
+from posgeo.geometry.lines import LinearForm, as_fraction
 from posgeo.geometry.region2d import Region2D
+from posgeo.geometry.symmetry2d import AffineSymmetry2D
+from posgeo.memory import register_lru_cache
 from posgeo.typing import Canonical1Form, Canonical2Form
 
+if TYPE_CHECKING:
+    from posgeo.forms.canonical2d import Triangulation2D
+
+AffineCoefficients = Tuple[Fraction, Fraction, Fraction]
+# Partial-fraction data of a 1-form sum_p r_p / (t - p) dt, as {pole: residue}.
+PoleResidues = Dict[Fraction, Fraction]
+
 
 @dataclass(frozen=True)
 class FacetChart:
@@ -29,6 +47,54 @@ class FacetChart:
     x_of: sp.Expr
     y_of: sp.Expr
     s: sp.Integer  # +1 or -1
+    _memo: Dict[object, object] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def u_derivative_sign(self, form: LinearForm) -> int:
+        """
+        Sign of d/du form(x(u,t), y(u,t)) along the facet, computed exactly and cached.
+
+        For an affine chart this is the constant sign of a*x_u + b*y_u; +1 means u
+        increases towards form > 0. Raises ValueError if u is tangent to the line.
+        """
+        key = ("u_derivative_sign", form)
+        if key not in self._memo:
+            (_, xu, _), (_, yu, _) = chart_affine_coefficients(self)
+            slope = form.a * xu + form.b * yu
+            if slope == 0:
+                raise ValueError(f"Chart {self.name}: u is tangent to the line {form}")
+            self._memo[key] = 1 if slope > 0 else -1
+        return self._memo[key]
+
+
+def chart_is_affine(chart: FacetChart) -> bool:
+    try:
+        chart_affine_coefficients(chart)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def chart_affine_coefficients(chart: FacetChart) -> Tuple[AffineCoefficients, AffineCoefficients]:
+    """
+    Exact coefficients ((x0, x_u, x_t), (y0, y_u, y_t)) of an affine chart
+    x = x0 + x_u*u + x_t*t, y = y0 + y_u*u + y_t*t.
+
+    Raises ValueError for charts that are not affine in (u, t).
+    """
+    out = []
+    for expr in (chart.x_of, chart.y_of):
+        try:
+            poly = sp.Poly(expr, chart.u, chart.t)
+        except sp.PolynomialError as exc:
+            raise ValueError(f"Chart {chart.name} is not affine in (u, t): {expr}") from exc
+        if poly.total_degree() > 1:
+            raise ValueError(f"Chart {chart.name} is not affine in (u, t): {expr}")
+        out.append(tuple(as_fraction(poly.coeff_monomial(m)) for m in (1, chart.u, chart.t)))
+    return out[0], out[1]
+
+
+register_lru_cache("residues2d.chart_affine_coefficients", chart_affine_coefficients)
 
 
 def residue_2form_on_facet(form: Canonical2Form, chart: FacetChart) -> Canonical1Form:
@@ -40,15 +106,254 @@ def residue_2form_on_facet(form: Canonical2Form, chart: FacetChart) -> Canonical
     return Canonical1Form(chart.t, sp.simplify(g))
 
 
+def chart_jacobian(chart: FacetChart) -> Fraction:
+    """Exact Jacobian det d(x, y)/d(u, t) of an affine chart."""
+    (_, xu, xt), (_, yu, yt) = chart_affine_coefficients(chart)
+    return xu * yt - xt * yu
+
+
+def chart_facet_line(chart: FacetChart) -> LinearForm:
+    """Canonical integer line carrying the facet u=0 of an affine chart."""
+    (x0, _, xt), (y0, _, yt) = chart_affine_coefficients(chart)
+    return LinearForm.through_points((x0, y0), (x0 + xt, y0 + yt)).canonical()
+
+
+def facet_residue_poles_by_linearity(tri: "Triangulation2D", chart: FacetChart) -> PoleResidues:
+    """
+    Partial-fraction data of the facet residue of the triangulation's form.
+
+    Residues are linear, so only triangles with an edge on the chart's facet line
+    contribute. For such a triangle, f_T = det / (l_k l_i l_j) with l_k the edge on
+    the facet and l_k(P(u, t)) = kappa * u, so
+      s * lim_{u->0} u * f_T = s * det / (kappa * L_i(t) * L_j(t)),
+    with L_i, L_j affine in t. Its two simple poles (the edge endpoints) carry
+    opposite residues s * det / (kappa * alpha_i * alpha_j * (t_i - t_j)).
+    Contributions at shared interior endpoints cancel and are dropped.
+    """
+    (x0, xu, xt), (y0, yu, yt) = chart_affine_coefficients(chart)
+    facet = chart_facet_line(chart)
+    s = int(chart.s)
+
+    poles: PoleResidues = {}
+    for triangle in tri.triangles:
+        forms = [e.form for e in triangle.edges]
+        on_facet = [k for k, form in enumerate(forms) if form.canonical() == facet]
+        if not on_facet:
+            continue
+        k = on_facet[0]
+        (a0, b0, c0), (a1, b1, c1), (a2, b2, c2) = (f.coefficients for f in forms)
+        det = a0 * (b1 * c2 - b2 * c1) - b0 * (a1 * c2 - a2 * c1) + c0 * (a1 * b2 - a2 * b1)
+        kappa = forms[k].a * xu + forms[k].b * yu
+
+        # L(t) = alpha * t + beta along u = 0.
+        (alpha_i, beta_i), (alpha_j, beta_j) = (
+            (form.a * xt + form.b * yt, form(x0, y0)) for m, form in enumerate(forms) if m != k
+        )
+        t_i, t_j = -beta_i / alpha_i, -beta_j / alpha_j
+        r = Fraction(s * det) / (kappa * alpha_i * alpha_j * (t_i - t_j))
+        poles[t_i] = poles.get(t_i, Fraction(0)) + r
+        poles[t_j] = poles.get(t_j, Fraction(0)) - r
+    return {p: r for p, r in poles.items() if r != 0}
+
+
+def one_form_from_poles(t: sp.Symbol, poles: PoleResidues) -> Canonical1Form:
+    """The 1-form sum_p r_p / (t - p) dt, assembled without simplification."""
+    terms = [
+        sp.Rational(r.numerator, r.denominator) / (t - sp.Rational(p.numerator, p.denominator))
+        for p, r in sorted(poles.items())
+    ]
+    return Canonical1Form(t, sp.Add(*terms))
+
+
+def residue_2form_on_facet_by_linearity(tri: "Triangulation2D", chart: FacetChart) -> Canonical1Form:
+    """
+    Facet residue of the triangulation's canonical form, summed per triangle.
+
+    Agrees with `residue_2form_on_facet(canonical_form_from_triangulation(tri), chart)`
+    for affine charts, but never forms the global prefactor or takes a limit.
+    """
+    return one_form_from_poles(chart.t, facet_residue_poles_by_linearity(tri, chart))
+
+
 def pullback_1form(form: Canonical1Form, t_new: sp.Symbol, t_old_expr: sp.Expr) -> Canonical1Form:
     """
     Pull back omega = g(t_old) d(t_old) under t_old = t_old_expr(t_new):
       omega = g(t_old_expr) * d(t_old_expr)/d(t_new) dt_new
+
+    For affine t_old_expr the derivative is the constant slope and a single
+    simplification suffices.
     """
+    reparam = AffineReparam.from_expr(form.t, t_new, t_old_expr)
+    if reparam is not None:
+        alpha = sp.Rational(reparam.alpha.numerator, reparam.alpha.denominator)
+        return Canonical1Form(t_new, sp.simplify(alpha * form.prefactor.subs({form.t: t_old_expr})))
     g_new = sp.simplify(form.prefactor.subs({form.t: t_old_expr}) * sp.diff(t_old_expr, t_new))
     return Canonical1Form(t_new, sp.simplify(g_new))
 
 
+@dataclass(frozen=True)
+class AffineReparam:
+    """
+    Affine change of boundary parameter t_old = alpha * t_new + beta.
+
+    Every pair of affine charts on the same linear facet is related this way.
+    Pulling back a 1-form given as partial-fraction data keeps the residues and
+    moves each pole p to (p - beta) / alpha, since
+      r / (t_old - p) dt_old = r / (t_new - (p - beta) / alpha) dt_new.
+    """
+
+    t_old: sp.Symbol
+    t_new: sp.Symbol
+    alpha: Fraction
+    beta: Fraction
+
+    @classmethod
+    def from_charts(cls, old: FacetChart, new: FacetChart) -> "AffineReparam":
+        """Reparameterization expressing `old.t` in terms of `new.t` along the shared facet u=0."""
+        if chart_facet_line(old) != chart_facet_line(new):
+            raise ValueError(f"Charts {old.name} and {new.name} do not parametrize the same facet line")
+        (x0o, _, xto), (y0o, _, yto) = chart_affine_coefficients(old)
+        (x0n, _, xtn), (y0n, _, ytn) = chart_affine_coefficients(new)
+        if xto != 0:
+            return cls(old.t, new.t, xtn / xto, (x0n - x0o) / xto)
+        return cls(old.t, new.t, ytn / yto, (y0n - y0o) / yto)
+
+    @classmethod
+    def from_expr(cls, t_old: sp.Symbol, t_new: sp.Symbol, t_old_expr: sp.Expr) -> Optional["AffineReparam"]:
+        """Affine reparameterization with rational coefficients, or None if `t_old_expr` is not one."""
+        try:
+            poly = sp.Poly(t_old_expr, t_new)
+        except sp.PolynomialError:
+            return None
+        if poly.degree() != 1:
+            return None
+        alpha, beta = poly.coeff_monomial(t_new), poly.coeff_monomial(1)
+        if not (alpha.is_Rational and beta.is_Rational):
+            return None
+        return cls(t_old, t_new, as_fraction(alpha), as_fraction(beta))
+
+    def expr(self) -> sp.Expr:
+        """t_old as an expression in t_new."""
+        alpha, beta = (sp.Rational(v.numerator, v.denominator) for v in (self.alpha, self.beta))
+        return alpha * self.t_new + beta
+
+    def inverse(self) -> "AffineReparam":
+        return AffineReparam(self.t_new, self.t_old, 1 / self.alpha, -self.beta / self.alpha)
+
+    def map_pole(self, pole: Fraction) -> Fraction:
+        return (pole - self.beta) / self.alpha
+
+    def pullback_poles(self, poles: PoleResidues) -> PoleResidues:
+        """Partial-fraction data of the pulled-back 1-form, in O(#poles)."""
+        return {self.map_pole(p): r for p, r in poles.items()}
+
+
+# Chart on facet `facet_name`, at position `index` in that facet's chart list.
+ChartRef = Tuple[str, int]
+
+
+def transport_chart(chart: FacetChart, symmetry: AffineSymmetry2D) -> FacetChart:
+    """Chart g o chart on the image facet, with the same (u, t) symbols and the same `s`."""
+    x, y = sp.Dummy("x"), sp.Dummy("y")
+    image = symmetry.substitution(x, y)
+    point = {x: chart.x_of, y: chart.y_of}
+    return FacetChart(
+        name=chart.name,
+        u=chart.u,
+        t=chart.t,
+        x_of=sp.expand(image[x].subs(point, simultaneous=True)),
+        y_of=sp.expand(image[y].subs(point, simultaneous=True)),
+        s=chart.s,
+    )
+
+
+def _transported_coefficients(
+    coeffs: Tuple[AffineCoefficients, AffineCoefficients],
+    symmetry: AffineSymmetry2D,
+) -> Tuple[AffineCoefficients, AffineCoefficients]:
+    (a, b), (c, d) = symmetry.matrix
+    (x0, xu, xt), (y0, yu, yt) = coeffs
+    e, f = symmetry.shift
+    return (
+        (a * x0 + b * y0 + e, a * xu + b * yu, a * xt + b * yt),
+        (c * x0 + d * y0 + f, c * xu + d * yu, c * xt + d * yt),
+    )
+
+
+def symmetric_chart_sources(
+    charts: Mapping[str, Sequence[FacetChart]],
+    symmetries: Sequence[AffineSymmetry2D],
+) -> Dict[ChartRef, Tuple[ChartRef, AffineSymmetry2D]]:
+    """
+    Charts that are the image g o c of an earlier chart c, up to renaming (u, t).
+
+    Maps each such chart to (source chart, g); sources are never themselves
+    derived and come earlier in `charts` iteration order. Only affine charts
+    take part.
+    """
+    images: Dict[Tuple[str, Tuple[AffineCoefficients, AffineCoefficients]], Tuple[ChartRef, AffineSymmetry2D]] = {}
+    derived: Dict[ChartRef, Tuple[ChartRef, AffineSymmetry2D]] = {}
+    for facet_name, facet_charts in charts.items():
+        for index, chart in enumerate(facet_charts):
+            if not chart_is_affine(chart):
+                continue
+            coeffs = chart_affine_coefficients(chart)
+            hit = images.get((facet_name, coeffs))
+            if hit is not None:
+                derived[(facet_name, index)] = hit
+                continue
+            for g in symmetries:
+                if g.is_identity:
+                    continue
+                key = (g.facet_image(facet_name), _transported_coefficients(coeffs, g))
+                images.setdefault(key, ((facet_name, index), g))
+    return derived
+
+
+def form_is_invariant(form: Canonical2Form, symmetry: AffineSymmetry2D) -> bool:
+    """
+    Exact check of g* Omega = sign(det A) Omega, i.e. |det A| f(g p) = f(p); the
+    canonical form of a polygon satisfies it for every symmetry of the polygon.
+    """
+    det = abs(symmetry.det)
+    moved = form.prefactor.subs(symmetry.substitution(form.x, form.y), simultaneous=True)
+    return sp.cancel(sp.Rational(det.numerator, det.denominator) * moved - form.prefactor) == 0
+
+
+def facet_residues_by_orbit(
+    form: Canonical2Form,
+    charts: Mapping[str, Sequence[FacetChart]],
+    symmetries: Sequence[AffineSymmetry2D],
+) -> Dict[str, List[Canonical1Form]]:
+    """
+    `residue_2form_on_facet` for every chart, computing one per symmetry class.
+
+    If c' = g o c and the form is g-invariant, then
+      Res_{c'}(t) = s' lim u f(g(c(u, t))) = (s' / s) Res_c(t) / |det A|,
+    so only charts without a source under an invariant symmetry take a limit.
+    """
+    sources = symmetric_chart_sources(charts, symmetries)
+    invariant: Dict[AffineSymmetry2D, bool] = {}
+    out: Dict[str, List[Canonical1Form]] = {}
+    for facet_name, facet_charts in charts.items():
+        out[facet_name] = []
+        for index, chart in enumerate(facet_charts):
+            source = sources.get((facet_name, index))
+            if source is not None:
+                (src_facet, src_index), g = source
+                if g not in invariant:
+                    invariant[g] = form_is_invariant(form, g)
+                if invariant[g]:
+                    src_chart = charts[src_facet][src_index]
+                    det = abs(g.det)
+                    factor = chart.s / src_chart.s / sp.Rational(det.numerator, det.denominator)
+                    src_residue = out[src_facet][src_index].prefactor
+                    out[facet_name].append(Canonical1Form(chart.t, factor * src_residue.subs(src_chart.t, chart.t)))
+                    continue
+            out[facet_name].append(residue_2form_on_facet(form, chart))
+    return out
+
+
 def _make_facet_charts(
     defs: Dict[str, List[Tuple[str, sp.Expr, sp.Expr, int]]],
 ) -> Dict[str, List[FacetChart]]:
@@ -78,8 +383,37 @@ def _make_facet_charts(
     return charts
 
 
+def fixture_facet_charts(fixture: NamedFixture2D) -> Dict[str, List[FacetChart]]:
+    """
+    Facet charts for a named fixture.
+
+    The charts are built once per fixture and shared; each call returns a fresh
+    dict of fresh lists so callers may rearrange them without affecting the cache.
+    """
+    charts: Mapping[str, Tuple[FacetChart, ...]] = fixture.cached(
+        "facet_charts",
+        lambda: MappingProxyType(
+            {
+                facet_name: tuple(facet_charts)
+                for facet_name, facet_charts in _make_facet_charts(
+                    {k: list(v) for k, v in fixture.chart_defs.items()}
+                ).items()
+            }
+        ),
+    )
+    return {facet_name: list(facet_charts) for facet_name, facet_charts in charts.items()}
+
+
 def _solve_chart_t_at_vertex(chart: FacetChart, vx: sp.Rational, vy: sp.Rational) -> sp.Expr:
     """Solve for chart.t at boundary point (vx, vy) on u=0."""
+    vx, vy = sp.sympify(vx), sp.sympify(vy)
+    if chart_is_affine(chart) and vx.is_Rational and vy.is_Rational:
+        (x0, _, xt), (y0, _, yt) = chart_affine_coefficients(chart)
+        px, py = as_fraction(vx), as_fraction(vy)
+        t_val = (px - x0) / xt if xt != 0 else (py - y0) / yt if yt != 0 else None
+        if t_val is not None and x0 + xt * t_val == px and y0 + yt * t_val == py:
+            return sp.Rational(t_val.numerator, t_val.denominator)
+
     u, t = chart.u, chart.t
     x0 = sp.simplify(chart.x_of.subs({u: 0}))
     y0 = sp.simplify(chart.y_of.subs({u: 0}))
@@ -109,16 +443,10 @@ def facet_vertices_from_region_equations(
     facet_name: str,
     verts_ccw: List[Tuple[sp.Rational, sp.Rational]],
 ) -> List[Tuple[sp.Rational, sp.Rational]]:
-    """Identify polygon vertices lying on a named facet via region equations."""
+    """Identify polygon vertices lying on a named facet via the region's incidence index."""
     if facet_name not in region.facets:
         raise KeyError(f"Unknown facet: {facet_name}")
-
-    eq = sp.simplify(region.facets[facet_name].expr)
-    on = []
-    for vx, vy in verts_ccw:
-        if sp.simplify(eq.subs({region.x: vx, region.y: vy})) == 0:
-            on.append((vx, vy))
-    return on
+    return region.incidence(verts_ccw).vertices_on(facet_name)
 
 
 def oriented_edge_vertices_ccw(
@@ -127,20 +455,9 @@ def oriented_edge_vertices_ccw(
     verts_ccw: List[Tuple[sp.Rational, sp.Rational]],
 ) -> Tuple[Tuple[sp.Rational, sp.Rational], Tuple[sp.Rational, sp.Rational]]:
     """Return (v_start, v_end) as the CCW boundary edge lying on the named facet."""
-    on = facet_vertices_from_region_equations(region, facet_name, verts_ccw)
-    if len(on) != 2:
-        raise ValueError(f"Expected 2 vertices on facet {facet_name}, got {len(on)}: {on}")
-
-    v_a, v_b = on
-    idx = {v: i for i, v in enumerate(verts_ccw)}
-    i_a, i_b = idx[v_a], idx[v_b]
-    n = len(verts_ccw)
-
-    if (i_a + 1) % n == i_b:
-        return v_a, v_b
-    if (i_b + 1) % n == i_a:
-        return v_b, v_a
-    raise ValueError(f"Facet {facet_name} vertices are not adjacent in CCW order: {on}")
+    if facet_name not in region.facets:
+        raise KeyError(f"Unknown facet: {facet_name}")
+    return region.incidence(verts_ccw).edge(facet_name)
 
 
 def interval_endpoints_from_chart(
@@ -171,34 +488,45 @@ def _interval_endpoints_from_chart_ccw_impl(
     return sp.simplify(ts), sp.simplify(te)
 
 
-def _point_inside_region(region: Region2D, px: sp.Expr, py: sp.Expr) -> bool:
-    subs = {region.x: px, region.y: py}
-    for f in region.facets.values():
-        val = sp.simplify(f.expr.subs(subs))
-        if val.is_negative is True:
-            return False
-        if (val.is_Rational is True or val.is_Integer is True) and val < 0:
-            return False
-    return True
-
-
 def _chart_u_points_outward(
     region: Region2D,
     chart: FacetChart,
     facet_name: str,
     verts_ccw: List[Tuple[sp.Rational, sp.Rational]],
 ) -> sp.Integer:
+    """
+    +1 if the chart's u-direction leaves the region across the facet, -1 if it enters.
+
+    Decided exactly by the sign of the inward facet form differentiated along u
+    (cached on the chart). Non-affine charts use the same derivative at the edge
+    midpoint.
+    """
+    line = region.facets[facet_name]
+    try:
+        return sp.Integer(-chart.u_derivative_sign(line.form))
+    except ValueError:
+        if chart_is_affine(chart):
+            raise
+
     v_start, v_end = oriented_edge_vertices_ccw(region, facet_name, verts_ccw)
     mx = (v_start[0] + v_end[0]) / 2
     my = (v_start[1] + v_end[1]) / 2
     t_mid = _solve_chart_t_at_vertex(chart, mx, my)
+    along_u = sp.diff(line.expr.subs({region.x: chart.x_of, region.y: chart.y_of}), chart.u)
+    slope = sp.simplify(along_u.subs({chart.u: 0, chart.t: t_mid}))
+    if slope == 0:
+        raise ValueError(f"Chart {chart.name}: u is tangent to facet {facet_name}")
+    return sp.Integer(-1) if slope > 0 else sp.Integer(1)
 
-    eps = sp.Rational(1, 1000)
-    x_eps = sp.simplify(chart.x_of.subs({chart.u: eps, chart.t: t_mid}))
-    y_eps = sp.simplify(chart.y_of.subs({chart.u: eps, chart.t: t_mid}))
 
-    inside = _point_inside_region(region, x_eps, y_eps)
-    return sp.Integer(-1) if inside else sp.Integer(1)
+def interval_1form_value(t, endpoint_pair: Tuple[object, object], orientation_sign=1):
+    """
+    sign * (1/(t-a) + 1/(b-t)) for an interval (a, b).
+
+    Works on SymPy expressions and on exact scalars (e.g. Fractions) alike.
+    """
+    a, b = endpoint_pair
+    return orientation_sign * (1 / (t - a) + 1 / (b - t))
 
 
 def expected_interval_1form_prefactor(
@@ -208,8 +536,7 @@ def expected_interval_1form_prefactor(
     orientation_sign: sp.Expr = sp.Integer(1),
 ) -> sp.Expr:
     """Build expected interval 1-form prefactor with optional orientation sign."""
-    a, b = endpoint_pair
-    return sp.simplify(orientation_sign * (1 / (chart.t - a) + 1 / (b - chart.t)))
+    return sp.simplify(interval_1form_value(chart.t, endpoint_pair, orientation_sign))
 
 
 def expected_interval_prefactor_from_chart(
@@ -236,34 +563,124 @@ def expected_interval_prefactor_from_chart_ccw(
     return expected_interval_1form_prefactor(chart, endpoint_pair=(a, b), orientation_sign=s_norm)
 
 
+@dataclass(frozen=True)
+class VertexResidue:
+    """
+    Iterated residue of the canonical form at a polygon vertex: first along
+    `first`, then along `second` (facet names in region declaration order).
+    """
+
+    vertex: Tuple[sp.Rational, sp.Rational]
+    first: str
+    second: str
+    value: int
+
+
+def vertex_residues(
+    region: Region2D,
+    verts: Sequence[Tuple[sp.Rational, sp.Rational]],
+    *,
+    form: Optional[Canonical2Form] = None,
+    charts: Optional[Mapping[str, Sequence[FacetChart]]] = None,
+) -> List[VertexResidue]:
+    """
+    All vertex residues of the canonical form for `verts` (cyclic order) in one pass.
+
+    Near a simple vertex f ~ c / (l_i l_j), and f dx ∧ dy = c / det(∇l_i, ∇l_j)
+    dlog l_i ∧ dlog l_j, so the iterated residue is determined by facet
+    gradients and incidence alone:
+      Res_{F_j} Res_{F_i} Ω = eps * sign det(∇L_i, ∇L_j),
+    with L the inward facet forms and eps = ±1 the orientation of the vertex order.
+
+    When `form` and `charts` are given, every value is cross-checked on the limit
+    path (chart residue on F_i, then the simple-pole coefficient at the vertex)
+    and an AssertionError is raised on mismatch.
+    """
+    if (form is None) != (charts is None):
+        raise ValueError("Cross-check needs both `form` and `charts`.")
+
+    n = len(verts)
+    twice_area = sum(
+        verts[i][0] * verts[(i + 1) % n][1] - verts[(i + 1) % n][0] * verts[i][1] for i in range(n)
+    )
+    if twice_area == 0:
+        raise ValueError("Degenerate vertex order: zero signed area.")
+    eps = 1 if twice_area > 0 else -1
+
+    forms = {name: line.form for name, line in region.facets.items()}
+    incidence = region.incidence(verts)
+    out: List[VertexResidue] = []
+    for i, (vx, vy) in enumerate(verts):
+        incident = incidence.facets_at(i)
+        if len(incident) != 2:
+            raise ValueError(f"Vertex {(vx, vy)} is not simple: incident facets {incident}")
+        first, second = incident
+        det = forms[first].det(forms[second])
+        if det == 0:
+            raise ValueError(f"Vertex {(vx, vy)}: facets {first} and {second} are parallel")
+        out.append(VertexResidue(vertex=(vx, vy), first=first, second=second, value=eps * (1 if det > 0 else -1)))
+
+    if form is not None:
+        for residue in out:
+            limit_value = _vertex_residue_by_limits(form, charts[residue.first][0], residue.vertex)
+            if limit_value != residue.value:
+                raise AssertionError(
+                    f"TA-RR vertex residue failed at {residue.vertex} ({residue.first} -> {residue.second}): "
+                    f"gradient rule {residue.value}, limit path {limit_value}"
+                )
+    return out
+
+
+def _vertex_residue_by_limits(
+    form: Canonical2Form,
+    chart: FacetChart,
+    vertex: Tuple[sp.Rational, sp.Rational],
+) -> sp.Expr:
+    """
+    Iterated residue via limits. The first residue is taken against dlog u, so the
+    chart Jacobian (not only `s`) is applied; the second is the simple-pole
+    coefficient at the vertex parameter, i.e. against dlog(t - t_v).
+    """
+    jacobian = chart_jacobian(chart)
+    g = residue_2form_on_facet(form, chart).prefactor * sp.Rational(jacobian.numerator, jacobian.denominator) / chart.s
+    t_v = _solve_chart_t_at_vertex(chart, *vertex)
+    return sp.simplify(sp.limit((chart.t - t_v) * g, chart.t, t_v))
+
+
 # -- M1 adapters --
 def m1_facet_charts_all(x: sp.Symbol, y: sp.Symbol) -> Dict[str, List[FacetChart]]:
     _ = (x, y)
-    return _make_facet_charts({k: list(v) for k, v in M1_PENTAGON_FIXTURE.chart_defs.items()})
+    return fixture_facet_charts(M1_PENTAGON_FIXTURE)
 
 
 def q1_facet_charts_all(x: sp.Symbol, y: sp.Symbol) -> Dict[str, List[FacetChart]]:
     """Charts for the Q1 convex quadrilateral fixture."""
     _ = (x, y)
-    return _make_facet_charts({k: list(v) for k, v in Q1_QUADRILATERAL_FIXTURE.chart_defs.items()})
+    return fixture_facet_charts(Q1_QUADRILATERAL_FIXTURE)
 
 
 def h1_facet_charts_all(x: sp.Symbol, y: sp.Symbol) -> Dict[str, List[FacetChart]]:
     """Charts for the H1 convex hexagon fixture."""
     _ = (x, y)
-    return _make_facet_charts({k: list(v) for k, v in H1_HEXAGON_FIXTURE.chart_defs.items()})
+    return fixture_facet_charts(H1_HEXAGON_FIXTURE)
+
+
+@lru_cache(maxsize=None)
+def _m1_expected_interval_prefactor(facet_name: str) -> Tuple[sp.Symbol, sp.Expr]:
+    """Expected interval prefactor on an M1 facet in its first chart, computed once per facet."""
+    region = M1_PENTAGON_FIXTURE.build_region()
+    verts = list(M1_PENTAGON_FIXTURE.vertices)
+    chart = fixture_facet_charts(M1_PENTAGON_FIXTURE)[facet_name][0]
+    return chart.t, expected_interval_prefactor_from_chart(region, facet_name, chart, verts)
+
+
+register_lru_cache("residues2d.m1_expected_interval_prefactor", _m1_expected_interval_prefactor, scope="process")
 
 
 # Backward-compatible M1 API adapters
 def expected_interval_prefactor_for_m1_facet(facet_name: str, t: sp.Symbol) -> sp.Expr:
-    from posgeo.geometry.region2d import PentagonM1Region
-
-    region = PentagonM1Region.build()
-    verts = list(M1_PENTAGON_FIXTURE.vertices)
-    charts = m1_facet_charts_all(region.x, region.y)
-    chart = charts[facet_name][0]
-    exp = expected_interval_prefactor_from_chart(region, facet_name, chart, verts)
-    return sp.simplify(exp.subs({chart.t: t}))
+    chart_t, exp = _m1_expected_interval_prefactor(facet_name)
+    return exp.subs({chart_t: t})
 
 
 def interval_endpoints_from_chart_ccw(
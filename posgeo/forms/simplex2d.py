@@ -5,29 +5,20 @@ from typing import List, Tuple
 
 import sympy as sp
 
-from posgeo.geometry.lines import OrientedLine2D
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+from posgeo.metrics import record_expression
 from posgeo.typing import Canonical2Form
 
 
-def _line_expr_through_points(x: sp.Symbol, y: sp.Symbol, p: Tuple[sp.Rational, sp.Rational], q: Tuple[sp.Rational, sp.Rational]) -> sp.Expr:
-    """
-    Returns linear expression L(x,y) = a*x + b*y + c such that L(p)=L(q)=0.
-    """
-    (x1, y1), (x2, y2) = p, q
-    # Using determinant form:
-    # |x y 1|
-    # |x1 y1 1| = 0 gives line equation through p and q.
-    # |x2 y2 1|
-    return sp.Matrix([[x, y, 1], [x1, y1, 1], [x2, y2, 1]]).det()
-
-
-def _orient_line_positive_at_point(x: sp.Symbol, y: sp.Symbol, expr: sp.Expr, interior: Tuple[sp.Rational, sp.Rational]) -> sp.Expr:
-    val = sp.simplify(expr.subs({x: interior[0], y: interior[1]}))
+def _inward_edge_form(p: Tuple[sp.Rational, sp.Rational], q: Tuple[sp.Rational, sp.Rational], interior: Tuple[sp.Rational, sp.Rational]) -> LinearForm:
+    """Integer line through `p` and `q`, oriented positive at `interior`."""
+    form = LinearForm.through_points(p, q)
+    val = form(*interior)
     if val == 0:
         raise ValueError("Interior point lies on the line; cannot orient.")
     if val < 0:
-        return -expr
-    return expr
+        return -form
+    return form
 
 
 @dataclass(frozen=True)
@@ -52,21 +43,17 @@ class Triangle2D:
         interior = (cx, cy)
 
         # edges are lines through (v1,v2), (v2,v0), (v0,v1)
-        e0 = _line_expr_through_points(x, y, v1, v2)
-        e1 = _line_expr_through_points(x, y, v2, v0)
-        e2 = _line_expr_through_points(x, y, v0, v1)
-
-        e0 = _orient_line_positive_at_point(x, y, e0, interior)
-        e1 = _orient_line_positive_at_point(x, y, e1, interior)
-        e2 = _orient_line_positive_at_point(x, y, e2, interior)
+        e0 = _inward_edge_form(v1, v2, interior)
+        e1 = _inward_edge_form(v2, v0, interior)
+        e2 = _inward_edge_form(v0, v1, interior)
 
         return Triangle2D(
             x=x,
             y=y,
             vertices=verts,
-            edges=(OrientedLine2D(x, y, sp.simplify(e0)),
-                   OrientedLine2D(x, y, sp.simplify(e1)),
-                   OrientedLine2D(x, y, sp.simplify(e2))),
+            edges=(OrientedLine2D.from_form(x, y, e0),
+                   OrientedLine2D.from_form(x, y, e1),
+                   OrientedLine2D.from_form(x, y, e2)),
         )
 
     def canonical_form(self) -> Canonical2Form:
@@ -75,16 +62,18 @@ class Triangle2D:
           Omega = f(x,y) dx ∧ dy
         where
           f = sum_{cyc} det(∇l_i, ∇l_j)/(l_i l_j)
-        """
-        l = [e.expr for e in self.edges]
-        grads = [e.grad() for e in self.edges]
 
-        def det2(a, b):
-            return sp.simplify(a[0] * b[1] - a[1] * b[0])
-
-        f = (
-            det2(grads[0], grads[1]) / (l[0] * l[1])
-            + det2(grads[1], grads[2]) / (l[1] * l[2])
-            + det2(grads[2], grads[0]) / (l[2] * l[0])
-        )
-        return Canonical2Form(self.x, self.y, sp.simplify(f))
\ No newline at end of file
+        The gradient part of the cyclic numerator sum_{cyc} det(∇l_i, ∇l_j) l_k vanishes
+        identically, leaving the constant det[a_i b_i c_i], so with primitive integer
+        edge forms
+          f = det[a_i b_i c_i] / (l_0 l_1 l_2)
+        exactly, without symbolic simplification.
+        """
+        forms = [e.form for e in self.edges]
+        (a0, b0, c0), (a1, b1, c1), (a2, b2, c2) = (f.coefficients for f in forms)
+        numerator = a0 * (b1 * c2 - b2 * c1) - b0 * (a1 * c2 - a2 * c1) + c0 * (a1 * b2 - a2 * b1)
+
+        l0, l1, l2 = (f.as_expr(self.x, self.y) for f in forms)
+        prefactor = sp.Integer(numerator) / (l0 * l1 * l2)
+        record_expression("triangle", prefactor, variables=(self.x, self.y))
+        return Canonical2Form(self.x, self.y, prefactor)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import sympy as sp
+
+from posgeo.forms.canonical2d import Triangulation2D, _triangulation_from_indices, canonical_form_from_triangulation
+from posgeo.geometry.lines import LinearForm
+from posgeo.typing import Canonical2Form
+
+TriangleIndices = Tuple[Tuple[int, int, int], ...]
+
+
+def _relabel(triangles: List[Tuple[int, int, int]], start: int, n: int) -> TriangleIndices:
+    return tuple(tuple((start + i) % n for i in tri) for tri in triangles)  # type: ignore[misc]
+
+
+def fan_triangulation(n: int, apex: int = 0) -> TriangleIndices:
+    """Triangles (apex, apex+i, apex+i+1), i = 1..n-2 (indices mod n)."""
+    return _relabel([(0, i, i + 1) for i in range(1, n - 1)], apex, n)
+
+
+def zigzag_triangulation(n: int, start: int = 0) -> TriangleIndices:
+    """Strip alternating between the two boundary chains leaving vertex `start`."""
+    lo, hi = 0, n - 1
+    triangles: List[Tuple[int, int, int]] = []
+    take_low = True
+    while hi - lo > 1:
+        if take_low:
+            triangles.append((lo, lo + 1, hi))
+            lo += 1
+        else:
+            triangles.append((lo, hi - 1, hi))
+            hi -= 1
+        take_low = not take_low
+    return _relabel(triangles, start, n)
+
+
+def balanced_triangulation(n: int, start: int = 0) -> TriangleIndices:
+    """Divide and conquer: split each chain i..j at its middle vertex m and emit (i, m, j)."""
+    triangles: List[Tuple[int, int, int]] = []
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        m = (i + j) // 2
+        triangles.append((i, m, j))
+        stack.extend([(i, m), (m, j)])
+    return _relabel(triangles, start, n)
+
+
+def candidate_triangulations(n: int) -> Tuple[Tuple[str, TriangleIndices], ...]:
+    """Fans from every apex, zig-zag strips and balanced splits from every start vertex."""
+    candidates: List[Tuple[str, TriangleIndices]] = []
+    for k in range(n):
+        candidates.append((f"fan@{k}", fan_triangulation(n, k)))
+    for k in range(n):
+        candidates.append((f"zigzag@{k}", zigzag_triangulation(n, k)))
+    for k in range(n):
+        candidates.append((f"balanced@{k}", balanced_triangulation(n, k)))
+    return tuple(candidates)
+
+
+@dataclass(frozen=True, order=True)
+class TriangulationCost:
+    """
+    Cheap estimate of how hard the summed triangle forms are to simplify, compared
+    lexicographically.
+
+    `denominator_degree` is the number of distinct lines in the unsimplified sum
+    (facets plus spurious diagonal factors), `diagonal_vertices` the number of
+    polygon vertices the diagonals touch (n - 2 for a fan, whose spurious factors
+    form one pencil), and `diagonal_bits` the total bit length of the diagonal
+    line coefficients.
+    """
+
+    denominator_degree: int
+    diagonal_vertices: int
+    diagonal_bits: int
+
+
+@dataclass(frozen=True)
+class TriangulationChoice:
+    name: str
+    triangles: TriangleIndices
+    cost: TriangulationCost
+
+
+def triangulation_cost(vertices: Sequence[Tuple[object, object]], triangles: TriangleIndices) -> TriangulationCost:
+    n = len(vertices)
+    boundary = {LinearForm.through_points(vertices[i], vertices[(i + 1) % n]).canonical() for i in range(n)}
+    lines = set(boundary)
+    diagonals = set()
+    touched = set()
+    for tri in triangles:
+        for a, b in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
+            line = LinearForm.through_points(vertices[a], vertices[b]).canonical()
+            lines.add(line)
+            if line not in boundary:
+                diagonals.add(line)
+                touched.update((a, b))
+    bits = sum(abs(c).bit_length() for line in diagonals for c in line.coefficients)
+    return TriangulationCost(denominator_degree=len(lines), diagonal_vertices=len(touched), diagonal_bits=bits)
+
+
+def select_triangulation(
+    vertices: Sequence[Tuple[object, object]],
+    candidates: Optional[Sequence[Tuple[str, TriangleIndices]]] = None,
+) -> TriangulationChoice:
+    """Cheapest candidate under `triangulation_cost`; ties go to the earliest candidate."""
+    if len(vertices) < 3:
+        raise ValueError(f"need >=3 vertices, got {len(vertices)}")
+    if candidates is None:
+        candidates = candidate_triangulations(len(vertices))
+    best: Optional[TriangulationChoice] = None
+    for name, triangles in candidates:
+        cost = triangulation_cost(vertices, triangles)
+        if best is None or cost < best.cost:
+            best = TriangulationChoice(name, triangles, cost)
+    return best  # type: ignore[return-value]
+
+
+def canonical_form_from_vertices(
+    vertices: Sequence[Tuple[sp.Rational, sp.Rational]],
+    x: sp.Symbol,
+    y: sp.Symbol,
+    *,
+    region=None,
+) -> Canonical2Form:
+    """
+    `canonical_form_from_triangulation` on the triangulation picked by
+    `select_triangulation`; the sign follows the vertex order.
+    """
+    verts = tuple(vertices)
+    choice = select_triangulation(verts)
+    tri: Triangulation2D = _triangulation_from_indices(verts, choice.triangles, x, y)
+    return canonical_form_from_triangulation(tri, region=region, vertices=verts)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Mapping, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Tuple, TypeVar
 
 import sympy as sp
 
 from posgeo.geometry.lines import OrientedLine2D
+from posgeo.memory import canonical_symbols, register_cache
 
 Vertex = Tuple[sp.Rational, sp.Rational]
 FacetEquation = Tuple[str, sp.Expr]
 ChartDef = Tuple[str, sp.Expr, sp.Expr, int]
+T = TypeVar("T")
 
 _X = sp.Symbol("x")
 _Y = sp.Symbol("y")
@@ -23,16 +26,38 @@ class NamedFixture2D:
     chart_defs: Mapping[str, Tuple[ChartDef, ...]]
     triangulation_a: Tuple[Tuple[int, int, int], ...]
     triangulation_b: Tuple[Tuple[int, int, int], ...]
+    _memo: Dict[str, object] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached(self, key: str, build: Callable[[], T]) -> T:
+        """
+        Return the per-fixture value stored under `key`, building it on first use.
+
+        Cached values are shared by every caller in the process, so `build` must
+        return an immutable object.
+        """
+        try:
+            return self._memo[key]  # type: ignore[return-value]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+    def clear_cache(self) -> None:
+        """Drop every memoized object (region, charts, ...) built from this fixture."""
+        self._memo.clear()
 
     def build_region(self) -> "Region2D":
+        """Region for this fixture; built once per process and shared (facets are read-only)."""
+        return self.cached("region", self._build_region)
+
+    def _build_region(self) -> "Region2D":
         from posgeo.geometry.region2d import Region2D
 
-        x, y = sp.symbols("x y", real=True)
+        x, y = canonical_symbols()
         facets = {
             facet_name: OrientedLine2D(x, y, sp.simplify(expr.subs({_X: x, _Y: y})))
             for facet_name, expr in self.facet_equations
         }
-        return Region2D(x=x, y=y, facets=facets)
+        return Region2D(x=x, y=y, facets=MappingProxyType(facets))
 
 
 M1_PENTAGON_FIXTURE = NamedFixture2D(
@@ -169,3 +194,16 @@ FIXTURES2D: Dict[str, NamedFixture2D] = {
     Q1_QUADRILATERAL_FIXTURE.name: Q1_QUADRILATERAL_FIXTURE,
     H1_HEXAGON_FIXTURE.name: H1_HEXAGON_FIXTURE,
 }
+
+
+def _clear_fixture_caches() -> None:
+    for fixture in FIXTURES2D.values():
+        fixture.clear_cache()
+
+
+register_cache(
+    "fixtures2d.memo",
+    size=lambda: sum(len(fixture._memo) for fixture in FIXTURES2D.values()),
+    clear=_clear_fixture_caches,
+    scope="process",
+)
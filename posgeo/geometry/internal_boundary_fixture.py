@@ -6,6 +6,7 @@ from typing import Dict, Tuple
 import sympy as sp
 
 from posgeo.geometry.lines import OrientedLine2D
+from posgeo.memory import canonical_symbols
 
 Vertex = Tuple[sp.Rational, sp.Rational]
 
@@ -27,7 +28,7 @@ class SquareHoleRegionFixture:
 
     @staticmethod
     def build() -> RegionWithInternalBoundaryFixture:
-        x, y = sp.symbols("x y", real=True)
+        x, y = canonical_symbols()
 
         outer_facets = {
             "outer_left": OrientedLine2D(x, y, x),
@@ -1,34 +1,199 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+import math
+from dataclasses import InitVar, dataclass, field
+from fractions import Fraction
+from typing import Optional, Tuple
 
 import sympy as sp
 
 
+def as_fraction(value) -> Fraction:
+    """Convert an exact rational scalar (int, Fraction or SymPy Rational) to a Fraction."""
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, int):
+        return Fraction(value)
+    value = sp.sympify(value)
+    if not value.is_Rational:
+        raise ValueError(f"Expected an exact rational value, got {value!r}")
+    return Fraction(int(value.p), int(value.q))
+
+
+class LinearForm:
+    """
+    Primitive integer linear form a*x + b*y + c.
+
+    Coefficients are coprime integers. Construction divides by a *positive* gcd, so the
+    sign (and with it the "inside" side L > 0) is preserved; `canonical()` returns the
+    sign-normalized representative used to compare lines irrespective of orientation.
+    Instances are immutable and hashable.
+    """
+
+    __slots__ = ("a", "b", "c", "_hash")
+
+    a: int
+    b: int
+    c: int
+
+    def __init__(self, a: int, b: int, c: int) -> None:
+        if a == 0 and b == 0:
+            raise ValueError(f"LinearForm needs a nonzero gradient, got ({a}, {b}, {c})")
+        g = math.gcd(math.gcd(a, b), c)
+        object.__setattr__(self, "a", a // g)
+        object.__setattr__(self, "b", b // g)
+        object.__setattr__(self, "c", c // g)
+        object.__setattr__(self, "_hash", hash((self.a, self.b, self.c)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LinearForm is immutable")
+
+    def __reduce__(self):
+        return (LinearForm, (self.a, self.b, self.c))
+
+    @classmethod
+    def from_rational(cls, a, b, c) -> "LinearForm":
+        """Primitive form positively proportional to `a*x + b*y + c` with rational coefficients."""
+        form, _ = _primitive_with_scale(as_fraction(a), as_fraction(b), as_fraction(c))
+        return form
+
+    @classmethod
+    def from_expr(cls, expr: sp.Expr, x: sp.Symbol, y: sp.Symbol) -> "LinearForm":
+        """Primitive form positively proportional to a linear SymPy expression in (x, y)."""
+        form, _ = _form_and_scale_from_expr(expr, x, y)
+        return form
+
+    @classmethod
+    def through_points(cls, p, q) -> "LinearForm":
+        """
+        Line through `p` and `q`, positive on the left of the direction p -> q.
+
+        Same sign convention as the determinant |x y 1; p 1; q 1|.
+        """
+        (x1, y1), (x2, y2) = (tuple(as_fraction(v) for v in p), tuple(as_fraction(v) for v in q))
+        return cls.from_rational(y1 - y2, x2 - x1, x1 * y2 - x2 * y1)
+
+    @property
+    def coefficients(self) -> Tuple[int, int, int]:
+        return (self.a, self.b, self.c)
+
+    @property
+    def grad(self) -> Tuple[int, int]:
+        return (self.a, self.b)
+
+    def __call__(self, xv, yv):
+        """Evaluate at a point; exact for int/Fraction/SymPy Rational inputs, float for floats."""
+        return self.a * xv + self.b * yv + self.c
+
+    def det(self, other: "LinearForm") -> int:
+        """Determinant det(grad self, grad other)."""
+        return self.a * other.b - self.b * other.a
+
+    def __neg__(self) -> "LinearForm":
+        return LinearForm(-self.a, -self.b, -self.c)
+
+    def canonical(self) -> "LinearForm":
+        """Sign-normalized form: the first nonzero coefficient among (a, b, c) is positive."""
+        lead = self.a if self.a != 0 else self.b
+        return self if lead > 0 else -self
+
+    def as_expr(self, x: sp.Symbol, y: sp.Symbol) -> sp.Expr:
+        return sp.Integer(self.a) * x + sp.Integer(self.b) * y + sp.Integer(self.c)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LinearForm):
+            return NotImplemented
+        return self.a == other.a and self.b == other.b and self.c == other.c
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"LinearForm({self.a}, {self.b}, {self.c})"
+
+
+def _primitive_with_scale(a: Fraction, b: Fraction, c: Fraction) -> Tuple[LinearForm, Fraction]:
+    """Return `(form, scale)` with `a*x + b*y + c == scale * form` and `scale > 0`."""
+    lcm = math.lcm(a.denominator, b.denominator, c.denominator)
+    ints = [int(v * lcm) for v in (a, b, c)]
+    form = LinearForm(*ints)
+    g = math.gcd(math.gcd(ints[0], ints[1]), ints[2])
+    return form, Fraction(g, lcm)
+
+
+def _form_and_scale_from_expr(expr: sp.Expr, x: sp.Symbol, y: sp.Symbol) -> Tuple[LinearForm, Fraction]:
+    poly = sp.Poly(expr, x, y)
+    if poly.total_degree() > 1:
+        raise ValueError(f"Expression is not linear in ({x}, {y}): {expr}")
+    coeffs = [as_fraction(poly.coeff_monomial(m)) for m in (x, y, 1)]
+    return _primitive_with_scale(*coeffs)
+
+
 @dataclass(frozen=True)
 class OrientedLine2D:
     """
     A linear function L(x,y) such that L > 0 is the "inside" side.
+
+    For linear `expr` the line carries a primitive `LinearForm` with
+    `expr == scale * form`, computed on construction (or passed in as
+    `form_and_scale` when already known); gradients, signs and evaluation go
+    through it. Nonlinear expressions keep the SymPy paths.
     """
     x: sp.Symbol
     y: sp.Symbol
     expr: sp.Expr  # linear in x,y
+    form_and_scale: InitVar[Optional[Tuple[LinearForm, Fraction]]] = field(default=None, kw_only=True)
+    _form_and_scale: Optional[Tuple[LinearForm, Fraction]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self, form_and_scale: Optional[Tuple[LinearForm, Fraction]]) -> None:
+        if form_and_scale is None:
+            try:
+                form_and_scale = _form_and_scale_from_expr(self.expr, self.x, self.y)
+            except (ValueError, sp.PolynomialError):
+                form_and_scale = None
+        object.__setattr__(self, "_form_and_scale", form_and_scale)
+
+    @classmethod
+    def from_form(cls, x: sp.Symbol, y: sp.Symbol, form: LinearForm) -> "OrientedLine2D":
+        return cls(x, y, form.as_expr(x, y), form_and_scale=(form, Fraction(1)))
+
+    @property
+    def is_linear(self) -> bool:
+        return self._form_and_scale is not None
+
+    @property
+    def form(self) -> LinearForm:
+        """Primitive integer form positively proportional to `expr`."""
+        if self._form_and_scale is None:
+            raise ValueError(f"Facet expression is not linear in ({self.x}, {self.y}): {self.expr}")
+        return self._form_and_scale[0]
+
+    @property
+    def scale(self) -> sp.Rational:
+        """Positive rational with `expr == scale * form`."""
+        _ = self.form
+        scale = self._form_and_scale[1]
+        return sp.Rational(scale.numerator, scale.denominator)
 
     def grad(self) -> Tuple[sp.Expr, sp.Expr]:
-        return (sp.diff(self.expr, self.x), sp.diff(self.expr, self.y))
+        if not self.is_linear:
+            return (sp.diff(self.expr, self.x), sp.diff(self.expr, self.y))
+        scale = self.scale
+        return (scale * self.form.a, scale * self.form.b)
 
     def normalized(self) -> "OrientedLine2D":
         """
         Normalize up to a positive scalar: set gcd-like scaling not attempted;
         just make leading coefficient canonical for comparisons.
         """
-        a = sp.Poly(self.expr, self.x, self.y).coeff_monomial(self.x)
-        b = sp.Poly(self.expr, self.x, self.y).coeff_monomial(self.y)
-        c = sp.Poly(self.expr, self.x, self.y).coeff_monomial(1)
-
         # Pick a deterministic sign: first nonzero among (a,b,c) should be positive
-        for v in (a, b, c):
+        if self.is_linear:
+            form, scale = self._form_and_scale
+            if form.canonical() is form:
+                return self
+            return OrientedLine2D(self.x, self.y, -self.expr, form_and_scale=(-form, scale))
+        poly = sp.Poly(self.expr, self.x, self.y)
+        for v in (poly.coeff_monomial(self.x), poly.coeff_monomial(self.y), poly.coeff_monomial(1)):
             if v != 0:
                 if sp.sign(v) == -1:
                     return OrientedLine2D(self.x, self.y, -self.expr)
@@ -36,4 +201,6 @@ class OrientedLine2D:
         return self  # zero shouldn't happen
 
     def eval_at(self, xv: float, yv: float) -> float:
-        return float(self.expr.subs({self.x: xv, self.y: yv}))
\ No newline at end of file
+        if not self.is_linear:
+            return float(self.expr.subs({self.x: xv, self.y: yv}))
+        return float(self._form_and_scale[1]) * float(self.form(xv, yv))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from functools import cmp_to_key
+from typing import Mapping, Tuple
+
+from .lines import LinearForm, OrientedLine2D, as_fraction
+
+Point = Tuple[Fraction, Fraction]
+
+
+def _normal_half(form: LinearForm) -> int:
+    """0 for inward normals with angle in [0, pi), 1 for [pi, 2*pi)."""
+    return 0 if form.b > 0 or (form.b == 0 and form.a > 0) else 1
+
+
+def _compare_normals(f: LinearForm, g: LinearForm) -> int:
+    hf, hg = _normal_half(f), _normal_half(g)
+    if hf != hg:
+        return hf - hg
+    det = f.det(g)
+    return -1 if det > 0 else (1 if det < 0 else 0)
+
+
+def _intersect(f: LinearForm, g: LinearForm) -> Point:
+    det = f.det(g)
+    return (Fraction(f.b * g.c - g.b * f.c, det), Fraction(g.a * f.c - f.a * g.c, det))
+
+
+class ConvexPointLocator:
+    """
+    O(log n) membership queries for a bounded convex region with linear facets.
+
+    Facets are ordered by the angle of their inward normal, which is the
+    counter-clockwise boundary order; consecutive facets meet at the vertices
+    v_0, ..., v_{n-1}, and edge k (v_k -> v_{k+1}) lies on facet k. A query point
+    is located in the fan of triangles (v_0, v_k, v_{k+1}) by binary search, and
+    only the facets that can be active in that sector are evaluated.
+
+    Raises ValueError at construction if a facet is nonlinear or redundant, or if
+    the facets do not bound a polygon.
+    """
+
+    def __init__(self, facets: Mapping[str, OrientedLine2D]) -> None:
+        if len(facets) < 3:
+            raise ValueError(f"Need at least 3 facets for a bounded polygon, got {len(facets)}")
+        if not all(line.is_linear for line in facets.values()):
+            raise ValueError("Point location needs linear facets")
+
+        names = sorted(facets, key=cmp_to_key(lambda p, q: _compare_normals(facets[p].form, facets[q].form)))
+        forms = [facets[name].form for name in names]
+        n = len(forms)
+        for k in range(n):
+            if forms[k].det(forms[(k + 1) % n]) <= 0:
+                raise ValueError(
+                    f"Facets {names[k]} and {names[(k + 1) % n]} do not bound a polygon "
+                    "(parallel or unbounded normal gap)"
+                )
+        vertices = [_intersect(forms[k - 1], forms[k]) for k in range(n)]
+        for k in range(n):
+            (x0, y0), (x1, y1) = vertices[k], vertices[(k + 1) % n]
+            # Edge k must run along its facet direction (b, -a); otherwise facet k is redundant.
+            if (x1 - x0) * forms[k].b - (y1 - y0) * forms[k].a <= 0:
+                raise ValueError(f"Facet {names[k]} is redundant")
+
+        self.facet_names: Tuple[str, ...] = tuple(names)
+        self.vertices: Tuple[Point, ...] = tuple(vertices)
+        self._forms: Tuple[LinearForm, ...] = tuple(forms)
+        self._lines: Tuple[OrientedLine2D, ...] = tuple(facets[name] for name in names)
+        self._float_vertices = tuple((float(vx), float(vy)) for vx, vy in vertices)
+
+    def _sector(self, px, py, vertices) -> int:
+        """Largest k in [1, n-2] with v_k not to the left of the ray v_0 -> p (clamped)."""
+        x0, y0 = vertices[0]
+        dx, dy = px - x0, py - y0
+        lo, hi = 1, len(vertices) - 2
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            vx, vy = vertices[mid]
+            if (vx - x0) * dy - (vy - y0) * dx >= 0:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def contains_exact(self, xv, yv) -> bool:
+        """Exact strict interior test for int/Fraction/SymPy Rational coordinates."""
+        px, py = as_fraction(xv), as_fraction(yv)
+        forms = self._forms
+        if forms[0](px, py) <= 0 or forms[-1](px, py) <= 0:
+            return False
+        return forms[self._sector(px, py, self.vertices)](px, py) > 0
+
+    def contains_float(self, xv: float, yv: float, eps: float = 1e-12) -> bool:
+        """
+        Float test with the `Region2D.contains` tolerance: every facet value must
+        exceed `eps`. Only the facets through v_0 and around the located edge can
+        fall below `eps` inside the fan sector, so only those are evaluated.
+        """
+        px, py = float(xv), float(yv)
+        n = len(self._lines)
+        k = self._sector(px, py, self._float_vertices)
+        for idx in {0, n - 1, k - 1, k, (k + 1) % n}:
+            if self._lines[idx].eval_at(px, py) <= eps:
+                return False
+        return True
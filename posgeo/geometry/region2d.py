@@ -1,14 +1,137 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import cached_property
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import sympy as sp
 
 from .lines import OrientedLine2D
+from .locate2d import ConvexPointLocator
 from .fixtures2d import M1_PENTAGON_FIXTURE, Q1_QUADRILATERAL_FIXTURE
 
 
+Point2 = Tuple[sp.Expr, sp.Expr]
+
+
+def _is_exact_rational(value) -> bool:
+    return isinstance(value, (int, Fraction)) or getattr(value, "is_Rational", False)
+
+
+def _vanishes_at(line: OrientedLine2D, xv, yv) -> bool:
+    """Exact test L(xv, yv) == 0; `sp.simplify` only for non-rational values or nonlinear facets."""
+    if line.is_linear:
+        value = line.form(xv, yv)
+        if _is_exact_rational(value):
+            return value == 0
+        return sp.simplify(value) == 0
+    return sp.simplify(line.expr.subs({line.x: xv, line.y: yv})) == 0
+
+
+@dataclass(frozen=True)
+class RegionIncidence:
+    """
+    Vertex/facet incidence of a region for one cyclic vertex order, built in a single pass.
+
+    `facet_masks[k]` has bit i set iff vertex i lies on facet k (facets in region
+    order); `vertex_masks[i]` is the transposed bitset. `edges` maps each facet
+    whose two vertices are cyclically adjacent to its (start, end) indices in the
+    given order, and `facet_order` lists those facets by edge start index.
+    """
+
+    facet_names: Tuple[str, ...]
+    vertices: Tuple[Point2, ...]
+    facet_masks: Tuple[int, ...]
+    vertex_masks: Tuple[int, ...]
+    edges: Mapping[str, Tuple[int, int]]
+    facet_order: Tuple[str, ...]
+
+    @classmethod
+    def build(cls, region: "Region2D", vertices: Sequence[Point2]) -> "RegionIncidence":
+        names = tuple(region.facets)
+        verts = tuple((vx, vy) for vx, vy in vertices)
+        n = len(verts)
+        facet_masks = []
+        vertex_masks = [0] * n
+        for k, name in enumerate(names):
+            line = region.facets[name]
+            mask = 0
+            for i, (vx, vy) in enumerate(verts):
+                if _vanishes_at(line, vx, vy):
+                    mask |= 1 << i
+                    vertex_masks[i] |= 1 << k
+            facet_masks.append(mask)
+
+        edges: Dict[str, Tuple[int, int]] = {}
+        for name, mask in zip(names, facet_masks):
+            if bin(mask).count("1") != 2:
+                continue
+            i_a = (mask & -mask).bit_length() - 1
+            i_b = mask.bit_length() - 1
+            if (i_a + 1) % n == i_b:
+                edges[name] = (i_a, i_b)
+            elif (i_b + 1) % n == i_a:
+                edges[name] = (i_b, i_a)
+        order = tuple(sorted(edges, key=lambda name: edges[name][0]))
+        return cls(
+            facet_names=names,
+            vertices=verts,
+            facet_masks=tuple(facet_masks),
+            vertex_masks=tuple(vertex_masks),
+            edges=edges,
+            facet_order=order,
+        )
+
+    def _facet_index(self, facet_name: str) -> int:
+        try:
+            return self.facet_names.index(facet_name)
+        except ValueError:
+            raise KeyError(f"Unknown facet: {facet_name}") from None
+
+    def vertex_indices_on(self, facet_name: str) -> List[int]:
+        mask = self.facet_masks[self._facet_index(facet_name)]
+        return [i for i in range(len(self.vertices)) if mask >> i & 1]
+
+    def vertices_on(self, facet_name: str) -> List[Point2]:
+        """Vertices lying on the facet, in the stored cyclic order."""
+        return [self.vertices[i] for i in self.vertex_indices_on(facet_name)]
+
+    def facets_at(self, vertex_index: int) -> List[str]:
+        """Facets through vertex `vertex_index`, in region order."""
+        mask = self.vertex_masks[vertex_index]
+        return [name for k, name in enumerate(self.facet_names) if mask >> k & 1]
+
+    def facet_count_at(self, vertex_index: int) -> int:
+        return bin(self.vertex_masks[vertex_index]).count("1")
+
+    def edge(self, facet_name: str) -> Tuple[Point2, Point2]:
+        """(v_start, v_end) of the boundary edge on the facet, following the vertex order."""
+        on = self.vertex_indices_on(facet_name)
+        if len(on) != 2:
+            raise ValueError(
+                f"Expected 2 vertices on facet {facet_name}, got {len(on)}: {[self.vertices[i] for i in on]}"
+            )
+        if facet_name not in self.edges:
+            raise ValueError(
+                f"Facet {facet_name} vertices are not adjacent in CCW order: {[self.vertices[i] for i in on]}"
+            )
+        i_start, i_end = self.edges[facet_name]
+        return self.vertices[i_start], self.vertices[i_end]
+
+
+def facet_matrix_contains(rows: Sequence[Tuple[float, float, float, float]], xs, ys, eps: float = 1e-12):
+    """Boolean array: every row's `scale * (a*x + b*y + c)` exceeds `eps` (see `Region2D.facet_matrix`)."""
+    import numpy as np
+
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    inside = np.ones(np.broadcast(xs, ys).shape, dtype=bool)
+    for a, b, c, scale in rows:
+        inside &= scale * (a * xs + b * ys + c) > eps
+    return inside
+
+
 @dataclass(frozen=True)
 class Region2D:
     """
@@ -16,18 +139,76 @@ class Region2D:
     """
     x: sp.Symbol
     y: sp.Symbol
-    facets: Dict[str, OrientedLine2D]  # name -> oriented line (inside is >=0)
+    facets: Mapping[str, OrientedLine2D]  # name -> oriented line (inside is >=0)
+    _incidence: Dict[Tuple[Point2, ...], RegionIncidence] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def incidence(self, vertices: Sequence[Point2]) -> RegionIncidence:
+        """Vertex/facet incidence for this cyclic vertex order; built once per order and reused."""
+        key = tuple((vx, vy) for vx, vy in vertices)
+        try:
+            return self._incidence[key]
+        except KeyError:
+            value = self._incidence[key] = RegionIncidence.build(self, key)
+            return value
+
+    @cached_property
+    def point_locator(self) -> Optional[ConvexPointLocator]:
+        """
+        O(log n) membership structure, or None when the facets are not the
+        irredundant linear facets of a bounded polygon (queries then scan all facets).
+        """
+        try:
+            return ConvexPointLocator(self.facets)
+        except ValueError:
+            return None
+
+    @cached_property
+    def facet_matrix(self) -> Tuple[Tuple[float, float, float, float], ...]:
+        """
+        Rows (a, b, c, scale), one per facet in `facets` order, with
+        `eval_at(x, y) == scale * (a*x + b*y + c)` evaluated in float arithmetic.
+        Raises ValueError for nonlinear facets.
+        """
+        rows = []
+        for line in self.facets.values():
+            a, b, c = line.form.coefficients
+            rows.append((float(a), float(b), float(c), float(line.scale)))
+        return tuple(rows)
+
+    def contains_array(self, xs, ys, eps: float = 1e-12):
+        """
+        Vectorized `contains` at NumPy arrays (broadcasting `xs`, `ys`): True where
+        every facet value exceeds `eps`. Needs linear facets (see `facet_matrix`).
+        """
+        return facet_matrix_contains(self.facet_matrix, xs, ys, eps)
 
     def contains(self, xv: float, yv: float, eps: float = 1e-12) -> bool:
+        locator = self.point_locator
+        if locator is not None:
+            return locator.contains_float(xv, yv, eps)
         for ln in self.facets.values():
             if ln.eval_at(xv, yv) <= eps:
                 return False
         return True
 
     def _contains_symbolic(self, xv: sp.Rational, yv: sp.Rational) -> bool:
-        """Exact strict interior check for symbolic/rational substitutions."""
+        """
+        Exact strict interior check for symbolic/rational substitutions.
+
+        Rational points on linear facets use the integer forms; nonlinear facets
+        and symbolic or irrational coordinates fall back to `sp.simplify`.
+        """
+        rational = _is_exact_rational(xv) and _is_exact_rational(yv)
+        locator = self.point_locator
+        if locator is not None and rational:
+            return locator.contains_exact(xv, yv)
         for ln in self.facets.values():
-            value = sp.simplify(ln.expr.subs({self.x: xv, self.y: yv}))
+            if rational and ln.is_linear:
+                value = ln.form(xv, yv)
+            else:
+                value = sp.simplify(ln.expr.subs({self.x: xv, self.y: yv}))
             if value <= 0:
                 return False
         return True
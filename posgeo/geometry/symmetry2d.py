@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Dict, List, Sequence, Tuple
+
+import sympy as sp
+
+from .lines import as_fraction
+from .region2d import Region2D
+
+Point = Tuple[Fraction, Fraction]
+Matrix2 = Tuple[Tuple[Fraction, Fraction], Tuple[Fraction, Fraction]]
+
+
+@dataclass(frozen=True)
+class AffineSymmetry2D:
+    """
+    Affine map p -> A p + b sending a polygon onto itself.
+
+    `vertex_permutation[i]` is the index of the image of vertex i, and
+    `facet_permutation` pairs each facet name with the name of its image facet.
+    """
+
+    matrix: Matrix2
+    shift: Point
+    vertex_permutation: Tuple[int, ...]
+    facet_permutation: Tuple[Tuple[str, str], ...]
+
+    @property
+    def det(self) -> Fraction:
+        (a, b), (c, d) = self.matrix
+        return a * d - b * c
+
+    @property
+    def is_identity(self) -> bool:
+        return all(i == j for i, j in enumerate(self.vertex_permutation))
+
+    def facet_image(self, facet_name: str) -> str:
+        for name, image in self.facet_permutation:
+            if name == facet_name:
+                return image
+        raise KeyError(f"Unknown facet: {facet_name}")
+
+    def apply(self, xv, yv) -> Point:
+        (a, b), (c, d) = self.matrix
+        px, py = as_fraction(xv), as_fraction(yv)
+        return (a * px + b * py + self.shift[0], c * px + d * py + self.shift[1])
+
+    def substitution(self, x: sp.Symbol, y: sp.Symbol) -> Dict[sp.Symbol, sp.Expr]:
+        """{x: x', y: y'} for evaluating an expression at the image point (simultaneous subs)."""
+
+        def r(v: Fraction) -> sp.Rational:
+            return sp.Rational(v.numerator, v.denominator)
+
+        (a, b), (c, d) = self.matrix
+        return {
+            x: r(a) * x + r(b) * y + r(self.shift[0]),
+            y: r(c) * x + r(d) * y + r(self.shift[1]),
+        }
+
+
+def _solve_affine(src: Sequence[Point], dst: Sequence[Point]) -> Tuple[Matrix2, Point]:
+    """Affine map sending the (non-collinear) points src[0..2] to dst[0..2]."""
+    (p0, p1, p2), (q0, q1, q2) = src[:3], dst[:3]
+    m11, m21 = p1[0] - p0[0], p1[1] - p0[1]
+    m12, m22 = p2[0] - p0[0], p2[1] - p0[1]
+    w11, w21 = q1[0] - q0[0], q1[1] - q0[1]
+    w12, w22 = q2[0] - q0[0], q2[1] - q0[1]
+    det = m11 * m22 - m12 * m21
+    if det == 0:
+        raise ValueError(f"Points {src[:3]} are collinear")
+    # A = W M^{-1}, M^{-1} = [[m22, -m12], [-m21, m11]] / det.
+    a = (w11 * m22 - w12 * m21) / det
+    b = (w12 * m11 - w11 * m12) / det
+    c = (w21 * m22 - w22 * m21) / det
+    d = (w22 * m11 - w21 * m12) / det
+    shift = (q0[0] - a * p0[0] - b * p0[1], q0[1] - c * p0[0] - d * p0[1])
+    return ((a, b), (c, d)), shift
+
+
+def affine_symmetries(region: Region2D, vertices: Sequence[Tuple[object, object]]) -> Tuple[AffineSymmetry2D, ...]:
+    """
+    Affine symmetry group of the polygon with the given cyclic vertex order, identity first.
+
+    An affine symmetry permutes the vertices dihedrally, so it is fixed by the
+    images of three consecutive vertices; each of the 2n candidates is solved
+    exactly and kept if it maps every vertex onto the predicted one. Facets must
+    each carry one polygon edge (see `Region2D.incidence`).
+    """
+    verts: List[Point] = [(as_fraction(vx), as_fraction(vy)) for vx, vy in vertices]
+    n = len(verts)
+    if n < 3:
+        raise ValueError(f"need >=3 vertices, got {n}")
+    incidence = region.incidence(vertices)
+    missing = [name for name in incidence.facet_names if name not in incidence.edges]
+    if missing:
+        raise ValueError(f"Facets without a polygon edge: {missing}")
+    facet_by_edge = {frozenset(edge): name for name, edge in incidence.edges.items()}
+
+    out: List[AffineSymmetry2D] = []
+    for direction in (1, -1):
+        for k in range(n):
+            perm = tuple((k + direction * i) % n for i in range(n))
+            matrix, shift = _solve_affine(verts, [verts[j] for j in perm])
+            (a, b), (c, d) = matrix
+            if any(
+                (a * px + b * py + shift[0], c * px + d * py + shift[1]) != verts[perm[i]]
+                for i, (px, py) in enumerate(verts)
+            ):
+                continue
+            facets = tuple(
+                (name, facet_by_edge[frozenset((perm[i], perm[j]))]) for name, (i, j) in incidence.edges.items()
+            )
+            out.append(AffineSymmetry2D(matrix, shift, perm, facets))
+    return tuple(out)
+
+
+def facet_orbits(symmetries: Sequence[AffineSymmetry2D], facet_names: Sequence[str]) -> Tuple[Tuple[str, ...], ...]:
+    """Orbits of the facets under the symmetries, each listed in `facet_names` order."""
+    orbit_of: Dict[str, int] = {}
+    orbits: List[List[str]] = []
+    for name in facet_names:
+        if name in orbit_of:
+            continue
+        images = {name} | {g.facet_image(name) for g in symmetries}
+        idx = len(orbits)
+        orbits.append([other for other in facet_names if other in images])
+        for other in images:
+            orbit_of[other] = idx
+    return tuple(tuple(orbit) for orbit in orbits)
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import contextlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+import sympy as sp
+from sympy.core import cache as sympy_cache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+F = TypeVar("F", bound=Callable)
+
+SCOPES = ("job", "process")
+
+# One real (x, y) pair for every fixture-built region, so regions rebuilt after a
+# cache clear share their symbols (and expressions in them hash alike).
+_CANONICAL_X = sp.Symbol("x", real=True)
+_CANONICAL_Y = sp.Symbol("y", real=True)
+
+
+def canonical_symbols() -> Tuple[sp.Symbol, sp.Symbol]:
+    """The process-wide real symbols (x, y) used by the fixtures."""
+    return _CANONICAL_X, _CANONICAL_Y
+
+
+class LRUCache(Generic[K, V]):
+    """Mapping with at most `maxsize` entries; the least recently used entry is evicted first."""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_or_build(self, key: K, build: Callable[[], V]) -> V:
+        """Cached value under `key`, built (and possibly evicting the oldest entry) on a miss."""
+        if key in self._data:
+            self._data.move_to_end(key)
+            return self._data[key]
+        value = build()
+        self[key] = value
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Current size of one cache; `maxsize` is None for caches bounded only by their inputs."""
+
+    name: str
+    scope: str
+    entries: int
+    maxsize: Optional[int]
+
+
+@dataclass(frozen=True)
+class _RegisteredCache:
+    scope: str
+    size: Callable[[], int]
+    clear: Callable[[], None]
+    maxsize: Optional[int]
+
+
+_REGISTRY: Dict[str, _RegisteredCache] = {}
+
+
+def register_cache(
+    name: str,
+    *,
+    size: Callable[[], int],
+    clear: Callable[[], None],
+    maxsize: Optional[int] = None,
+    scope: str = "job",
+) -> None:
+    """
+    Make a posgeo cache visible to `cache_report` and `MemoryPolicy`.
+
+    "job" caches hold data derived from the forms and charts of individual jobs;
+    "process" caches hold shared fixture data that is expensive to rebuild.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown cache scope {scope!r}; expected one of {SCOPES}")
+    _REGISTRY[name] = _RegisteredCache(scope, size, clear, maxsize)
+
+
+def register_lru_cache(name: str, fn: F, *, scope: str = "job") -> F:
+    """Register a `functools.lru_cache`-wrapped function; returns it unchanged."""
+    register_cache(
+        name,
+        size=lambda: fn.cache_info().currsize,
+        clear=fn.cache_clear,
+        maxsize=fn.cache_info().maxsize,
+        scope=scope,
+    )
+    return fn
+
+
+def sympy_cache_info() -> CacheInfo:
+    """Entries in SymPy's global cache, summed over its memoized functions (`maxsize` likewise)."""
+    entries, maxsize = 0, 0
+    for fn in sympy_cache.CACHE:
+        info = fn.cache_info()
+        entries += info.currsize
+        maxsize = None if maxsize is None or info.maxsize is None else maxsize + info.maxsize
+    return CacheInfo("sympy", "process", entries, maxsize)
+
+
+def cache_report() -> Dict[str, CacheInfo]:
+    """Sizes of SymPy's cache ("sympy") and of every registered posgeo cache."""
+    report = {"sympy": sympy_cache_info()}
+    for name, cache in _REGISTRY.items():
+        report[name] = CacheInfo(name, cache.scope, cache.size(), cache.maxsize)
+    return report
+
+
+def clear_caches(*, scope: str = "job", sympy: bool = True) -> Dict[str, int]:
+    """
+    Clear the registered caches of `scope` ("process" clears job caches too) and,
+    with `sympy`, SymPy's global cache. Returns the entries dropped per cache.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown cache scope {scope!r}; expected one of {SCOPES}")
+    scopes = SCOPES[: SCOPES.index(scope) + 1]
+    dropped: Dict[str, int] = {}
+    for name, cache in _REGISTRY.items():
+        if cache.scope in scopes:
+            dropped[name] = cache.size()
+            cache.clear()
+    if sympy:
+        dropped["sympy"] = sympy_cache_info().entries
+        sympy_cache.clear_cache()
+    return dropped
+
+
+@dataclass(frozen=True)
+class MemoryPolicy:
+    """
+    What a long-running worker releases between jobs.
+
+    `sympy_cache_limit` caps SymPy's global cache: it is cleared once it holds
+    more entries than this (0 clears after every job, None never). With
+    `clear_job_caches` the posgeo job caches (linear-factor keys, denominator
+    factorizations, chart coefficients, loaded evaluators, ...) are cleared, and
+    with `clear_process_caches` also the fixture regions and charts, which are
+    rebuilt on next use.
+    """
+
+    sympy_cache_limit: Optional[int] = 20_000
+    clear_job_caches: bool = True
+    clear_process_caches: bool = False
+
+    def __post_init__(self) -> None:
+        if self.sympy_cache_limit is not None and self.sympy_cache_limit < 0:
+            raise ValueError(f"sympy_cache_limit must be >= 0 or None, got {self.sympy_cache_limit}")
+
+    def release(self) -> Dict[str, int]:
+        """Apply the policy now; returns the entries dropped per cache."""
+        dropped: Dict[str, int] = {}
+        if self.clear_process_caches:
+            dropped.update(clear_caches(scope="process", sympy=False))
+        elif self.clear_job_caches:
+            dropped.update(clear_caches(scope="job", sympy=False))
+        # Checked last: clearing posgeo caches releases their references, not SymPy's entries.
+        entries = sympy_cache_info().entries
+        if self.sympy_cache_limit is not None and entries > self.sympy_cache_limit:
+            dropped["sympy"] = entries
+            sympy_cache.clear_cache()
+        return dropped
+
+    @contextlib.contextmanager
+    def job(self) -> Iterator[None]:
+        """Run one job, then `release` (also when the job raises)."""
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import contextlib
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import sympy as sp
+
+
+@dataclass(frozen=True)
+class ExpressionMetrics:
+    """
+    Size of one intermediate expression: `count_ops`, expression-tree node count and
+    total degree of numerator and denominator in the form variables (None when the
+    expression is not rational in them). `traced_peak_bytes` is the tracemalloc
+    peak of the enclosing stage so far (None without memory tracking).
+    """
+
+    stage: str
+    label: Optional[str]
+    ops: int
+    nodes: int
+    numerator_degree: Optional[int]
+    denominator_degree: Optional[int]
+    traced_peak_bytes: Optional[int]
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """tracemalloc peak between entering and leaving a stage, relative to the traced size on entry."""
+
+    stage: str
+    peak_bytes: int
+
+
+@dataclass
+class MetricsCollector:
+    """Records collected while `collect_metrics()` is active in the current context."""
+
+    track_memory: bool = True
+    expressions: List[ExpressionMetrics] = field(default_factory=list)
+    stages: List[StageMemory] = field(default_factory=list)
+    # Peaks of the open stages that nested `reset_peak` calls hid, innermost last.
+    _open_peaks: List[int] = field(default_factory=list, repr=False)
+
+    def as_dicts(self) -> List[Dict[str, object]]:
+        """Flat records (`kind` = "expression" or "stage") for JSON lines or a dataframe."""
+        out: List[Dict[str, object]] = [{"kind": "expression", **asdict(m)} for m in self.expressions]
+        out += [{"kind": "stage", **asdict(s)} for s in self.stages]
+        return out
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        """Per stage: expression count, maxima of ops/nodes/degree, and the largest stage peak (bytes)."""
+        names = dict.fromkeys([m.stage for m in self.expressions] + [s.stage for s in self.stages])
+        out: Dict[str, Dict[str, object]] = {}
+        for name in names:
+            records = [m for m in self.expressions if m.stage == name]
+            degrees = [
+                d for m in records for d in (m.numerator_degree, m.denominator_degree) if d is not None
+            ]
+            peaks = [s.peak_bytes for s in self.stages if s.stage == name]
+            out[name] = {
+                "expressions": len(records),
+                "max_ops": max((m.ops for m in records), default=0),
+                "max_nodes": max((m.nodes for m in records), default=0),
+                "max_degree": max(degrees, default=None),
+                "peak_bytes": max(peaks, default=None),
+            }
+        return out
+
+
+_COLLECTOR: ContextVar[Optional[MetricsCollector]] = ContextVar("posgeo_metrics_collector", default=None)
+
+
+def active_collector() -> Optional[MetricsCollector]:
+    return _COLLECTOR.get()
+
+
+@contextlib.contextmanager
+def collect_metrics(*, track_memory: bool = True) -> Iterator[MetricsCollector]:
+    """
+    Collect expression-growth (and, with `track_memory`, tracemalloc) metrics from
+    the instrumented pipeline stages run inside the block.
+
+    Tracing is started here if it is not already running and stopped on exit.
+    Outside this block the capture points cost one context-variable lookup.
+    """
+    collector = MetricsCollector(track_memory=track_memory)
+    started = track_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    token = _COLLECTOR.set(collector)
+    try:
+        yield collector
+    finally:
+        _COLLECTOR.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Record the tracemalloc peak of the enclosed block as a `StageMemory` (no-op when not collecting).
+
+    Stages may nest: `reset_peak` is global, so the peak an inner stage discards
+    is carried on the collector and merged back into the enclosing stage.
+    """
+    collector = _COLLECTOR.get()
+    if collector is None or not collector.track_memory or not tracemalloc.is_tracing():
+        yield
+        return
+    base, outer_peak = tracemalloc.get_traced_memory()
+    if collector._open_peaks:
+        collector._open_peaks[-1] = max(collector._open_peaks[-1], outer_peak)
+    collector._open_peaks.append(0)
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, collector._open_peaks.pop())
+        if collector._open_peaks:
+            collector._open_peaks[-1] = max(collector._open_peaks[-1], peak)
+        collector.stages.append(StageMemory(stage=name, peak_bytes=max(peak - base, 0)))
+
+
+def _total_degree(expr: sp.Expr, variables: Sequence[sp.Symbol]) -> Optional[int]:
+    try:
+        return sp.Poly(expr, *variables).total_degree()
+    except (sp.PolynomialError, sp.GeneratorsNeeded):
+        return None
+
+
+def record_expression(
+    stage_name: str,
+    expr: sp.Expr,
+    *,
+    variables: Sequence[sp.Symbol] = (),
+    label: Optional[str] = None,
+) -> None:
+    """Append `ExpressionMetrics` for `expr` to the active collector, if any."""
+    collector = _COLLECTOR.get()
+    if collector is None:
+        return
+    expr = sp.sympify(expr)
+    numerator_degree = denominator_degree = None
+    if variables:
+        numerator, denominator = sp.fraction(expr)
+        numerator_degree = _total_degree(numerator, variables)
+        denominator_degree = _total_degree(denominator, variables)
+    peak = None
+    if collector.track_memory and tracemalloc.is_tracing():
+        peak = max([tracemalloc.get_traced_memory()[1], *collector._open_peaks[-1:]])
+    collector.expressions.append(
+        ExpressionMetrics(
+            stage=stage_name,
+            label=label,
+            ops=int(sp.count_ops(expr)),
+            nodes=sum(1 for _ in sp.preorder_traversal(expr)),
+            numerator_degree=numerator_degree,
+            denominator_degree=denominator_degree,
+            traced_peak_bytes=peak,
+        )
+    )
@@ -10,12 +10,22 @@ from .preconditions import (
     assert_canonical_scope,
     validate_canonical_scope,
 )
+from .laurent_numeric import (
+    LaurentEstimate,
+    estimate_chart_laurent,
+    laurent_coefficients_fft,
+    screen_chart_orders,
+)
 from .singularity_gate import (
     ChartOrderCheck,
+    DenominatorFindings,
+    GateContext,
     SingularityReport,
     assert_no_pole_locus,
     assert_log_pure,
     has_pole_locus,
+    iter_singularity_findings,
+    linear_factor_key,
     normalize_linear_factor,
     normalized_denominator_factors,
     singularity_report,
@@ -27,9 +37,17 @@ __all__ = [
     "assert_canonical_scope",
     "assert_no_pole_locus",
     "assert_log_pure",
+    "estimate_chart_laurent",
+    "laurent_coefficients_fft",
+    "screen_chart_orders",
     "ChartOrderCheck",
+    "DenominatorFindings",
+    "GateContext",
+    "LaurentEstimate",
     "SingularityReport",
     "has_pole_locus",
+    "iter_singularity_findings",
+    "linear_factor_key",
     "normalize_linear_factor",
     "normalized_denominator_factors",
     "singularity_report",
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence, Tuple
+
+import sympy as sp
+
+from posgeo.forms.residues2d import FacetChart
+from posgeo.typing import Canonical2Form
+
+# Roundoff floor, in machine epsilons of the largest sample per unit of 1/radius:
+# the facet value u is recovered from O(1) coordinates, losing log2(1/radius) bits.
+_ROUNDOFF_ULPS = 16
+# Safety factor on the noise measured at the extreme frequencies.
+_NOISE_FACTOR = 4.0
+# A coefficient is significant when it exceeds its error bound by this factor.
+_SIGNIFICANCE = 10.0
+
+
+@dataclass(frozen=True)
+class LaurentEstimate:
+    """
+    Numeric Laurent data of u*f along one facet chart, for a batch of t values.
+
+    `coefficients[i, j]` estimates the coefficient of u**orders[j] in
+    u*f(x(u, t_i), y(u, t_i)), with `error_bounds[i, j]` bounding roundoff and
+    aliasing. `pole_orders[i]` is the estimated pole order of f along u = 0 at
+    t_i (-1 where samples were not finite), and `residues` = s * (u^0
+    coefficient) is the chart residue prefactor at t_i.
+    """
+
+    facet_name: str
+    chart_name: str
+    t_values: Any
+    orders: Any
+    coefficients: Any
+    error_bounds: Any
+    pole_orders: Any
+    residues: Any
+    residue_errors: Any
+
+    @property
+    def max_pole_order(self) -> int:
+        return int(self.pole_orders.max(initial=-1))
+
+    @property
+    def passed(self) -> bool:
+        """Simple pole with nonzero residue at every sampled t (finite samples only)."""
+        finite = self.pole_orders >= 0
+        return bool(finite.any() and (self.pole_orders[finite] == 1).all())
+
+
+def laurent_coefficients_fft(
+    expr: sp.Expr,
+    u: sp.Symbol,
+    t: sp.Symbol,
+    t_values,
+    *,
+    radius: float = 1 / 16,
+    samples: int = 64,
+):
+    """
+    (orders, coefficients, error_bounds) of the Laurent series of expr(u, t) in u
+    around u = 0, for each t in `t_values`.
+
+    expr is evaluated at u_j = radius * exp(2 pi i j / samples) for all t at once;
+    the FFT then gives sum_m a_{k + m N} radius**(k + m N) for k in
+    [-N/2, N/2). Dividing by radius**k estimates a_k, up to aliasing from the
+    series tail and roundoff, both measured at the extreme frequencies. The
+    circle must lie in the punctured disc where the series converges, i.e.
+    `radius` must be smaller than the distance from u = 0 to any other
+    singularity at the sampled t.
+    """
+    import numpy as np
+
+    if samples < 8 or samples % 2:
+        raise ValueError(f"samples must be an even number >= 8, got {samples}")
+    ts = np.asarray(t_values, dtype=float).reshape(-1, 1)
+    us = radius * np.exp(2j * np.pi * np.arange(samples) / samples)[None, :]
+    fn = sp.lambdify((u, t), expr, "numpy")
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = np.broadcast_to(fn(us, ts), (ts.shape[0], samples)).astype(complex)
+        aliased = np.fft.fft(values, axis=1) / samples
+
+    orders = np.arange(-samples // 2, samples // 2)
+    aliased = np.concatenate([aliased[:, samples // 2:], aliased[:, : samples // 2]], axis=1)
+    scale = float(radius) ** orders
+    peak = np.abs(values).max(axis=1, initial=0.0)
+    roundoff = _ROUNDOFF_ULPS * np.finfo(float).eps * peak / min(float(radius), 1.0)
+    # The extreme frequencies hold only the aliased series tail (a pole of order
+    # < N/2 - 4 leaves the lowest ones exactly zero) plus evaluation noise, so
+    # they measure both error sources empirically.
+    noise = np.abs(np.concatenate([aliased[:, :4], aliased[:, -4:]], axis=1)).max(axis=1)
+    errors = (roundoff + _NOISE_FACTOR * noise)[:, None] / scale[None, :]
+    coefficients = aliased / scale[None, :]
+    bad = ~np.isfinite(values).all(axis=1)
+    coefficients[bad] = np.nan
+    errors[bad] = np.inf
+    return orders, coefficients, errors
+
+
+def estimate_chart_laurent(
+    form: Canonical2Form,
+    facet_name: str,
+    chart: FacetChart,
+    t_values,
+    *,
+    radius: float = 1 / 16,
+    samples: int = 64,
+    depth: int = 4,
+) -> LaurentEstimate:
+    """
+    Numeric counterpart of the gate's chart-order limits: Laurent coefficients of
+    u*f along `chart` for u**k, |k| <= depth, pole orders and residues with error
+    bounds. No limits, simplification or cancellation are performed.
+    """
+    import numpy as np
+
+    g = chart.u * form.prefactor.subs({form.x: chart.x_of, form.y: chart.y_of}, simultaneous=True)
+    orders, coefficients, errors = laurent_coefficients_fft(
+        g, chart.u, chart.t, t_values, radius=radius, samples=samples
+    )
+    significant = np.abs(coefficients) > _SIGNIFICANCE * errors
+    # Lowest significant power of u in u*f; the pole order of f is 1 - k_min (0 if none).
+    first = np.where(significant.any(axis=1), significant.argmax(axis=1), -1)
+    pole_orders = np.where(first >= 0, np.maximum(1 - orders[np.maximum(first, 0)], 0), 0)
+    pole_orders = np.where(np.isfinite(coefficients).all(axis=1), pole_orders, -1)
+
+    keep = np.abs(orders) <= depth
+    zero = int(np.flatnonzero(orders == 0)[0])
+    s = complex(chart.s)
+    return LaurentEstimate(
+        facet_name=facet_name,
+        chart_name=chart.name,
+        t_values=np.asarray(t_values, dtype=float).ravel(),
+        orders=orders[keep],
+        coefficients=coefficients[:, keep],
+        error_bounds=errors[:, keep],
+        pole_orders=pole_orders.astype(int),
+        residues=s * coefficients[:, zero],
+        residue_errors=abs(s) * errors[:, zero],
+    )
+
+
+def screen_chart_orders(
+    form: Canonical2Form,
+    charts: Mapping[str, Sequence[FacetChart]],
+    t_values,
+    *,
+    radius: float = 1 / 16,
+    samples: int = 64,
+) -> Tuple[LaurentEstimate, ...]:
+    """
+    Fast numeric screen of every chart in `charts` (same layout as `GateContext`),
+    in chart order; confirm candidates that pass with the exact gate.
+    """
+    return tuple(
+        estimate_chart_laurent(form, facet_name, chart, t_values, radius=radius, samples=samples)
+        for facet_name, facet_charts in charts.items()
+        for chart in facet_charts
+    )
@@ -120,11 +120,9 @@ def validate_canonical_scope(
             )
 
     # Boundary coverage sanity: each vertex should sit on at least two facets (polygon corners).
+    incidence = region.incidence(vertices)
     for i, (vx, vy) in enumerate(vertices):
-        hits = 0
-        for ln in region.facets.values():
-            if sp.simplify(ln.expr.subs({x: vx, y: vy})) == 0:
-                hits += 1
+        hits = incidence.facet_count_at(i)
         if hits < 2:
             issues.append(
                 ScopeViolation(
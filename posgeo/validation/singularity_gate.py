@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Mapping, Sequence, Tuple
+from dataclasses import dataclass, replace
+from fractions import Fraction
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
 
 import sympy as sp
 
-from posgeo.forms.residues2d import FacetChart
+from posgeo.forms.residues2d import (
+    FacetChart,
+    chart_affine_coefficients,
+    form_is_invariant,
+    symmetric_chart_sources,
+)
+from posgeo.geometry.lines import LinearForm
 from posgeo.geometry.region2d import Region2D
+from posgeo.geometry.symmetry2d import AffineSymmetry2D
+from posgeo.memory import LRUCache, register_cache, register_lru_cache
+from posgeo.metrics import record_expression, stage
 from posgeo.typing import Canonical2Form
 
 
@@ -28,55 +40,180 @@ class SingularityReport:
     boundary_mapping_status: bool
     local_chart_order_checks: Tuple[ChartOrderCheck, ...]
     failure_reasons: Tuple[str, ...]
+    # False for fail-fast reports that stopped before checking every chart.
+    complete: bool = True
 
     @property
     def passed(self) -> bool:
         return len(self.failure_reasons) == 0
 
 
-def normalize_linear_factor(expr: sp.Expr, *vars: sp.Symbol) -> sp.Expr:
-    """Normalize a linear factor up to overall nonzero rational scale."""
-    if not vars:
-        raise ValueError("At least one variable symbol is required.")
+@dataclass(frozen=True)
+class DenominatorFindings:
+    """Denominator-level part of a gate run: pole loci, multiplicities and their failure reasons."""
+
+    detected_pole_loci: Tuple[sp.Expr, ...]
+    multiplicities: Tuple[Tuple[sp.Expr, int], ...]
+    boundary_mapping_status: bool
+    failure_reasons: Tuple[str, ...]
+
+
+GateFinding = Union[DenominatorFindings, ChartOrderCheck]
 
-    poly = sp.Poly(sp.factor(expr), *vars, domain="QQ")
 
-    coeffs = [sp.Rational(poly.coeff_monomial(v)) for v in vars]
-    constant = sp.Rational(poly.coeff_monomial(1))
+LinearKey = Tuple[int, ...]
 
-    denoms = [sp.denom(c) for c in (*coeffs, constant)]
-    lcm = sp.ilcm(*[int(d) for d in denoms if d != 0] or [1])
+# Intern table: equal normalized factors share one key object. LRU-bounded like
+# `linear_factor_key`; an evicted key is only re-interned, never invalid (keys
+# compare by value).
+_INTERNED_LINEAR_KEYS: LRUCache[LinearKey, LinearKey] = LRUCache(4096)
 
-    ints = [int(c * lcm) for c in (*coeffs, constant)]
+
+def _intern_linear_key(key: LinearKey) -> LinearKey:
+    return _INTERNED_LINEAR_KEYS.get_or_build(key, lambda: key)
+
+
+def _primitive_signed_key(coeffs: Sequence[sp.Rational]) -> LinearKey:
+    """Primitive integers proportional to `coeffs`, first nonzero entry positive (all zeros for 0)."""
+    lcm = math.lcm(*(int(c.q) for c in coeffs))
+    ints = [int(c.p) * (lcm // int(c.q)) for c in coeffs]
 
     g = 0
     for value in ints:
         g = math.gcd(g, abs(value))
-
     if g == 0:
-        return sp.Integer(0)
+        return _intern_linear_key(tuple(ints))
 
     ints = [value // g for value in ints]
-
     for value in ints:
         if value != 0:
             if value < 0:
                 ints = [-val for val in ints]
             break
-
-    linear = sum(sp.Rational(ai) * v for ai, v in zip(ints[:-1], vars)) + sp.Rational(ints[-1])
+    return _intern_linear_key(tuple(ints))
+
+
+@lru_cache(maxsize=4096)
+def linear_factor_key(expr: sp.Expr, vars: Tuple[sp.Symbol, ...]) -> Optional[LinearKey]:
+    """
+    Interned key `(a_1, ..., a_k, c)` of a linear factor up to nonzero rational scale.
+
+    Terms are read directly off the expression (rational coefficient times a variable
+    or 1), so no factorization or Poly conversion is involved. Returns None for
+    expressions not written as such a sum; `normalize_linear_factor` then falls back
+    to the Poly path.
+    """
+    index = {v: i for i, v in enumerate(vars)}
+    coeffs = [sp.Integer(0)] * (len(vars) + 1)
+    for term in sp.Add.make_args(sp.sympify(expr)):
+        coeff, rest = term.as_coeff_Mul()
+        if not coeff.is_Rational:
+            return None
+        if rest is sp.S.One:
+            coeffs[-1] += coeff
+        elif rest in index:
+            coeffs[index[rest]] += coeff
+        else:
+            return None
+    return _primitive_signed_key(coeffs)
+
+
+@lru_cache(maxsize=4096)
+def _linear_key_expr(key: LinearKey, vars: Tuple[sp.Symbol, ...]) -> sp.Expr:
+    """Display expression of a normalized key; built once per (key, vars)."""
+    if not any(key):
+        return sp.Integer(0)
+    linear = sum(sp.Rational(ai) * v for ai, v in zip(key[:-1], vars)) + sp.Rational(key[-1])
     return sp.factor(linear)
 
 
-def normalized_denominator_factors(prefactor: sp.Expr, *vars: sp.Symbol) -> Tuple[Tuple[sp.Expr, int], ...]:
-    """Return normalized `(factor, multiplicity)` pairs from denominator factorization."""
-    denom = sp.factor(sp.denom(prefactor))
-    factors = sp.factor_list(denom)[1]
-    return tuple((normalize_linear_factor(factor, *vars), multiplicity) for factor, multiplicity in factors)
+def normalize_linear_factor(expr: sp.Expr, *vars: sp.Symbol) -> sp.Expr:
+    """Normalize a linear factor up to overall nonzero rational scale."""
+    if not vars:
+        raise ValueError("At least one variable symbol is required.")
+
+    key = linear_factor_key(expr, vars)
+    if key is None:
+        poly = sp.Poly(sp.factor(expr), *vars, domain="QQ")
+        coeffs = [sp.Rational(poly.coeff_monomial(v)) for v in vars]
+        key = _primitive_signed_key([*coeffs, sp.Rational(poly.coeff_monomial(1))])
+    return _linear_key_expr(key, vars)
+
+
+def normalized_denominator_factors(
+    prefactor: sp.Expr,
+    *vars: sp.Symbol,
+    known_factors: Optional[Iterable[LinearForm]] = None,
+) -> Tuple[Tuple[sp.Expr, int], ...]:
+    """
+    Return normalized `(factor, multiplicity)` pairs from denominator factorization.
+
+    With `known_factors` (e.g. facet lines and triangulation diagonals, as integer
+    forms in `(x, y)`), the denominator is first trial-divided by each known line
+    in QQ[x, y]; only the leftover cofactor goes through general factorization.
+    Results are memoized per `(prefactor, vars, known_factors)`.
+    """
+    known = tuple(dict.fromkeys(form.canonical() for form in known_factors)) if known_factors is not None else ()
+    return _denominator_factors_cached(prefactor, vars, known)
+
+
+@lru_cache(maxsize=256)
+def _denominator_factors_cached(
+    prefactor: sp.Expr,
+    vars: Tuple[sp.Symbol, ...],
+    known: Tuple[LinearForm, ...],
+) -> Tuple[Tuple[sp.Expr, int], ...]:
+    if not known:
+        denom = sp.factor(sp.denom(prefactor))
+        factors = sp.factor_list(denom)[1]
+        return tuple((normalize_linear_factor(factor, *vars), multiplicity) for factor, multiplicity in factors)
+
+    if len(vars) != 2:
+        raise ValueError("Known-factor trial division needs exactly two variables (x, y).")
+    x, y = vars
+    cofactor = sp.Poly(sp.denom(prefactor), x, y, domain="QQ")
+    out: list[Tuple[sp.Expr, int]] = []
+    for form in known:
+        if cofactor.total_degree() == 0:
+            break
+        line = sp.Poly(form.as_expr(x, y), x, y, domain="QQ")
+        multiplicity = 0
+        while cofactor.total_degree() > 0:
+            quotient, remainder = cofactor.div(line)
+            if not remainder.is_zero:
+                break
+            cofactor = quotient
+            multiplicity += 1
+        if multiplicity:
+            out.append((normalize_linear_factor(form.as_expr(x, y), x, y), multiplicity))
+
+    if cofactor.total_degree() > 0:
+        for factor, multiplicity in sp.factor_list(cofactor.as_expr(), x, y)[1]:
+            out.append((normalize_linear_factor(factor, x, y), multiplicity))
+    return tuple(out)
+
+
+register_cache(
+    "singularity_gate.interned_linear_keys",
+    size=_INTERNED_LINEAR_KEYS.__len__,
+    clear=_INTERNED_LINEAR_KEYS.clear,
+    maxsize=_INTERNED_LINEAR_KEYS.maxsize,
+)
+register_lru_cache("singularity_gate.linear_factor_key", linear_factor_key)
+register_lru_cache("singularity_gate.linear_key_expr", _linear_key_expr)
+register_lru_cache("singularity_gate.denominator_factors", _denominator_factors_cached)
 
 
 def has_pole_locus(prefactor: sp.Expr, locus_expr: sp.Expr, *vars: sp.Symbol) -> bool:
-    """Return whether `locus_expr` appears as a (normalized) denominator pole factor."""
+    """
+    Return whether `locus_expr` appears as a (normalized) denominator pole factor.
+
+    A linear locus is tested by exact division of the denominator, without factoring it.
+    """
+    key = linear_factor_key(locus_expr, vars)
+    if key is not None and any(key[:-1]):
+        locus = sp.Poly(locus_expr, *vars, domain="QQ")
+        return sp.Poly(sp.denom(prefactor), *vars, domain="QQ").rem(locus).is_zero
     normalized_locus = normalize_linear_factor(locus_expr, *vars)
     factors = normalized_denominator_factors(prefactor, *vars)
     return normalized_locus in {factor for factor, _ in factors}
@@ -93,85 +230,269 @@ def _is_invalid_symbolic_value(expr: sp.Expr) -> bool:
     return bool(val.has(sp.nan) or val.has(sp.zoo) or val is sp.oo or val is -sp.oo)
 
 
-def _check_chart_local_orders(
-    prefactor: sp.Expr,
-    x: sp.Symbol,
-    y: sp.Symbol,
-    charts: Mapping[str, Sequence[FacetChart]],
-) -> Tuple[ChartOrderCheck, ...]:
-    checks: list[ChartOrderCheck] = []
-    for facet_name, facet_charts in charts.items():
-        for chart in facet_charts:
-            f_ut = sp.simplify(prefactor.subs({x: chart.x_of, y: chart.y_of}))
-            lim1 = sp.simplify(sp.limit(chart.u * f_ut, chart.u, 0))
-            lim2 = sp.simplify(sp.limit((chart.u**2) * f_ut, chart.u, 0))
-
-            reasons: list[str] = []
-            if _is_invalid_symbolic_value(lim1):
-                reasons.append("chart-first-order-invalid")
-            elif sp.simplify(lim1) == 0:
-                reasons.append("chart-first-order-zero")
-
-            if _is_invalid_symbolic_value(lim2):
-                reasons.append("chart-second-order-invalid")
-            elif sp.simplify(lim2) != 0:
-                reasons.append("chart-second-order-nonzero")
-
-            checks.append(
-                ChartOrderCheck(
-                    facet_name=facet_name,
-                    chart_name=chart.name,
-                    first_order_limit=lim1,
-                    second_order_limit=lim2,
-                    passed=len(reasons) == 0,
-                    failure_reasons=tuple(reasons),
-                )
-            )
+def _chart_order_check(facet_name: str, chart: FacetChart, lim1: sp.Expr, lim2: sp.Expr) -> ChartOrderCheck:
+    reasons: list[str] = []
+    if _is_invalid_symbolic_value(lim1):
+        reasons.append("chart-first-order-invalid")
+    elif sp.simplify(lim1) == 0:
+        reasons.append("chart-first-order-zero")
+
+    if _is_invalid_symbolic_value(lim2):
+        reasons.append("chart-second-order-invalid")
+    elif sp.simplify(lim2) != 0:
+        reasons.append("chart-second-order-nonzero")
+
+    return ChartOrderCheck(
+        facet_name=facet_name,
+        chart_name=chart.name,
+        first_order_limit=lim1,
+        second_order_limit=lim2,
+        passed=len(reasons) == 0,
+        failure_reasons=tuple(reasons),
+    )
+
 
-    return tuple(checks)
+@dataclass(frozen=True)
+class _PreparedChart:
+    facet_name: str
+    chart: FacetChart
+    substitution: Mapping[sp.Symbol, sp.Expr]
+    inverse: Optional[Tuple[sp.Expr, sp.Expr]]  # (u, t) in terms of (x, y)
+    line_key: Optional[LinearKey]
+
+
+class GateContext:
+    """
+    Per-(region, charts) state for running the log-purity gate over many forms.
+
+    Built once: the facet forms used as trial divisors and boundary keys, the chart
+    substitution maps, and the affine chart inverses (u, t)(x, y), whose u-component
+    identifies the facet line each chart resolves. Per form, the denominator
+    multiplicity of that line decides how much work a chart needs: none for 0
+    (both limits vanish), one cancellation and substitution for 1, and the full
+    limit computation otherwise.
+
+    With `symmetries` (see `affine_symmetries`), a chart that is the image g o c of
+    an earlier chart c reuses c's limits, scaled by 1/|det A|, for every form
+    that is exactly g-invariant.
+
+    `known_lines` (e.g. `Triangulation2D.edge_forms()`) are trial divisors on top
+    of the facets, so spurious triangulation diagonals left in a denominator are
+    found without general factorization; they are not boundary lines.
+    """
+
+    def __init__(
+        self,
+        region: Region2D,
+        charts: Mapping[str, Sequence[FacetChart]],
+        *,
+        symmetries: Sequence[AffineSymmetry2D] = (),
+        known_lines: Iterable[LinearForm] = (),
+    ) -> None:
+        self.region = region
+        self.x, self.y = region.x, region.y
+        self.facet_forms: Tuple[LinearForm, ...] = tuple(f.form for f in region.facets.values())
+        self.known_factors: Tuple[LinearForm, ...] = (*self.facet_forms, *known_lines)
+        self.boundary_keys = frozenset(_intern_linear_key(form.canonical().coefficients) for form in self.facet_forms)
+        self.charts: Tuple[_PreparedChart, ...] = tuple(
+            self._prepare(facet_name, chart)
+            for facet_name, facet_charts in charts.items()
+            for chart in facet_charts
+        )
+        refs = [(facet_name, index) for facet_name, facet_charts in charts.items() for index in range(len(facet_charts))]
+        flat_index = {ref: k for k, ref in enumerate(refs)}
+        # Position in `self.charts` -> (position of the source chart, symmetry).
+        self.chart_sources: Dict[int, Tuple[int, AffineSymmetry2D]] = {
+            flat_index[ref]: (flat_index[source], g)
+            for ref, (source, g) in symmetric_chart_sources(charts, symmetries).items()
+        }
+
+    def _prepare(self, facet_name: str, chart: FacetChart) -> _PreparedChart:
+        substitution = MappingProxyType({self.x: chart.x_of, self.y: chart.y_of})
+        try:
+            (x0, xu, xt), (y0, yu, yt) = chart_affine_coefficients(chart)
+        except ValueError:
+            return _PreparedChart(facet_name, chart, substitution, None, None)
+        det = xu * yt - xt * yu
+        if det == 0:
+            return _PreparedChart(facet_name, chart, substitution, None, None)
+        dx = self.x - sp.Rational(x0.numerator, x0.denominator)
+        dy = self.y - sp.Rational(y0.numerator, y0.denominator)
+
+        def r(v: Fraction) -> sp.Rational:
+            return sp.Rational(v.numerator, v.denominator)
+
+        u_of = r(yt / det) * dx - r(xt / det) * dy
+        t_of = r(-yu / det) * dx + r(xu / det) * dy
+        return _PreparedChart(facet_name, chart, substitution, (u_of, t_of), linear_factor_key(u_of, (self.x, self.y)))
+
+    def iter_check(self, form: Canonical2Form) -> Iterator[GateFinding]:
+        """
+        Stream the gate: first the `DenominatorFindings` (one factorization), then
+        one `ChartOrderCheck` per chart, in chart order, as each completes.
+        Closing the generator early skips the remaining chart work.
+        """
+        if (form.x, form.y) != (self.x, self.y):
+            raise ValueError(f"Form variables {(form.x, form.y)} do not match region variables {(self.x, self.y)}")
+        # One reduced fraction: sp.denom of an uncombined sum (e.g. a triangle sum or
+        # `apart` output) is 1, which would hide every pole from the shortcuts below.
+        prefactor = sp.cancel(form.prefactor)
+        factors = normalized_denominator_factors(prefactor, self.x, self.y, known_factors=self.known_factors)
+        keys = [linear_factor_key(factor, (self.x, self.y)) for factor, _ in factors]
+        multiplicity_by_key = {key: m for key, (_, m) in zip(keys, factors)}
+
+        non_boundary = {factor for key, (factor, _) in zip(keys, factors) if key not in self.boundary_keys}
+        boundary_ok = len(non_boundary) == 0
+
+        failure_reasons: list[str] = []
+        if not boundary_ok:
+            failure_reasons.append("non-boundary-pole")
+
+        if any(multiplicity != 1 for _, multiplicity in factors):
+            failure_reasons.append("non-simple-multiplicity")
+
+        yield DenominatorFindings(
+            detected_pole_loci=tuple(factor for factor, _ in factors),
+            multiplicities=factors,
+            boundary_mapping_status=boundary_ok,
+            failure_reasons=tuple(failure_reasons),
+        )
+
+        invariant: Dict[AffineSymmetry2D, bool] = {}
+        chart_checks: list[ChartOrderCheck] = []
+        for k, prepared in enumerate(self.charts):
+            with stage("gate-chart"):
+                source = self.chart_sources.get(k)
+                if source is not None:
+                    src, g = source
+                    if g not in invariant:
+                        invariant[g] = form_is_invariant(form, g)
+                if source is not None and invariant[g]:
+                    check = self._transport_check(chart_checks[src], self.charts[src], prepared, g)
+                else:
+                    check = self._check_chart(prefactor, prepared, multiplicity_by_key)
+                record_expression(
+                    "gate-chart",
+                    check.first_order_limit,
+                    variables=(prepared.chart.t,),
+                    label=f"{prepared.facet_name}/{prepared.chart.name}",
+                )
+            chart_checks.append(check)
+            yield check
+
+    def check(self, form: Canonical2Form, *, fail_fast: bool = False) -> SingularityReport:
+        """
+        Gate report for `form`. With `fail_fast`, stop at the first failure: after
+        the denominator findings if they fail (no chart is checked), else after
+        the first failing chart. The report then holds the checks done so far and
+        has `complete=False` unless every chart was checked.
+        """
+        findings = self.iter_check(form)
+        denominator = next(findings)
+        failure_reasons = list(denominator.failure_reasons)
+        chart_checks: list[ChartOrderCheck] = []
+        if not (fail_fast and failure_reasons):
+            for check in findings:
+                chart_checks.append(check)
+                if fail_fast and not check.passed:
+                    break
+        findings.close()
+        if any(not check.passed for check in chart_checks):
+            failure_reasons.append("chart-order-failed")
+
+        return SingularityReport(
+            detected_pole_loci=denominator.detected_pole_loci,
+            multiplicities=denominator.multiplicities,
+            boundary_mapping_status=denominator.boundary_mapping_status,
+            local_chart_order_checks=tuple(chart_checks),
+            failure_reasons=tuple(failure_reasons),
+            complete=len(chart_checks) == len(self.charts),
+        )
+
+    @staticmethod
+    def _transport_check(
+        check: ChartOrderCheck,
+        source: _PreparedChart,
+        prepared: _PreparedChart,
+        symmetry: AffineSymmetry2D,
+    ) -> ChartOrderCheck:
+        """u^k f along g o c equals u^k f along c divided by |det A|, so the verdict carries over."""
+        det = abs(symmetry.det)
+        scale = sp.Rational(det.denominator, det.numerator)
+        rename = {source.chart.t: prepared.chart.t}
+        return replace(
+            check,
+            facet_name=prepared.facet_name,
+            chart_name=prepared.chart.name,
+            first_order_limit=scale * check.first_order_limit.subs(rename),
+            second_order_limit=scale * check.second_order_limit.subs(rename),
+        )
+
+    def check_many(self, forms: Iterable[Canonical2Form]) -> Tuple[SingularityReport, ...]:
+        """Reports for `forms` in order; repeated (x, y, prefactor) triples are gated once."""
+        seen: Dict[Tuple[sp.Symbol, sp.Symbol, sp.Expr], SingularityReport] = {}
+        reports = []
+        for form in forms:
+            key = (form.x, form.y, form.prefactor)
+            if key not in seen:
+                seen[key] = self.check(form)
+            reports.append(seen[key])
+        return tuple(reports)
+
+    def _check_chart(
+        self,
+        prefactor: sp.Expr,
+        prepared: _PreparedChart,
+        multiplicity_by_key: Mapping[Optional[LinearKey], int],
+    ) -> ChartOrderCheck:
+        chart = prepared.chart
+        if prepared.line_key is not None and multiplicity_by_key.get(prepared.line_key, 0) == 0:
+            # No pole along u = 0: u*f and u^2*f vanish there identically.
+            return _chart_order_check(prepared.facet_name, chart, sp.Integer(0), sp.Integer(0))
+        if prepared.line_key is not None and multiplicity_by_key[prepared.line_key] == 1:
+            # Simple pole along u = 0: u*f is regular there, so both limits are substitutions.
+            numer, denom = sp.fraction(sp.cancel(chart.u * prefactor.subs(prepared.substitution)))
+            denom_at_0 = sp.expand(denom.subs(chart.u, 0))
+            if denom_at_0 != 0:
+                lim1 = sp.simplify(numer.subs(chart.u, 0) / denom_at_0)
+                return _chart_order_check(prepared.facet_name, chart, lim1, sp.Integer(0))
+        f_ut = sp.simplify(prefactor.subs(prepared.substitution))
+        lim1 = sp.simplify(sp.limit(chart.u * f_ut, chart.u, 0))
+        lim2 = sp.simplify(sp.limit((chart.u**2) * f_ut, chart.u, 0))
+        return _chart_order_check(prepared.facet_name, chart, lim1, lim2)
 
 
 def singularity_report(
     form: Canonical2Form,
     region: Region2D,
     charts: Mapping[str, Sequence[FacetChart]],
+    *,
+    fail_fast: bool = False,
+    known_lines: Iterable[LinearForm] = (),
 ) -> SingularityReport:
-    factors = normalized_denominator_factors(form.prefactor, form.x, form.y)
-    detected_loci = tuple(factor for factor, _ in factors)
-
-    boundary_factors = {
-        normalize_linear_factor(f.expr, form.x, form.y)
-        for f in region.facets.values()
-    }
-    non_boundary = {factor for factor, _ in factors if factor not in boundary_factors}
-    boundary_ok = len(non_boundary) == 0
-
-    failure_reasons: list[str] = []
-    if not boundary_ok:
-        failure_reasons.append("non-boundary-pole")
-
-    if any(multiplicity != 1 for _, multiplicity in factors):
-        failure_reasons.append("non-simple-multiplicity")
-
-    chart_checks = _check_chart_local_orders(form.prefactor, form.x, form.y, charts)
-    if any(not check.passed for check in chart_checks):
-        failure_reasons.append("chart-order-failed")
-
-    return SingularityReport(
-        detected_pole_loci=detected_loci,
-        multiplicities=factors,
-        boundary_mapping_status=boundary_ok,
-        local_chart_order_checks=chart_checks,
-        failure_reasons=tuple(failure_reasons),
-    )
+    return GateContext(region, charts, known_lines=known_lines).check(form, fail_fast=fail_fast)
+
+
+def iter_singularity_findings(
+    form: Canonical2Form,
+    region: Region2D,
+    charts: Mapping[str, Sequence[FacetChart]],
+    *,
+    known_lines: Iterable[LinearForm] = (),
+) -> Iterator[GateFinding]:
+    """Streaming `singularity_report`: see `GateContext.iter_check`."""
+    return GateContext(region, charts, known_lines=known_lines).iter_check(form)
 
 
 def assert_log_pure(
     form: Canonical2Form,
     region: Region2D,
     charts: Mapping[str, Sequence[FacetChart]],
+    *,
+    fail_fast: bool = False,
+    known_lines: Iterable[LinearForm] = (),
 ) -> SingularityReport:
-    report = singularity_report(form, region, charts)
+    report = singularity_report(form, region, charts, fail_fast=fail_fast, known_lines=known_lines)
     if report.passed:
         return report
 
@@ -0,0 +1,83 @@
+from fractions import Fraction
+from types import MappingProxyType
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.boundary_first2d import canonical_form_boundary_first, solve_boundary_numerator
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.dual2d import DualPolygonEvaluator
+from posgeo.forms.residues2d import FacetChart
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+from posgeo.geometry.region2d import Region2D
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+def _lattice_polygon_with_unimodular_charts(verts):
+    """Region with primitive edge lines and charts x = v + t*(-b, a) + u*(alpha, beta), a*alpha + b*beta = 1."""
+    x, y = sp.symbols("x y", real=True)
+    facets, charts = {}, {}
+    n = len(verts)
+    for i in range(n):
+        p, q = verts[i], verts[(i + 1) % n]
+        form = LinearForm.through_points(p, q)
+        alpha, beta, _ = sp.gcdex(form.a, form.b)
+        u, t = sp.symbols(f"u__E{i} t__E{i}", real=True)
+        name = f"E{i}"
+        facets[name] = OrientedLine2D.from_form(x, y, form)
+        charts[name] = [FacetChart(name, u, t, p[0] - form.b * t + alpha * u, p[1] + form.a * t + beta * u, sp.Integer(1))]
+    return Region2D(x=x, y=y, facets=MappingProxyType(facets)), charts
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_boundary_first_matches_triangulation_engine(geometry_case, monkeypatch):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    reference = canonical_form_from_triangulation(geometry_case.tri_a(x, y)).prefactor
+
+    def _no_simplify(*args, **kwargs):
+        raise AssertionError("boundary-first solver must not call sp.simplify")
+
+    monkeypatch.setattr(sp, "simplify", _no_simplify)
+    solved = canonical_form_boundary_first(region, geometry_case.vertices(), charts).prefactor
+    monkeypatch.undo()
+
+    assert sp.simplify(solved - reference) == 0
+
+
+def test_boundary_first_orientation_follows_vertex_order():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    charts = geometry_case.facet_charts(region.x, region.y)
+    verts = list(geometry_case.vertices())
+
+    forward = solve_boundary_numerator(region, verts, charts)
+    backward = solve_boundary_numerator(region, verts[::-1], charts)
+    assert backward == {m: -c for m, c in forward.items()}
+
+
+def test_boundary_first_handles_many_vertices():
+    verts = [(0, 0), (3, -1), (6, -1), (9, 0), (11, 2), (12, 5), (12, 8), (10, 11), (7, 12), (3, 11), (1, 9), (-1, 5)]
+    region, charts = _lattice_polygon_with_unimodular_charts(verts)
+    x, y = region.x, region.y
+
+    prefactor = canonical_form_boundary_first(region, verts, charts).prefactor
+    evaluator = DualPolygonEvaluator(verts)
+    for px, py in [(Fraction(11, 2), Fraction(5, 3)), (Fraction(2, 7), Fraction(9, 4))]:
+        exact = evaluator(px, py)
+        assert prefactor.subs({x: sp.Rational(px), y: sp.Rational(py)}) == sp.Rational(exact.numerator, exact.denominator)
+
+
+def test_boundary_first_rejects_non_unimodular_chart():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    charts = geometry_case.facet_charts(region.x, region.y)
+    name = next(iter(region.facets))
+    chart = charts[name][0]
+    charts[name] = [
+        FacetChart(chart.name, chart.u, chart.t, chart.x_of.subs(chart.u, 2 * chart.u), chart.y_of.subs(chart.u, 2 * chart.u), chart.s)
+    ]
+
+    with pytest.raises(ValueError, match="Jacobian"):
+        solve_boundary_numerator(region, geometry_case.vertices(), charts)
@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.codegen2d import compile_evaluator, form_fingerprint, generate_evaluator_source
+from posgeo.forms.residues2d import residue_2form_on_facet
+from posgeo.typing import Canonical2Form
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+POINTS = [(Fraction(1, 3), Fraction(2, 7)), (Fraction(5, 4), Fraction(-1, 2)), (Fraction(3), Fraction(11, 5))]
+
+
+def _form_and_residues(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    charts = geometry_case.facet_charts(x, y)
+    residues = {name: residue_2form_on_facet(form, facet_charts[0]) for name, facet_charts in charts.items()}
+    return form, residues
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_generated_module_matches_sympy_exactly(geometry_case, tmp_path):
+    form, residues = _form_and_residues(geometry_case)
+    module = compile_evaluator(form, residues, cache_dir=tmp_path)
+
+    assert module.FINGERPRINT == form_fingerprint(form, residues)
+    assert module.RESIDUE_NAMES == tuple(sorted(residues))
+    for px, py in POINTS:
+        expected = form.prefactor.subs({form.x: sp.Rational(px), form.y: sp.Rational(py)})
+        assert module.prefactor(px, py) == Fraction(str(expected))
+    for name, residue in residues.items():
+        for tv in (Fraction(1, 3), Fraction(-2, 5), Fraction(7)):
+            expected = residue.prefactor.subs(residue.t, sp.Rational(tv))
+            assert module.residue(name, tv) == Fraction(str(expected))
+
+
+def test_generated_module_vectorized_float_and_poles(tmp_path):
+    np = pytest.importorskip("numpy")
+    form, residues = _form_and_residues(GEOMETRY_CASES[0])
+    module = compile_evaluator(form, residues, cache_dir=tmp_path)
+
+    xs = np.linspace(0.05, 0.95, 7)[:, None]
+    ys = np.linspace(0.05, 0.95, 5)[None, :]
+    values = module.prefactor_array(xs, ys)
+    assert values.shape == (7, 5)
+    reference = sp.lambdify((form.x, form.y), form.prefactor, "numpy")(xs, ys)
+    assert np.allclose(values, reference, rtol=1e-12, atol=0.0)
+
+    name = module.RESIDUE_NAMES[0]
+    ts = np.array([0.2, 0.7])
+    assert np.allclose(module.residue_array(name, ts), [float(module.residue(name, t)) for t in (0.2, 0.7)])
+
+    assert np.isinf(module.prefactor_array(0.0, 0.5))
+    with pytest.raises(ValueError, match="pole"):
+        module.prefactor(0, Fraction(1, 2))
+    with pytest.raises(KeyError, match="Unknown facet"):
+        module.residue("nope", 0)
+
+
+def test_cache_reuses_module_and_fingerprint_ignores_symbol_names(tmp_path):
+    form, _ = _form_and_residues(GEOMETRY_CASES[1])
+    first = compile_evaluator(form, cache_dir=tmp_path)
+    files = list(tmp_path.glob("form_*.py"))
+    assert len(files) == 1
+    mtime = files[0].stat().st_mtime_ns
+
+    a, b = sp.symbols("a b", real=True)
+    renamed = Canonical2Form(a, b, form.prefactor.subs({form.x: a, form.y: b}, simultaneous=True))
+    assert form_fingerprint(renamed) == form_fingerprint(form)
+    assert compile_evaluator(renamed, cache_dir=tmp_path) is first
+    assert files[0].stat().st_mtime_ns == mtime
+
+    with pytest.raises(ValueError, match="rational function"):
+        generate_evaluator_source(Canonical2Form(form.x, form.y, sp.sin(form.x)))
+
+
+def test_generated_module_imports_without_sympy(tmp_path):
+    form, residues = _form_and_residues(GEOMETRY_CASES[2])
+    compile_evaluator(form, residues, cache_dir=tmp_path)
+    (path,) = tmp_path.glob("form_*.py")
+    script = (
+        "import importlib.util, sys\n"
+        "sys.modules['sympy'] = None\n"
+        f"spec = importlib.util.spec_from_file_location('generated', {str(path)!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        "print(module.prefactor('1/3', '1/5'))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    expected = form.prefactor.subs({form.x: sp.Rational(1, 3), form.y: sp.Rational(1, 5)})
+    assert result.stdout.strip() == str(expected)
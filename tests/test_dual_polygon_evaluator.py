@@ -0,0 +1,57 @@
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.dual2d import DualPolygonEvaluator, dual_canonical_prefactor
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_dual_evaluator_matches_triangulation_form_at_rational_points(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    prefactor = canonical_form_from_triangulation(geometry_case.tri_a(x, y)).prefactor
+    evaluator = DualPolygonEvaluator(geometry_case.vertices())
+
+    for xv, yv in region.fixed_interior_rational_points(n=10):
+        value = evaluator(xv, yv)
+        assert isinstance(value, Fraction)
+        assert sp.Rational(value.numerator, value.denominator) == prefactor.subs({x: xv, y: yv})
+
+    # Rational-function identity: it also holds away from the region.
+    outside = (sp.Rational(7, 3), sp.Rational(-5, 2))
+    value = evaluator(*outside)
+    assert sp.Rational(value.numerator, value.denominator) == prefactor.subs({x: outside[0], y: outside[1]})
+
+
+def test_dual_evaluator_sign_follows_vertex_order():
+    verts = ((0, 0), (2, 0), (3, 1), (0, 1))
+    forward = dual_canonical_prefactor(verts, Fraction(1, 2), Fraction(1, 2))
+    backward = dual_canonical_prefactor(tuple(reversed(verts)), Fraction(1, 2), Fraction(1, 2))
+    assert forward > 0
+    assert backward == -forward
+
+
+def test_dual_evaluator_rejects_points_on_edge_lines():
+    evaluator = DualPolygonEvaluator(GEOMETRY_CASES[0].vertices())
+    with pytest.raises(ValueError, match="edge line"):
+        evaluator(0, sp.Rational(3, 4))
+
+
+def test_dual_evaluator_float_arrays_match_exact_values():
+    np = pytest.importorskip("numpy")
+
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    evaluator = DualPolygonEvaluator(geometry_case.vertices())
+
+    pts = region.fixed_interior_rational_points(n=12)
+    xs = np.array([float(px) for px, _ in pts])
+    ys = np.array([float(py) for _, py in pts])
+
+    values = evaluator.evaluate_array(xs, ys)
+    expected = np.array([float(evaluator(px, py)) for px, py in pts])
+    assert values.shape == (12,)
+    assert np.allclose(values, expected, rtol=1e-12, atol=0.0)
@@ -0,0 +1,56 @@
+import pytest
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.grid2d import EvaluationGrid
+from posgeo.forms.parallel2d import evaluate_points
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_grid_fills_in_resumable_tiles_and_matches_direct_evaluation(geometry_case, tmp_path):
+    region = geometry_case.build_region()
+    form = canonical_form_from_triangulation(geometry_case.tri_a(region.x, region.y))
+    grid = EvaluationGrid.create(tmp_path / "grid", form, region, (37, 50), tile=16)
+    assert grid.spec.tile_counts == (3, 4)
+    assert grid.fill(max_tiles=5) == 5
+
+    partial = EvaluationGrid.open(tmp_path / "grid")
+    assert isinstance(partial.prefactor, np.memmap)
+    assert partial.missing_tiles() == [(1, 1), (1, 2), (1, 3), (2, 0), (2, 1), (2, 2), (2, 3)]
+    with pytest.raises(ValueError, match="read-only"):
+        partial.fill()
+
+    resumed = EvaluationGrid.open(tmp_path / "grid", writable=True)
+    assert resumed.fill() == 7
+    assert resumed.complete
+
+    final = EvaluationGrid.open(tmp_path / "grid")
+    ys, xs = final.coordinates()
+    direct = evaluate_points(form, region, xs, ys, cache_dir=tmp_path / "direct")
+    np.testing.assert_array_equal(final.prefactor, direct.values)
+    np.testing.assert_array_equal(final.inside, direct.inside)
+    assert final.inside.any() and not final.inside.all()
+
+    # Partial read of one block, checked against per-facet distances.
+    block_ys, block_xs = final.coordinates(slice(10, 14), slice(20, 23))
+    names = final.spec.facet_names
+    for i, yv in enumerate(block_ys[:, 0]):
+        for j, xv in enumerate(block_xs[0]):
+            distances = [
+                abs(float(line.form(xv, yv))) / float(np.hypot(line.form.a, line.form.b))
+                for line in region.facets.values()
+            ]
+            assert names[final.nearest_facet[10 + i, 20 + j]] == names[int(np.argmin(distances))]
+
+
+def test_grid_rejects_bad_shapes_and_existing_directories(tmp_path):
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    form = canonical_form_from_triangulation(geometry_case.tri_a(region.x, region.y))
+    with pytest.raises(ValueError, match="positive"):
+        EvaluationGrid.create(tmp_path, form, region, (0, 10))
+    EvaluationGrid.create(tmp_path, form, region, (4, 4), tile=2)
+    with pytest.raises(ValueError, match="already exists"):
+        EvaluationGrid.create(tmp_path, form, region, (4, 4))
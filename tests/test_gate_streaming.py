@@ -0,0 +1,73 @@
+import pytest
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.typing import Canonical2Form
+from posgeo.validation import (
+    ChartOrderCheck,
+    DenominatorFindings,
+    GateContext,
+    assert_log_pure,
+    iter_singularity_findings,
+    singularity_report,
+)
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_stream_matches_full_report(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    bad = Canonical2Form(x, y, form.prefactor / x)
+
+    for candidate in (form, bad):
+        first, *checks = iter_singularity_findings(candidate, region, charts)
+        report = singularity_report(candidate, region, charts)
+        assert isinstance(first, DenominatorFindings)
+        assert all(isinstance(check, ChartOrderCheck) for check in checks)
+        assert first.multiplicities == report.multiplicities
+        assert tuple(checks) == report.local_chart_order_checks
+        assert report.complete
+        assert singularity_report(candidate, region, charts, fail_fast=True).passed == report.passed
+
+
+def test_fail_fast_stops_before_chart_work_on_denominator_failures(monkeypatch):
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    spurious = Canonical2Form(x, y, omega.prefactor / (x + y + 3))
+    gate = GateContext(region, charts)
+
+    def _no_chart_work(*args, **kwargs):
+        raise AssertionError("fail-fast must not check charts after a denominator failure")
+
+    monkeypatch.setattr(gate, "_check_chart", _no_chart_work)
+    report = gate.check(spurious, fail_fast=True)
+    assert report.failure_reasons == ("non-boundary-pole",)
+    assert report.local_chart_order_checks == () and not report.complete
+    assert not report.boundary_mapping_status
+    with pytest.raises(AssertionError, match="non-boundary-pole"):
+        assert_log_pure(spurious, region, charts, fail_fast=True)
+
+
+def test_fail_fast_stops_at_first_failing_chart():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    # Cancelling the L4_1my pole keeps every denominator factor a simple facet pole,
+    # but the residue on L4_1my vanishes, which only the chart checks see.
+    cancelled = Canonical2Form(x, y, omega.prefactor * (1 - y))
+    full = GateContext(region, charts).check(cancelled)
+    failing = [k for k, check in enumerate(full.local_chart_order_checks) if not check.passed]
+    assert failing and full.complete
+    assert full.failure_reasons == ("chart-order-failed",)
+
+    partial = GateContext(region, charts).check(cancelled, fail_fast=True)
+    assert partial.failure_reasons == full.failure_reasons
+    assert partial.local_chart_order_checks == full.local_chart_order_checks[: failing[0] + 1]
+    assert partial.complete == (failing[0] + 1 == len(full.local_chart_order_checks))
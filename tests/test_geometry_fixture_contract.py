@@ -1,5 +1,7 @@
+import pytest
 import sympy as sp
 
+from posgeo.forms.residues2d import fixture_facet_charts
 from posgeo.geometry import FIXTURES2D
 
 
@@ -34,3 +36,38 @@ def test_fixture_vertices_and_facets_are_self_consistent():
         for facet_name, ln in region.facets.items():
             value = sp.simplify(ln.expr.subs({region.x: cx, region.y: cy}))
             assert value > 0, f"{fixture.name}/{facet_name}: centroid not inside oriented half-space"
+
+
+def test_fixture_region_is_memoized_and_read_only():
+    for fixture in FIXTURES2D.values():
+        region = fixture.build_region()
+        assert fixture.build_region() is region
+
+        with pytest.raises(TypeError):
+            region.facets["extra"] = next(iter(region.facets.values()))
+
+
+def test_fixture_facet_charts_are_shared_but_returned_in_fresh_containers():
+    for fixture in FIXTURES2D.values():
+        first = fixture_facet_charts(fixture)
+        second = fixture_facet_charts(fixture)
+
+        assert first is not second
+        assert set(first) == {name for name, _ in fixture.facet_equations}
+        for facet_name, charts in first.items():
+            assert charts is not second[facet_name]
+            assert all(a is b for a, b in zip(charts, second[facet_name]))
+
+        first[next(iter(first))].clear()
+        assert all(len(charts) >= 2 for charts in fixture_facet_charts(fixture).values())
+
+
+def test_fixture_clear_cache_rebuilds_equal_region():
+    fixture = FIXTURES2D["m1_pentagon"]
+    region = fixture.build_region()
+
+    fixture.clear_cache()
+    rebuilt = fixture.build_region()
+
+    assert rebuilt is not region
+    assert dict(rebuilt.facets) == dict(region.facets)
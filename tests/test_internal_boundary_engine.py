@@ -0,0 +1,103 @@
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.dual2d import DualPolygonEvaluator
+from posgeo.forms.internal_boundary2d import (
+    CancellingFormAccumulator,
+    canonical_form_for_internal_boundary,
+    canonical_form_with_holes,
+    triangulate_with_holes,
+    unimodular_facet_chart,
+)
+from posgeo.forms.residues2d import residue_2form_on_facet
+from posgeo.geometry.internal_boundary_fixture import SquareHoleRegionFixture
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+
+OUTER = [(0, 0), (10, 0), (10, 10), (0, 10)]
+HOLES = [
+    [(1, 1), (1, 3), (2, 4), (3, 2)],
+    [(5, 5), (5, 7), (7, 8), (8, 6), (7, 5)],
+    [(2, 6), (2, 8), (3, 7)],
+]
+
+
+def _value(form, point):
+    return form.prefactor.subs({form.x: sp.Rational(point[0]), form.y: sp.Rational(point[1])})
+
+
+def _outer_minus_holes(outer_ccw, holes_cw, point):
+    # The hole loops are clockwise, so adding their forms subtracts the hole.
+    total = sum((DualPolygonEvaluator(loop)(*point) for loop in [outer_ccw, *holes_cw]), Fraction(0))
+    return sp.Rational(total.numerator, total.denominator)
+
+
+def test_square_hole_fixture_form_and_gate_report():
+    fixture = SquareHoleRegionFixture.build()
+    result = canonical_form_for_internal_boundary(fixture)
+
+    assert result.report.passed, result.report.failure_reasons
+    assert len(result.report.multiplicities) == len(fixture.outer_facets) + len(fixture.inner_facets)
+    for point in [(Fraction(1, 7), Fraction(2, 9)), (Fraction(5, 11), Fraction(1, 13)), (Fraction(1, 2), Fraction(1, 2))]:
+        expected = _outer_minus_holes(fixture.outer_vertices_ccw, [fixture.inner_vertices_cw], point)
+        assert _value(result.form, point) == expected
+
+
+def test_several_holes_without_simplify(monkeypatch):
+    x, y = sp.symbols("x y", real=True)
+
+    def _no_simplify(*args, **kwargs):
+        raise AssertionError("internal-boundary engine must not call sp.simplify")
+
+    monkeypatch.setattr(sp, "simplify", _no_simplify)
+    form = canonical_form_with_holes(OUTER, HOLES, x, y)
+    monkeypatch.undo()
+
+    numerator, denominator = sp.fraction(form.prefactor)
+    assert sp.Poly(denominator, x, y).total_degree() == 4 + sum(len(hole) for hole in HOLES)
+    for point in [(Fraction(9, 2), Fraction(1, 3)), (Fraction(17, 3), Fraction(41, 5)), (Fraction(-1, 2), Fraction(3, 1))]:
+        assert _value(form, point) == _outer_minus_holes(OUTER, HOLES, point)
+
+
+def _twice_area(loop):
+    return sum(loop[i][0] * loop[(i + 1) % len(loop)][1] - loop[(i + 1) % len(loop)][0] * loop[i][1] for i in range(len(loop)))
+
+
+def test_triangulation_covers_region_and_checks_orientation():
+    triangles = triangulate_with_holes(OUTER, HOLES)
+    assert all(_twice_area(tri) > 0 for tri in triangles)
+    assert sum(_twice_area(tri) for tri in triangles) == _twice_area(OUTER) + sum(_twice_area(hole) for hole in HOLES)
+
+    with pytest.raises(ValueError, match="clockwise"):
+        triangulate_with_holes(OUTER, [HOLES[0][::-1]])
+
+
+def test_accumulator_refuses_to_eliminate_a_pole():
+    x, y = sp.symbols("x y", real=True)
+    acc = CancellingFormAccumulator(x, y)
+    lx, ly, diag = LinearForm(1, 0, 0), LinearForm(0, 1, 0), LinearForm(1, 1, -1)
+    acc.add(1, [lx, diag])
+    acc.add(-1, [-diag, ly])
+    assert acc.refcount[diag] == 2
+
+    with pytest.raises(ValueError, match="is a pole"):
+        acc.eliminate(diag)
+
+
+def test_unimodular_chart_for_facet_with_non_primitive_gradient():
+    x, y = sp.symbols("x y", real=True)
+    # gcd(a, b) = 2 for the hypotenuse 1 - 2x - 2y of the triangle (0, 0), (1/2, 0), (0, 1/2).
+    line = OrientedLine2D(x, y, 1 - 2 * x - 2 * y)
+    chart = unimodular_facet_chart("hyp", line)
+    u, t = chart.u, chart.t
+    assert sp.expand(line.expr.subs({x: chart.x_of, y: chart.y_of}, simultaneous=True)) == u
+    jacobian = sp.Matrix([chart.x_of, chart.y_of]).jacobian([u, t]).det()
+    assert jacobian == 1
+
+    half = sp.Rational(1, 2)
+    form = canonical_form_with_holes([(0, 0), (half, 0), (0, half)], [], x, y)
+    residue = residue_2form_on_facet(form, chart)
+    poles = sp.solve(sp.denom(sp.together(residue.prefactor)), residue.t)
+    assert len(poles) == 2
+    assert sorted(sp.residue(residue.prefactor, residue.t, p) for p in poles) == [-1, 1]
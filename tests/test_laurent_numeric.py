@@ -0,0 +1,64 @@
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.residues2d import residue_2form_on_facet
+from posgeo.typing import Canonical2Form
+from posgeo.validation import GateContext, laurent_coefficients_fft, screen_chart_orders
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+np = pytest.importorskip("numpy")
+
+T_VALUES = [0.3, 0.37, 0.61]
+
+
+def test_fft_recovers_known_laurent_coefficients():
+    u, t = sp.symbols("u t")
+    expr = (2 + t) / u**2 + 3 / u + 5 * t + u**3 / (1 - u)
+    orders, coefficients, errors = laurent_coefficients_fft(expr, u, t, [0.0, 1.5])
+    for k, expected in {-2: [2.0, 3.5], -1: [3.0, 3.0], 0: [0.0, 7.5], 1: [0.0, 0.0], 3: [1.0, 1.0]}.items():
+        j = int(np.flatnonzero(orders == k)[0])
+        assert np.allclose(coefficients[:, j], expected, atol=1e-9)
+        assert (np.abs(coefficients[:, j] - expected) <= errors[:, j]).all()
+    with pytest.raises(ValueError, match="even"):
+        laurent_coefficients_fft(expr, u, t, [0.0], samples=7)
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_screen_matches_exact_residues_and_gate(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+
+    estimates = screen_chart_orders(form, charts, T_VALUES)
+    flat = [chart for facet_charts in charts.values() for chart in facet_charts]
+    assert len(estimates) == len(flat)
+    for estimate, chart in zip(estimates, flat):
+        assert estimate.chart_name == chart.name
+        assert estimate.passed and estimate.max_pole_order == 1
+        residue = residue_2form_on_facet(form, chart)
+        exact = np.array([float(residue.prefactor.subs(residue.t, tv)) for tv in T_VALUES])
+        assert (np.abs(estimate.residues - exact) <= estimate.residue_errors).all()
+        assert np.allclose(estimate.residues, exact, rtol=1e-10)
+
+    assert GateContext(region, charts).check(form).passed
+
+
+def test_screen_flags_double_poles_like_the_gate():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    bad = Canonical2Form(x, y, omega.prefactor / x)
+
+    estimates = screen_chart_orders(bad, charts, T_VALUES)
+    report = GateContext(region, charts).check(bad)
+    for estimate, check in zip(estimates, report.local_chart_order_checks):
+        assert estimate.passed == check.passed
+    assert {e.facet_name for e in estimates if e.max_pole_order == 2} == {"L1_x"}
+
+    # At a vertex the second facet also passes through u = 0, so the screen sees a double pole there.
+    (estimate,) = screen_chart_orders(omega, {"L2_y": charts["L2_y"][:1]}, [0.5])
+    assert estimate.pole_orders.tolist() == [2] and not estimate.passed
@@ -0,0 +1,96 @@
+import pickle
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.simplex2d import Triangle2D
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+from posgeo.geometry.region2d import PentagonM1Region
+
+
+def test_linear_form_is_primitive_and_orientation_preserving():
+    form = LinearForm(-4, 0, 2)
+    assert form.coefficients == (-2, 0, 1)
+    assert form.canonical() == LinearForm(2, 0, -1)
+    assert (-form).canonical() == form.canonical()
+
+    with pytest.raises(ValueError, match="nonzero gradient"):
+        LinearForm(0, 0, 3)
+
+
+def test_linear_form_is_hashable_and_immutable():
+    keys = {LinearForm(1, 1, -1): "diag", LinearForm(2, 2, -2): "diag-scaled"}
+    assert keys == {LinearForm(1, 1, -1): "diag-scaled"}
+
+    form = LinearForm(1, 2, 3)
+    with pytest.raises(AttributeError):
+        form.a = 5
+    assert pickle.loads(pickle.dumps(form)) == form
+
+
+def test_linear_form_from_expr_and_exact_evaluation():
+    x, y = sp.symbols("x y", real=True)
+    form = LinearForm.from_expr(x + y - sp.Rational(1, 2), x, y)
+
+    assert form.coefficients == (2, 2, -1)
+    assert form.grad == (2, 2)
+    assert form(sp.Rational(1, 3), sp.Rational(1, 5)) == sp.Rational(1, 15)
+    assert form(Fraction(1, 3), Fraction(1, 5)) == Fraction(1, 15)
+    assert sp.expand(form.as_expr(x, y) - 2 * (x + y - sp.Rational(1, 2))) == 0
+
+    with pytest.raises(ValueError, match="not linear"):
+        LinearForm.from_expr(x * y + 1, x, y)
+
+
+def test_through_points_is_positive_on_the_left():
+    form = LinearForm.through_points((0, 0), (sp.Rational(1, 2), 0))
+    assert form(0, 1) > 0
+    assert form(0, -1) < 0
+
+
+def test_oriented_line_uses_integer_form_with_positive_scale():
+    x, y = sp.symbols("x y", real=True)
+    line = OrientedLine2D(x, y, sp.Rational(1, 2) - x / 4)
+
+    assert line.form == LinearForm(-1, 0, 2)
+    assert line.scale == sp.Rational(1, 4)
+    assert line.grad() == (sp.Rational(-1, 4), 0)
+    assert line.eval_at(1.0, 7.0) == pytest.approx(0.25)
+    assert line.normalized().expr == x / 4 - sp.Rational(1, 2)
+    assert line.normalized().form == LinearForm(1, 0, -2)
+
+
+def test_oriented_line_from_form_skips_poly_and_nonlinear_lines_normalize(monkeypatch):
+    x, y = sp.symbols("x y", real=True)
+
+    def _no_poly(*args, **kwargs):
+        raise AssertionError("from_form must reuse the given integer form")
+
+    monkeypatch.setattr(sp, "Poly", _no_poly)
+    line = OrientedLine2D.from_form(x, y, LinearForm(-2, 1, 3))
+    assert (line.form, line.scale) == (LinearForm(-2, 1, 3), 1)
+    assert line.normalized().form == LinearForm(2, -1, -3)
+    monkeypatch.undo()
+    assert line == OrientedLine2D(x, y, -2 * x + y + 3)
+
+    curve = OrientedLine2D(x, y, -x**2 - y)
+    assert not curve.is_linear
+    assert curve.normalized().expr == x**2 + y
+    assert curve.grad() == (-2 * x, -1)
+
+
+def test_region_facets_and_triangle_edges_expose_forms():
+    region = PentagonM1Region.build()
+    assert {ln.form.canonical() for ln in region.facets.values()} == {
+        LinearForm(1, 0, 0),
+        LinearForm(0, 1, 0),
+        LinearForm(1, 0, -1),
+        LinearForm(0, 1, -1),
+        LinearForm(2, 2, -1),
+    }
+
+    x, y = region.x, region.y
+    tri = Triangle2D.from_vertices(x, y, (0, 0), (sp.Rational(1, 2), 0), (0, sp.Rational(1, 3)))
+    assert [e.form for e in tri.edges] == [LinearForm(-2, -3, 1), LinearForm(1, 0, 0), LinearForm(0, 1, 0)]
+    assert sp.simplify(tri.canonical_form().prefactor - 1 / (x * y * (1 - 2 * x - 3 * y))) == 0
@@ -12,6 +12,8 @@ from posgeo.forms.canonical2d import (
     triangulation_A_m1,
     triangulation_B_m1,
 )
+from posgeo.forms.dual2d import DualPolygonEvaluator
+from posgeo.geometry import M1_PENTAGON_FIXTURE
 
 
 def _m1_closed_form_reference(x: sp.Symbol, y: sp.Symbol) -> sp.Expr:
@@ -48,3 +50,19 @@ def test_m1_prefactor_rational_spot_checks() -> None:
         r_val = sp.simplify(reference.subs({x: x0, y: y0}))
         assert e_val == r_val
 
+
+
+def test_m1_dual_polygon_evaluator_matches_closed_form_oracle() -> None:
+    x, y = sp.symbols("x y", real=True)
+
+    reference = _m1_closed_form_reference(x, y)
+    evaluator = DualPolygonEvaluator(M1_PENTAGON_FIXTURE.vertices)
+
+    test_points = (
+        (sp.Rational(3, 5), sp.Rational(2, 5)),
+        (sp.Rational(4, 5), sp.Rational(3, 5)),
+        (sp.Rational(7, 10), sp.Rational(1, 5)),
+    )
+    for x0, y0 in test_points:
+        d_val = evaluator(x0, y0)
+        assert sp.Rational(d_val.numerator, d_val.denominator) == reference.subs({x: x0, y: y0})
@@ -5,6 +5,9 @@ import pytest
 
 from posgeo.forms.canonical2d import canonical_form_from_triangulation
 from posgeo.forms.residues2d import (
+    AffineReparam,
+    chart_jacobian,
+    facet_residue_poles_by_linearity,
     residue_2form_on_facet,
     expected_interval_prefactor_from_chart,
     expected_interval_prefactor_from_chart_ccw,
@@ -81,3 +84,34 @@ Orientation-fixed layer: CCW-oriented residues are deterministic and exact in ev
                 f"res={res.prefactor}\nexp={exp}\n"
                 f"diff={sp.simplify(res.prefactor - exp)}"
             )
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_residue_chart_independence_affine_fast_path(geometry_case, monkeypatch):
+    """Axiom IDs: TA-RR, TA-E3. Test type: structural.
+
+Partial-fraction fast path: pulling residue poles back through the affine chart change reproduces the base chart exactly.
+"""
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    tri = geometry_case.tri_a(x, y)
+    charts_by_facet = geometry_case.facet_charts(x, y)
+    poles = {
+        ch.name: facet_residue_poles_by_linearity(tri, ch) for charts in charts_by_facet.values() for ch in charts
+    }
+
+    def _no_simplify(*args, **kwargs):
+        raise AssertionError("affine fast path must not simplify")
+
+    monkeypatch.setattr(sp, "simplify", _no_simplify)
+    for facet, charts in charts_by_facet.items():
+        base = charts[0]
+        for ch in charts[1:]:
+            reparam = AffineReparam.from_charts(ch, base)
+            assert reparam.alpha != 0, f"[{facet}] degenerate reparameterization {ch.name} -> {base.name}"
+            # Residues are taken with `s`; normalize to dlog u with the chart Jacobian.
+            sign = (chart_jacobian(ch) / int(ch.s)) / (chart_jacobian(base) / int(base.s))
+            pulled = reparam.pullback_poles(poles[ch.name])
+            assert pulled == {p: sign * r for p, r in poles[base.name].items()}, (
+                f"[{facet}] {ch.name} pulled back to {base.name}: {pulled} vs {poles[base.name]}"
+            )
@@ -5,7 +5,7 @@ import sympy as sp
 
 from posgeo.forms.canonical2d import canonical_form_from_triangulation
 from posgeo.typing import Canonical2Form
-from posgeo.validation import assert_log_pure, singularity_report
+from posgeo.validation import GateContext, assert_log_pure, singularity_report
 from tests.helpers.geometry_cases import GEOMETRY_CASES
 from tests.helpers.pole_checks import format_failure_reasons
 
@@ -74,3 +74,67 @@ def test_singularity_report_failure_reasons_snapshot():
     assert "non-simple-multiplicity" in report.failure_reasons
     assert "chart-order-failed" in report.failure_reasons
     assert len(report.failure_reasons) == 3
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_gate_context_reuses_region_state_across_candidate_forms(geometry_case):
+    """Axiom IDs: TA-LP. Test type: failure-mode."""
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    facet_exprs = [ln.expr for ln in region.facets.values()]
+
+    candidates = [
+        omega,
+        Canonical2Form(x=x, y=y, prefactor=1 / (facet_exprs[0] ** 2 * facet_exprs[1])),
+        Canonical2Form(x=x, y=y, prefactor=omega.prefactor / (3 * x - y + 11)),
+        Canonical2Form(x=x, y=y, prefactor=omega.prefactor * facet_exprs[0]),
+        omega,
+    ]
+
+    context = GateContext(region, charts)
+    reports = context.check_many(candidates)
+
+    assert reports[0].passed and reports[-1] is reports[0]
+    for candidate, report in zip(candidates, reports):
+        expected = singularity_report(candidate, region, charts)
+        assert report.failure_reasons == expected.failure_reasons
+        assert set(report.multiplicities) == set(expected.multiplicities)
+        assert [c.failure_reasons for c in report.local_chart_order_checks] == [
+            c.failure_reasons for c in expected.local_chart_order_checks
+        ]
+    assert [r.failure_reasons for r in reports[1:4]] == [
+        ("non-simple-multiplicity", "chart-order-failed"),
+        ("non-boundary-pole",),
+        ("chart-order-failed",),
+    ]
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_gate_accepts_prefactors_that_are_not_a_single_fraction(geometry_case):
+    """Axiom IDs: TA-LP. Test type: failure-mode."""
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    triangles = geometry_case.tri_a(x, y).triangles
+    triangle_sum = sp.Add(*(t.canonical_form().prefactor for t in triangles))
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+
+    for prefactor in (triangle_sum, sp.apart(omega.prefactor, x)):
+        assert sp.denom(prefactor) == 1
+        report = singularity_report(Canonical2Form(x=x, y=y, prefactor=prefactor), region, charts)
+        assert report.passed, format_failure_reasons(report)
+
+
+def test_check_many_does_not_reuse_reports_across_variables():
+    """Axiom IDs: TA-LP. Test type: failure-mode."""
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    a, b = sp.symbols("a b")
+    renamed = Canonical2Form(x=a, y=b, prefactor=omega.prefactor)
+
+    with pytest.raises(ValueError, match="do not match"):
+        GateContext(region, geometry_case.facet_charts(x, y)).check_many([omega, renamed])
@@ -1,5 +1,6 @@
 # Axioms: TA-RR, TA-VN
 
+import pytest
 import sympy as sp
 
 from posgeo.geometry import M1_PENTAGON_FIXTURE
@@ -12,6 +13,7 @@ from posgeo.forms.residues2d import (
     interval_endpoints_from_chart_ccw,
     m1_facet_charts_all,
     residue_2form_on_facet,
+    vertex_residues,
 )
 from tests.helpers.symbolic_validity import assert_valid_symbolic_value
 
@@ -145,3 +147,35 @@ def test_m1_terminal_residue_chains_2d_to_vertex_are_pm_one():
             assert sp.simplify(chain_end**2 - 1) == 0, (
                 f"{facet_name}/{chart.name} chain-to-end residue not ±1: {chain_end}"
             )
+
+
+def test_m1_vertex_residues_from_gradients_match_limit_path():
+    """Axiom IDs: TA-RR. Test type: structural."""
+    region = PentagonM1Region.build()
+    x, y = region.x, region.y
+    verts = list(M1_PENTAGON_FIXTURE.vertices)
+    omega2 = canonical_form_from_triangulation(triangulation_A_m1(x, y))
+    charts = m1_facet_charts_all(x, y)
+
+    fast = vertex_residues(region, verts)
+    assert [r.vertex for r in fast] == verts
+    assert all(r.value in (1, -1) for r in fast)
+
+    for k in range(2):
+        checked = vertex_residues(region, verts, form=omega2, charts={n: [c[k]] for n, c in charts.items()})
+        assert checked == fast
+
+    # Reversing the traversal flips every iterated residue.
+    assert [r.value for r in vertex_residues(region, verts[::-1])] == [-r.value for r in fast][::-1]
+
+
+def test_m1_vertex_residue_cross_check_rejects_misoriented_form():
+    """Axiom IDs: TA-RR. Test type: failure-mode."""
+    region = PentagonM1Region.build()
+    x, y = region.x, region.y
+    verts = list(M1_PENTAGON_FIXTURE.vertices)
+    omega2 = canonical_form_from_triangulation(triangulation_A_m1(x, y))
+    flipped = type(omega2)(x, y, -omega2.prefactor)
+
+    with pytest.raises(AssertionError, match="TA-RR vertex residue failed"):
+        vertex_residues(region, verts, form=flipped, charts=m1_facet_charts_all(x, y))
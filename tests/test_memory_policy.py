@@ -0,0 +1,78 @@
+import pytest
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.codegen2d import load_evaluator_module
+from posgeo.memory import LRUCache, MemoryPolicy, cache_report, canonical_symbols, clear_caches
+from posgeo.typing import Canonical2Form
+from posgeo.validation import GateContext
+from posgeo.validation.singularity_gate import _intern_linear_key
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    assert cache.get_or_build("a", lambda: 1) == 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert "b" not in cache and len(cache) == 2
+    assert cache.get_or_build("a", lambda: pytest.fail("rebuilt a cached entry")) == 1
+    with pytest.raises(ValueError, match="positive"):
+        LRUCache(0)
+
+
+def test_fixture_regions_share_canonical_symbols_across_clears():
+    region = GEOMETRY_CASES[0].build_region()
+    clear_caches(scope="process")
+    rebuilt = GEOMETRY_CASES[0].build_region()
+    assert rebuilt is not region
+    assert (rebuilt.x, rebuilt.y) == canonical_symbols()
+    assert rebuilt.x is region.x and rebuilt.y is region.y
+
+
+def test_policy_releases_job_caches_and_caps_sympy_cache():
+    policy = MemoryPolicy(sympy_cache_limit=0)
+    for geometry_case in GEOMETRY_CASES:
+        with policy.job():
+            region = geometry_case.build_region()
+            x, y = region.x, region.y
+            charts = geometry_case.facet_charts(x, y)
+            form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+            gate = GateContext(region, charts)
+            assert gate.check(form).passed
+            assert not gate.check(Canonical2Form(x, y, form.prefactor / (x + 7))).passed
+            assert cache_report()["singularity_gate.linear_factor_key"].entries > 0
+        report = cache_report()
+        assert report["sympy"].entries == 0
+        assert all(info.entries == 0 for info in report.values() if info.scope == "job")
+        # Fixture data survives job releases.
+        assert report["fixtures2d.memo"].entries > 0
+
+    with pytest.raises(ValueError, match="job"):
+        with MemoryPolicy(sympy_cache_limit=None).job():
+            raise ValueError("job failed")
+    with pytest.raises(ValueError, match=">= 0"):
+        MemoryPolicy(sympy_cache_limit=-1)
+    with pytest.raises(ValueError, match="scope"):
+        clear_caches(scope="session")
+
+
+def test_loaded_evaluators_are_lru_bounded(tmp_path):
+    paths = []
+    for k in range(3):
+        path = tmp_path / f"m{k}.py"
+        path.write_text(f"VALUE = {k}\n")
+        paths.append(path)
+    modules = [load_evaluator_module(path) for path in paths]
+    assert load_evaluator_module(paths[0]) is modules[0]
+    info = cache_report()["codegen2d.loaded_evaluators"]
+    assert 3 <= info.entries <= info.maxsize
+
+
+def test_job_caches_are_bounded_within_a_job():
+    report = cache_report()
+    assert all(info.maxsize is not None for info in report.values() if info.scope == "job")
+    bound = report["singularity_gate.interned_linear_keys"].maxsize
+    for k in range(bound + 10):
+        _intern_linear_key((k, 1, 0))
+    assert cache_report()["singularity_gate.interned_linear_keys"].entries == bound
@@ -0,0 +1,72 @@
+import json
+
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.metrics import active_collector, collect_metrics, record_expression, stage
+from posgeo.validation import GateContext
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+def test_collect_metrics_records_pipeline_stages():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    tri = geometry_case.tri_a(x, y)
+
+    with collect_metrics() as collector:
+        assert active_collector() is collector
+        form = canonical_form_from_triangulation(tri)
+        GateContext(region, charts).check(form)
+    assert active_collector() is None
+
+    triangles = [m for m in collector.expressions if m.stage == "triangle"]
+    assert len(triangles) == len(tri.triangles)
+    assert all((m.numerator_degree, m.denominator_degree) == (0, 3) for m in triangles)
+
+    (summed,) = [m for m in collector.expressions if m.stage == "triangulation-sum"]
+    (simplified,) = [m for m in collector.expressions if m.stage == "triangulation-simplify"]
+    assert simplified.denominator_degree == 5
+    assert simplified.ops <= summed.ops
+
+    gate = [m for m in collector.expressions if m.stage == "gate-chart"]
+    n_charts = sum(len(v) for v in charts.values())
+    assert len(gate) == n_charts
+    assert all(m.label and "/" in m.label for m in gate)
+    assert all(m.traced_peak_bytes is not None for m in collector.expressions)
+    assert sum(1 for s in collector.stages if s.stage == "gate-chart") == n_charts
+
+    summary = collector.summary()
+    assert summary["triangle"]["expressions"] == len(tri.triangles)
+    assert summary["triangle"]["max_degree"] == 3
+    assert summary["triangulation-simplify"]["peak_bytes"] > 0
+    records = json.loads(json.dumps(collector.as_dicts()))
+    assert {r["kind"] for r in records} == {"expression", "stage"}
+
+
+def test_metrics_are_noops_outside_collection():
+    x, y = sp.symbols("x y")
+    record_expression("triangle", 1 / (x * y), variables=(x, y))
+    with collect_metrics(track_memory=False) as collector:
+        record_expression("manual", (x + 1) ** 2 / y, variables=(x, y), label="m")
+        record_expression("manual", sp.sin(x), variables=(x, y))
+    assert collector.stages == []
+    first, second = collector.expressions
+    assert (first.label, first.numerator_degree, first.denominator_degree) == ("m", 2, 1)
+    assert first.traced_peak_bytes is None
+    assert second.numerator_degree is None
+
+
+def test_nested_stage_keeps_outer_peak():
+    with collect_metrics() as collector:
+        with stage("outer"):
+            buffer = bytearray(4_000_000)
+            del buffer
+            with stage("inner"):
+                small = bytearray(10_000)
+                del small
+    inner, outer = collector.stages
+    assert (inner.stage, outer.stage) == ("inner", "outer")
+    assert 10_000 <= inner.peak_bytes < 1_000_000
+    assert outer.peak_bytes >= 4_000_000
@@ -0,0 +1,58 @@
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.modular2d import (
+    canonical_form_from_modular_samples,
+    numerator_degree_bound,
+    rational_reconstruction,
+    reconstruct_numerator_coefficients,
+)
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_modular_engine_matches_triangulation_engine(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+
+    modular = canonical_form_from_modular_samples(geometry_case.vertices(), x, y).prefactor
+    reference = canonical_form_from_triangulation(geometry_case.tri_a(x, y)).prefactor
+    assert sp.simplify(modular - reference) == 0
+
+    numerator, denominator = sp.fraction(modular)
+    assert sp.Poly(numerator, x, y).total_degree() <= numerator_degree_bound(len(region.facets))
+    assert sp.Poly(denominator, x, y).total_degree() == len(region.facets)
+
+
+def test_modular_engine_handles_many_vertices():
+    # 12 lattice points in convex position; the numerator has degree <= 9.
+    verts = [(0, 0), (3, -1), (6, -1), (9, 0), (11, 2), (12, 5), (12, 8), (10, 11), (7, 12), (3, 11), (1, 9), (-1, 5)]
+    evaluator, coeffs = reconstruct_numerator_coefficients(verts)
+    assert max(i + j for i, j in coeffs) <= numerator_degree_bound(len(verts))
+    assert all(c.denominator == 1 for c in coeffs.values())
+
+    x, y = sp.symbols("x y", real=True)
+    prefactor = canonical_form_from_modular_samples(verts, x, y).prefactor
+    for pt in [(Fraction(11, 2), Fraction(5, 3)), (Fraction(2, 7), Fraction(9, 4)), (Fraction(-3, 1), Fraction(1, 2))]:
+        exact = evaluator(*pt)
+        assert prefactor.subs({x: sp.Rational(pt[0]), y: sp.Rational(pt[1])}) == sp.Rational(
+            exact.numerator, exact.denominator
+        )
+
+
+def test_rational_reconstruction_recovers_small_fractions():
+    modulus = 2147483647 * 2147483629
+    for value in (Fraction(0), Fraction(-7, 3), Fraction(12345, 678), Fraction(-1, 99991)):
+        residue = value.numerator * pow(value.denominator, -1, modulus) % modulus
+        assert rational_reconstruction(residue, modulus) == value
+
+    # Not representable with both parts below sqrt(modulus / 2).
+    assert rational_reconstruction(8, 101) is None
+
+
+def test_modular_engine_reports_non_convergence():
+    with pytest.raises(RuntimeError, match="did not stabilize"):
+        reconstruct_numerator_coefficients(GEOMETRY_CASES[0].vertices(), max_primes=1)
@@ -0,0 +1,67 @@
+import pytest
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.parallel2d import ParallelFormEvaluator, SharedArray, evaluate_points
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+np = pytest.importorskip("numpy")
+
+
+def _points(n, seed=7):
+    rng = np.random.default_rng(seed)
+    pts = rng.uniform(-0.5, 2.5, size=(2, n))
+    # Include exact facet points (poles / boundary) and vertices.
+    pts[:, :4] = [[0.0, 0.5, 1.0, 0.25], [0.5, 0.0, 1.0, 0.25]]
+    return pts[0], pts[1]
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_parallel_matches_serial_bitwise(geometry_case, tmp_path):
+    region = geometry_case.build_region()
+    form = canonical_form_from_triangulation(geometry_case.tri_a(region.x, region.y))
+    xs, ys = _points(10_007)
+
+    serial = evaluate_points(form, region, xs, ys, cache_dir=tmp_path)
+    with ParallelFormEvaluator(form, region, cache_dir=tmp_path, processes=3, chunk_size=997) as evaluator:
+        parallel = evaluator.evaluate(xs, ys)
+        again = evaluator.evaluate(xs, ys)
+
+    for result in (parallel, again):
+        np.testing.assert_array_equal(result.inside, serial.inside)
+        np.testing.assert_array_equal(result.values, serial.values)
+    expected_inside = [region.contains(float(px), float(py)) for px, py in zip(xs[:200], ys[:200])]
+    assert serial.inside[:200].tolist() == expected_inside
+    assert serial.inside.any() and not serial.inside.all()
+
+
+def test_parallel_broadcast_shape_and_shared_inputs(tmp_path):
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    form = canonical_form_from_triangulation(geometry_case.tri_a(region.x, region.y))
+    gx = np.linspace(0.0, 1.0, 41)[:, None]
+    gy = np.linspace(0.0, 1.0, 23)[None, :]
+
+    with ParallelFormEvaluator(form, region, cache_dir=tmp_path, processes=2, chunk_size=100) as evaluator:
+        grid = evaluator.evaluate(gx, gy)
+        xs, ys = np.ravel(np.broadcast_arrays(gx, gy)[0]), np.ravel(np.broadcast_arrays(gx, gy)[1])
+        with SharedArray.from_array(xs) as sx, SharedArray.from_array(ys) as sy, SharedArray.create(
+            xs.size
+        ) as values, SharedArray.create(xs.size, "bool") as inside:
+            evaluator.evaluate_shared(sx, sy, values, inside)
+            np.testing.assert_array_equal(values.array, grid.values.ravel())
+            np.testing.assert_array_equal(inside.array, grid.inside.ravel())
+
+    assert grid.values.shape == grid.inside.shape == (41, 23)
+    serial = evaluate_points(form, region, gx, gy, cache_dir=tmp_path)
+    np.testing.assert_array_equal(grid.values, serial.values)
+
+
+def test_empty_input_and_bad_chunk_size(tmp_path):
+    geometry_case = GEOMETRY_CASES[1]
+    region = geometry_case.build_region()
+    form = canonical_form_from_triangulation(geometry_case.tri_a(region.x, region.y))
+    with pytest.raises(ValueError, match="chunk_size"):
+        ParallelFormEvaluator(form, region, cache_dir=tmp_path, chunk_size=0)
+    with ParallelFormEvaluator(form, region, cache_dir=tmp_path, processes=1) as evaluator:
+        result = evaluator.evaluate(np.array([]), np.array([]))
+    assert result.values.shape == (0,)
@@ -0,0 +1,73 @@
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.pushforward import PushforwardEvaluator, RationalMap2D, pushforward
+from posgeo.forms.triangulations2d import canonical_form_from_vertices
+from posgeo.typing import Canonical2Form
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+x, y, X, Y = sp.symbols("x y X Y")
+SQUARE = Canonical2Form(x, y, 1 / ((x - 1) * (2 - x) * (y - 1) * (2 - y)))
+
+
+def test_squaring_map_matches_explicit_preimage_sum():
+    phi = RationalMap2D(x, y, X, Y, x**2, y**2)
+    expected = 0
+    for sx in (1, -1):
+        for sy in (1, -1):
+            xv, yv = sx * sp.sqrt(X), sy * sp.sqrt(Y)
+            expected += SQUARE.prefactor.subs({x: xv, y: yv}) / (4 * xv * yv)
+    pushed = pushforward(SQUARE, phi)
+    assert (pushed.x, pushed.y) == (X, Y)
+    assert sp.simplify(pushed.prefactor - expected) == 0
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_affine_pushforward_is_canonical_form_of_image(geometry_case):
+    form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    # det = 3 > 0 keeps the vertex orientation.
+    phi = RationalMap2D(x, y, X, Y, 2 * x + y + 1, x + 2 * y - 3)
+    image = [(2 * vx + vy + 1, vx + 2 * vy - 3) for vx, vy in geometry_case.vertices()]
+    expected = canonical_form_from_vertices(image, X, Y)
+    assert sp.cancel(pushforward(form, phi).prefactor - expected.prefactor) == 0
+
+
+def test_swap_invariant_form_pushes_forward_to_zero_through_symmetrization():
+    # (x, y) -> (x + y, x y) identifies p and its mirror image, whose Jacobians have opposite signs.
+    assert pushforward(SQUARE, RationalMap2D(x, y, X, Y, x + y, x * y)).prefactor == 0
+
+
+@pytest.mark.parametrize(
+    "phi_x, phi_y",
+    [(x / (1 + x + y), y / (1 + x + y)), (x**2 + y, y**2 - x), (x**2, y**2)],
+)
+def test_batched_numeric_pushforward_matches_exact(phi_x, phi_y):
+    np = pytest.importorskip("numpy")
+    phi = RationalMap2D(x, y, X, Y, phi_x, phi_y)
+    exact = pushforward(SQUARE, phi)
+    evaluator = PushforwardEvaluator(SQUARE, phi)
+
+    targets = [
+        (sp.Rational(7, 3), sp.Rational(9, 4)),
+        (sp.Rational(-5, 2), sp.Rational(13, 7)),
+        (sp.Rational(1, 9), sp.Rational(1, 5)),
+    ]
+    Xs = np.array([float(a) for a, _ in targets])
+    Ys = np.array([float(b) for _, b in targets])
+    values = evaluator(Xs, Ys)
+    expected = [float(exact.prefactor.subs({X: a, Y: b})) for a, b in targets]
+    assert values.shape == (3,)
+    assert np.allclose(values, expected, rtol=1e-9, atol=1e-12)
+
+    xs, ys = evaluator.preimages(Xs[:1], Ys[:1])
+    assert xs.shape == (1, evaluator.degree)
+    images = sp.lambdify((x, y), (phi_x, phi_y), "numpy")(xs, ys)
+    assert np.allclose(images[0], Xs[0]) and np.allclose(images[1], Ys[0])
+
+
+def test_degenerate_maps_are_rejected():
+    with pytest.raises(ValueError, match="Jacobian"):
+        RationalMap2D(x, y, X, Y, x + y, 2 * (x + y)).elimination
+    with pytest.raises(ValueError, match="do not match"):
+        pushforward(Canonical2Form(X, Y, 1 / (X * Y)), RationalMap2D(x, y, X, Y, x, y))
@@ -0,0 +1,64 @@
+from types import MappingProxyType
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.residues2d import facet_vertices_from_region_equations, oriented_edge_vertices_ccw
+from posgeo.geometry import FIXTURES2D
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+from posgeo.geometry.region2d import Region2D
+from posgeo.validation.preconditions import validate_canonical_scope
+
+
+def _parabola_polygon(n):
+    x, y = sp.symbols("x y", real=True)
+    verts = [(sp.Integer(k), sp.Integer(k * k)) for k in range(n)]
+    facets = {
+        f"E{i}": OrientedLine2D.from_form(x, y, LinearForm.through_points(verts[i], verts[(i + 1) % n]))
+        for i in range(n)
+    }
+    return Region2D(x=x, y=y, facets=MappingProxyType(facets)), verts
+
+
+@pytest.mark.parametrize("fixture", list(FIXTURES2D.values()), ids=lambda f: f.name)
+def test_incidence_matches_facet_equations(fixture):
+    region = fixture.build_region()
+    verts = list(fixture.vertices)
+    incidence = region.incidence(verts)
+    assert region.incidence(tuple(verts)) is incidence
+
+    for name, line in region.facets.items():
+        on = [v for v in verts if sp.simplify(line.expr.subs({region.x: v[0], region.y: v[1]})) == 0]
+        assert incidence.vertices_on(name) == on
+        start, end = incidence.edge(name)
+        i_start, i_end = verts.index(start), verts.index(end)
+        assert (i_start + 1) % len(verts) == i_end
+    assert sorted(incidence.facet_order) == sorted(region.facets)
+    assert all(incidence.facet_count_at(i) == 2 for i in range(len(verts)))
+
+
+def test_incidence_handles_hundred_gon_without_simplify(monkeypatch):
+    region, verts = _parabola_polygon(100)
+
+    def _no_simplify(*args, **kwargs):
+        raise AssertionError("incidence of rational vertices must not call sp.simplify")
+
+    monkeypatch.setattr(sp, "simplify", _no_simplify)
+    incidence = region.incidence(verts)
+    assert incidence.facet_order == tuple(f"E{i}" for i in range(100))
+    assert oriented_edge_vertices_ccw(region, "E99", verts) == (verts[99], verts[0])
+    assert facet_vertices_from_region_equations(region, "E5", verts) == [verts[5], verts[6]]
+    monkeypatch.undo()
+
+    assert not [v for v in validate_canonical_scope(region=region, vertices=verts) if v.code == "vertex-not-on-boundary"]
+
+
+def test_incidence_edge_follows_vertex_order_and_rejects_unknown_facets():
+    region, verts = _parabola_polygon(5)
+    assert region.incidence(verts[::-1]).edge("E0") == (verts[1], verts[0])
+    assert region.incidence(verts[::-1]).facet_order[0] == "E3"
+
+    with pytest.raises(KeyError, match="Unknown facet"):
+        region.incidence(verts).edge("E9")
+    with pytest.raises(ValueError, match="Expected 2 vertices on facet E0"):
+        region.incidence(verts[1:]).edge("E0")
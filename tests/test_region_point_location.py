@@ -0,0 +1,92 @@
+from fractions import Fraction
+from types import MappingProxyType
+
+import pytest
+import sympy as sp
+
+from posgeo.geometry import FIXTURES2D
+from posgeo.geometry.lines import LinearForm, OrientedLine2D
+from posgeo.geometry.region2d import Region2D
+
+
+def _scan_exact(region, xv, yv):
+    return all(line.form(xv, yv) > 0 for line in region.facets.values())
+
+
+def _scan_float(region, xv, yv, eps=1e-12):
+    return all(line.eval_at(xv, yv) > eps for line in region.facets.values())
+
+
+def _polygon_region(verts):
+    x, y = sp.symbols("x y", real=True)
+    n = len(verts)
+    facets = {
+        f"E{i}": OrientedLine2D.from_form(x, y, LinearForm.through_points(verts[i], verts[(i + 1) % n]))
+        for i in range(n)
+    }
+    return Region2D(x=x, y=y, facets=MappingProxyType(facets))
+
+
+def _query_grid(lo, hi, steps):
+    return [
+        (lo + (hi - lo) * sp.Rational(i, steps), lo + (hi - lo) * sp.Rational(j, steps))
+        for i in range(steps + 1)
+        for j in range(steps + 1)
+    ]
+
+
+@pytest.mark.parametrize("fixture", list(FIXTURES2D.values()), ids=lambda f: f.name)
+def test_point_locator_matches_facet_scan_on_fixtures(fixture):
+    region = fixture.build_region()
+    locator = region.point_locator
+    assert locator is not None
+    assert set(locator.vertices) == {(Fraction(str(vx)), Fraction(str(vy))) for vx, vy in fixture.vertices}
+
+    # The grid hits vertices, edges and points outside the region.
+    for xv, yv in _query_grid(sp.Rational(-1, 2), sp.Rational(7, 2), 24):
+        assert region._contains_symbolic(xv, yv) == _scan_exact(region, xv, yv)
+        assert region.contains(float(xv), float(yv)) == _scan_float(region, float(xv), float(yv))
+
+
+def test_point_locator_handles_many_facets():
+    n = 200
+    region = _polygon_region([(sp.Integer(k), sp.Integer(k * k)) for k in range(n)])
+    locator = region.point_locator
+    assert len(locator.facet_names) == n
+
+    for xv, yv in [(sp.Rational(1, 2), sp.Rational(1, 3)), (sp.Rational(1, 2), sp.Rational(1, 4)), (50, 2500), (100, 5000)]:
+        assert locator.contains_exact(xv, yv) == _scan_exact(region, xv, yv)
+        assert locator.contains_float(float(xv), float(yv)) == _scan_float(region, float(xv), float(yv))
+
+
+def test_point_locator_declines_redundant_or_unbounded_facets():
+    x, y = sp.symbols("x y", real=True)
+    square = {"a": x, "b": y, "c": 1 - x, "d": 1 - y}
+    redundant = dict(square, e=3 - x - y)
+    unbounded = {"a": x, "b": y, "c": 1 - x}
+
+    for facets in (redundant, unbounded):
+        region = Region2D(x=x, y=y, facets=MappingProxyType({k: OrientedLine2D(x, y, v) for k, v in facets.items()}))
+        assert region.point_locator is None
+        assert region.contains(0.5, 0.5)
+        assert region._contains_symbolic(sp.Rational(1, 2), sp.Rational(1, 2))
+
+
+def test_symbolic_containment_handles_irrational_points_and_nonlinear_facets():
+    region = FIXTURES2D["m1_pentagon"].build_region()
+    r = sp.sqrt(2) / 3
+    assert region._contains_symbolic(r, r)
+    assert region._contains_symbolic(r, sp.Rational(1, 10))
+    assert not region._contains_symbolic(sp.sqrt(2) / 10, sp.Rational(1, 10))
+
+    x, y = sp.symbols("x y", real=True)
+    disc_quadrant = Region2D(
+        x=x,
+        y=y,
+        facets=MappingProxyType(
+            {"x": OrientedLine2D(x, y, x), "y": OrientedLine2D(x, y, y), "arc": OrientedLine2D(x, y, 1 - x**2 - y**2)}
+        ),
+    )
+    assert disc_quadrant._contains_symbolic(sp.Rational(1, 2), sp.Rational(1, 2))
+    assert not disc_quadrant._contains_symbolic(sp.Rational(4, 5), sp.Rational(4, 5))
+    assert disc_quadrant._contains_symbolic(r, r)
@@ -1,7 +1,8 @@
 # tests/test_reparam_nonconstant.py
 import sympy as sp
 
-from posgeo.forms.residues2d import m1_facet_charts_all
+from posgeo.forms.residues2d import AffineReparam, m1_facet_charts_all, pullback_1form
+from posgeo.typing import Canonical1Form
 from tests.helpers.orientation_consistency import solve_reparam_t1_of_t0
 
 
@@ -34,3 +35,21 @@ def test_reparam_is_not_constant_for_all_m1_chart_pairs():
                 f"t1(t0) = {t1_of_t0}\n"
                 f"dt1/dt0 = {dt}"
             )
+
+
+def test_affine_reparam_from_charts_matches_solved_reparam():
+    """Axiom IDs: TA-E3. Test type: structural."""
+    x, y = sp.symbols("x y", real=True)
+
+    for facet, charts in m1_facet_charts_all(x, y).items():
+        ch0 = charts[0]
+        for ch in charts[1:]:
+            reparam = AffineReparam.from_charts(ch, ch0)
+            assert sp.simplify(reparam.expr() - solve_reparam_t1_of_t0(ch0, ch)) == 0, facet
+            assert reparam.inverse().inverse() == reparam
+
+            # The symbolic pullback takes the affine path and agrees with the generic one.
+            form = Canonical1Form(ch.t, 1 / ch.t + 1 / (1 - ch.t))
+            pulled = pullback_1form(form, t_new=ch0.t, t_old_expr=reparam.expr())
+            generic = sp.simplify(form.prefactor.subs({ch.t: reparam.expr()}) * sp.diff(reparam.expr(), ch0.t))
+            assert sp.simplify(pulled.prefactor - generic) == 0, facet
@@ -0,0 +1,47 @@
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.residues2d import (
+    facet_residue_poles_by_linearity,
+    residue_2form_on_facet,
+    residue_2form_on_facet_by_linearity,
+)
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+@pytest.mark.parametrize("tri_attr", ["tri_a", "tri_b"])
+def test_linearity_residues_match_limit_residues(geometry_case, tri_attr):
+    """Axiom IDs: TA-RR. Test type: structural."""
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    tri = getattr(geometry_case, tri_attr)(x, y)
+    omega2 = canonical_form_from_triangulation(tri)
+
+    for facet_name, charts in geometry_case.facet_charts(x, y).items():
+        for chart in charts:
+            fast = residue_2form_on_facet_by_linearity(tri, chart)
+            slow = residue_2form_on_facet(omega2, chart)
+            assert fast.t == chart.t
+            assert sp.simplify(fast.prefactor - slow.prefactor) == 0, f"{facet_name}/{chart.name}"
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_linearity_residues_cancel_at_interior_edge_points(geometry_case, monkeypatch):
+    """Axiom IDs: TA-RR, TA-LP. Test type: structural."""
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    tri = geometry_case.tri_a(x, y)
+    charts = geometry_case.facet_charts(x, y)
+
+    def _no_limit(*args, **kwargs):
+        raise AssertionError("linearity engine must not take limits")
+
+    monkeypatch.setattr(sp, "limit", _no_limit)
+    for facet_name, facet_charts in charts.items():
+        poles = facet_residue_poles_by_linearity(tri, facet_charts[0])
+        assert len(poles) == 2, f"{facet_name}: {poles}"
+        assert sorted(poles.values()) == [Fraction(-1), Fraction(1)]
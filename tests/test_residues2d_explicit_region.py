@@ -1,12 +1,20 @@
+from types import MappingProxyType
+
 import pytest
+import sympy as sp
 
+from posgeo.forms.simplex2d import Triangle2D
 from posgeo.forms.residues2d import (
+    FacetChart,
+    expected_interval_prefactor_from_chart_ccw,
     interval_endpoints_from_chart_ccw,
     interval_endpoints_from_chart_ccw_compat,
     m1_facet_charts_all,
+    residue_2form_on_facet,
 )
 from posgeo.geometry import M1_PENTAGON_FIXTURE, Q1_QUADRILATERAL_FIXTURE
-from posgeo.geometry.region2d import PentagonM1Region
+from posgeo.geometry.lines import OrientedLine2D
+from posgeo.geometry.region2d import PentagonM1Region, Region2D
 
 
 def test_interval_endpoints_compat_legacy_3arg_call_fails_with_clear_error():
@@ -29,3 +37,38 @@ def test_interval_endpoints_wrong_geometry_region_fails_loudly():
 
     with pytest.raises(KeyError, match="Unknown facet"):
         interval_endpoints_from_chart_ccw(q1_region, facet_name, chart, verts_ccw)
+
+
+def test_ccw_expected_interval_form_is_exact_for_regions_thinner_than_any_step(monkeypatch):
+    x, y = sp.symbols("x y", real=True)
+    height = sp.Rational(1, 5000)
+    verts = [(sp.Integer(0), sp.Integer(0)), (sp.Integer(1), sp.Integer(0)), (sp.Integer(0), height)]
+    region = Region2D(
+        x=x,
+        y=y,
+        facets=MappingProxyType(
+            {
+                "bottom": OrientedLine2D(x, y, y),
+                "left": OrientedLine2D(x, y, x),
+                "hyp": OrientedLine2D(x, y, 1 - x - y / height),
+            }
+        ),
+    )
+    u, t = sp.symbols("u__bottom t__bottom", real=True)
+    inward = FacetChart("bottom__t=x", u, t, t, u, sp.Integer(-1))
+    outward = FacetChart("bottom__t=x_out", u, t, t, -u, sp.Integer(1))
+
+    def _no_solve(*args, **kwargs):
+        raise AssertionError("affine charts must not go through sp.solve")
+
+    monkeypatch.setattr(sp, "solve", _no_solve)
+    exp_in = expected_interval_prefactor_from_chart_ccw(region, "bottom", inward, verts)
+    exp_out = expected_interval_prefactor_from_chart_ccw(region, "bottom", outward, verts)
+    monkeypatch.undo()
+
+    omega = Triangle2D.from_vertices(x, y, *verts).canonical_form()
+    # A 1/1000 step into the plane from the edge midpoint would already leave the region,
+    # yet the inward chart is still recognized as inward.
+    res = residue_2form_on_facet(omega, inward)
+    assert sp.simplify(exp_in - res.prefactor) == 0
+    assert sp.simplify(exp_in + exp_out) == 0
@@ -0,0 +1,93 @@
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.typing import Canonical2Form
+from posgeo.validation import (
+    GateContext,
+    has_pole_locus,
+    linear_factor_key,
+    normalize_linear_factor,
+    normalized_denominator_factors,
+)
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_known_factor_path_matches_general_factorization(geometry_case, monkeypatch):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    tri = geometry_case.tri_a(x, y)
+    known = tri.edge_forms()
+    prefactor = canonical_form_from_triangulation(tri).prefactor
+
+    general = normalized_denominator_factors(prefactor, x, y)
+
+    def _no_factor_list(*args, **kwargs):
+        raise AssertionError("denominator is fully explained by known lines")
+
+    monkeypatch.setattr(sp, "factor_list", _no_factor_list)
+    fast = normalized_denominator_factors(prefactor, x, y, known_factors=known)
+    monkeypatch.undo()
+
+    assert set(fast) == set(general)
+
+
+def test_known_factor_path_falls_back_for_leftover_cofactor():
+    x, y = sp.symbols("x y", real=True)
+    known = GEOMETRY_CASES[0].tri_a(x, y).edge_forms()
+
+    # Double facet pole, a diagonal-free spurious line and an irreducible quadric.
+    prefactor = (x + 3) / (x**2 * (1 - y) * (3 * x - 5 * y + 7) * (x**2 + y**2 + 1))
+    fast = normalized_denominator_factors(prefactor, x, y, known_factors=known)
+    general = normalized_denominator_factors(prefactor, x, y)
+    assert set(fast) == set(general)
+    assert (x, 2) in fast
+
+    assert has_pole_locus(prefactor, 5 * y - 3 * x - 7, x, y)
+    assert has_pole_locus(prefactor, 2 - 2 * y, x, y)
+    assert not has_pole_locus(prefactor, x + 3, x, y)
+    assert not has_pole_locus(prefactor, x - 1, x, y)
+
+
+def test_linear_factor_keys_are_interned_integer_triples(monkeypatch):
+    x, y = sp.symbols("x y", real=True)
+
+    def _no_symbolic_normalization(*args, **kwargs):
+        raise AssertionError("linear inputs must not go through factor/Poly")
+
+    monkeypatch.setattr(sp, "factor", _no_symbolic_normalization)
+    monkeypatch.setattr(sp, "Poly", _no_symbolic_normalization)
+    key = linear_factor_key(x + y - sp.Rational(1, 2), (x, y))
+    assert key == (2, 2, -1)
+    assert linear_factor_key(1 - 2 * x - 2 * y, (x, y)) is key
+    assert linear_factor_key(sp.Rational(-3, 7) * y + 5, (x, y)) == (0, 3, -35)
+    assert linear_factor_key(x * y + 1, (x, y)) is None
+    monkeypatch.undo()
+
+    # Display expressions are unchanged, including the Poly fallback for non-sum inputs.
+    assert normalize_linear_factor(sp.Rational(1, 2) - x - y, x, y) == 2 * x + 2 * y - 1
+    assert normalize_linear_factor(-3 * (x - 2), x, y) == x - 2
+    assert normalize_linear_factor(sp.Integer(0), x, y) == 0
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_gate_trial_divides_by_triangulation_diagonals(geometry_case, monkeypatch):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    tri = geometry_case.tri_a(x, y)
+    facets = {line.form.canonical() for line in region.facets.values()}
+    (diagonal, *_) = [form for form in tri.edge_forms() if form not in facets]
+    omega = canonical_form_from_triangulation(tri)
+    spurious = Canonical2Form(x, y, omega.prefactor / diagonal.as_expr(x, y))
+    gate = GateContext(region, geometry_case.facet_charts(x, y), known_lines=tri.edge_forms())
+
+    def _no_factor_list(*args, **kwargs):
+        raise AssertionError("denominator is fully explained by facets and diagonals")
+
+    monkeypatch.setattr(sp, "factor_list", _no_factor_list)
+    report = gate.check(spurious, fail_fast=True)
+    monkeypatch.undo()
+
+    assert report.failure_reasons == ("non-boundary-pole",)
+    assert normalize_linear_factor(diagonal.as_expr(x, y), x, y) in report.detected_pole_loci
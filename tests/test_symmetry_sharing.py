@@ -0,0 +1,74 @@
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.residues2d import (
+    chart_facet_line,
+    facet_residues_by_orbit,
+    residue_2form_on_facet,
+    symmetric_chart_sources,
+    transport_chart,
+)
+from posgeo.geometry.symmetry2d import affine_symmetries, facet_orbits
+from posgeo.typing import Canonical2Form
+from posgeo.validation import GateContext
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+EXPECTED_ORBITS = {
+    "m1_pentagon": (("L1_x", "L2_y"), ("L3_1mx", "L4_1my"), ("L5_xpy_mhalf",)),
+    "q1_quadrilateral": (("Q1_Lx", "Q1_D2mXpy"), ("Q1_By",), ("Q1_T1my",)),
+    "h1_hexagon": (("H1_x", "H2_y", "H3_2mx", "H4_2my", "H5_xpy_m1", "H6_3mxmy"),),
+}
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_affine_symmetries_and_facet_orbits(geometry_case):
+    region = geometry_case.build_region()
+    symmetries = affine_symmetries(region, geometry_case.vertices())
+
+    assert symmetries[0].is_identity
+    assert len(symmetries) == {"m1_pentagon": 2, "q1_quadrilateral": 2, "h1_hexagon": 12}[geometry_case.name]
+    assert facet_orbits(symmetries, list(region.facets)) == EXPECTED_ORBITS[geometry_case.name]
+
+    verts = set(geometry_case.vertices())
+    facet_name = next(iter(region.facets))
+    chart = geometry_case.facet_charts(region.x, region.y)[facet_name][0]
+    for g in symmetries:
+        assert {tuple(sp.Rational(v.numerator, v.denominator) for v in g.apply(*p)) for p in verts} == verts
+        image_line = region.facets[g.facet_image(facet_name)].form.canonical()
+        assert chart_facet_line(transport_chart(chart, g)) == image_line
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_facet_residues_by_orbit_match_direct_residues(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    form = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    symmetries = affine_symmetries(region, geometry_case.vertices())
+
+    shared = facet_residues_by_orbit(form, charts, symmetries)
+    for facet_name, facet_charts in charts.items():
+        for chart, residue in zip(facet_charts, shared[facet_name]):
+            assert residue.t == chart.t
+            assert sp.simplify(residue.prefactor - residue_2form_on_facet(form, chart).prefactor) == 0
+
+
+def test_gate_with_symmetries_matches_full_gate():
+    geometry_case = GEOMETRY_CASES[0]
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    charts = geometry_case.facet_charts(x, y)
+    symmetries = affine_symmetries(region, geometry_case.vertices())
+    assert len(symmetric_chart_sources(charts, symmetries)) == 5
+
+    omega = canonical_form_from_triangulation(geometry_case.tri_a(x, y))
+    # x*f is not swap-invariant, so every chart is checked directly.
+    for form in (omega, Canonical2Form(x, y, omega.prefactor * x)):
+        full = GateContext(region, charts).check(form)
+        shared = GateContext(region, charts, symmetries=symmetries).check(form)
+        assert shared.failure_reasons == full.failure_reasons
+        for a, b in zip(full.local_chart_order_checks, shared.local_chart_order_checks):
+            assert (a.facet_name, a.chart_name, a.failure_reasons) == (b.facet_name, b.chart_name, b.failure_reasons)
+            assert sp.simplify(a.first_order_limit - b.first_order_limit) == 0
+            assert sp.simplify(a.second_order_limit - b.second_order_limit) == 0
@@ -0,0 +1,54 @@
+import pytest
+import sympy as sp
+
+from posgeo.forms.canonical2d import canonical_form_from_triangulation
+from posgeo.forms.triangulations2d import (
+    balanced_triangulation,
+    candidate_triangulations,
+    canonical_form_from_vertices,
+    fan_triangulation,
+    select_triangulation,
+    triangulation_cost,
+    zigzag_triangulation,
+)
+from tests.helpers.geometry_cases import GEOMETRY_CASES
+
+
+def _twice_area(points):
+    n = len(points)
+    return sum(points[i][0] * points[(i + 1) % n][1] - points[(i + 1) % n][0] * points[i][1] for i in range(n))
+
+
+@pytest.mark.parametrize("n", range(3, 10))
+def test_candidate_triangulations_tile_the_polygon(n):
+    # Lattice points on a parabola are in convex position.
+    verts = [(k, k * k) for k in range(n)]
+    for name, triangles in candidate_triangulations(n):
+        assert len(triangles) == n - 2, name
+        assert all(_twice_area([verts[i] for i in tri]) > 0 for tri in triangles), name
+        assert sum(_twice_area([verts[i] for i in tri]) for tri in triangles) == _twice_area(verts), name
+
+
+def test_generators_match_fixture_fans_and_strips():
+    assert fan_triangulation(5, 1) == ((1, 2, 3), (1, 3, 4), (1, 4, 0))
+    assert zigzag_triangulation(6) == ((0, 1, 5), (1, 4, 5), (1, 2, 4), (2, 3, 4))
+    assert sorted(balanced_triangulation(7)) == [(0, 1, 3), (0, 3, 6), (1, 2, 3), (3, 4, 6), (4, 5, 6)]
+
+
+def test_selection_prefers_cheaper_diagonals():
+    geometry_case = GEOMETRY_CASES[1]
+    verts = geometry_case.vertices()
+    # Q1: diagonal (v0, v2) is y = x/3, diagonal (v1, v3) is x + 2y = 2.
+    choice = select_triangulation(verts)
+    assert choice.cost == triangulation_cost(verts, ((0, 1, 2), (0, 2, 3)))
+    assert choice.cost < triangulation_cost(verts, ((0, 1, 3), (1, 2, 3)))
+
+
+@pytest.mark.parametrize("geometry_case", GEOMETRY_CASES, ids=lambda c: c.name)
+def test_canonical_form_from_vertices_matches_fixture_triangulation(geometry_case):
+    region = geometry_case.build_region()
+    x, y = region.x, region.y
+    reference = canonical_form_from_triangulation(geometry_case.tri_a(x, y)).prefactor
+
+    selected = canonical_form_from_vertices(geometry_case.vertices(), x, y, region=region).prefactor
+    assert sp.simplify(selected - reference) == 0